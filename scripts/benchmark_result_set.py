@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the construction of ``SupersetResultSet`` from DBAPI rows.
+
+Compares the current columnar construction against the legacy approach of
+building a NumPy structured array of ``object`` columns first, reporting the
+wall time and the peak memory allocated by each.
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pyarrow as pa
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import SupersetResultSet
+
+
+def generate_rows(num_rows: int) -> list[tuple[Any, ...]]:
+    start = datetime(2024, 1, 1)
+    return [
+        (
+            i,
+            float(i) / 3,
+            f"name_{i % 1000}",
+            start + timedelta(seconds=i),
+            i % 2 == 0,
+            None if i % 10 else "sparse",
+        )
+        for i in range(num_rows)
+    ]
+
+
+DESCRIPTION = [
+    ("id", "int"),
+    ("value", "float"),
+    ("name", "varchar"),
+    ("ts", "timestamp"),
+    ("flag", "bool"),
+    ("sparse", "varchar"),
+]
+
+
+def legacy_table(data: list[tuple[Any, ...]]) -> pa.Table:
+    """
+    The pre-columnar construction: a structured array of objects, converted to
+    lists column by column.
+    """
+    names = [col[0] for col in DESCRIPTION]
+    array = np.array(data, dtype=[(name, "object") for name in names])
+    return pa.Table.from_arrays(
+        [pa.array(array[name].tolist()) for name in names],
+        names=names,
+    )
+
+
+def columnar_table(data: list[tuple[Any, ...]]) -> pa.Table:
+    return SupersetResultSet(data, DESCRIPTION, BaseEngineSpec).pa_table  # type: ignore
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, int]:
+    """
+    Return the wall time and the peak traced memory of a call.
+
+    The two are measured in separate runs, since tracing allocations slows down
+    the code being timed.
+    """
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows to generate.")
+def main(rows: int) -> None:
+    print(f"Generating {rows} rows")
+    data = generate_rows(rows)
+
+    print("\nResults:\n")
+    for label, func in [("legacy", legacy_table), ("columnar", columnar_table)]:
+        duration, peak = measure(lambda func=func: func(data))  # type: ignore
+        print(f"{label}: {duration:.2f} s, peak {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
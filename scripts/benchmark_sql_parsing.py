@@ -0,0 +1,80 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the parse cache of ``SQLScript``.
+
+Parses the SQL of a large virtual dataset a few times, as happens when a single
+chart query is processed, with and without the parse cache.
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+
+from superset.sql.parse import parse_cache, SQLScript
+
+
+def generate_sql(num_columns: int) -> str:
+    columns = ",\n".join(
+        f"CASE WHEN t{i % 5}.c{i} > {i} THEN 'a{i}' ELSE t{i % 5}.d{i} END AS col_{i}"
+        for i in range(num_columns)
+    )
+    joins = "\n".join(
+        f"LEFT JOIN schema.table_{i} t{i} ON t0.id = t{i}.id" for i in range(1, 5)
+    )
+    return (
+        "WITH base AS (SELECT * FROM schema.table_0 WHERE x > 1)\n"  # noqa: S608
+        f"SELECT {columns}\nFROM base t0\n{joins}\n"
+        "WHERE t0.a IN (1, 2, 3)\nGROUP BY 1\nORDER BY 2\nLIMIT 100"
+    )
+
+
+def measure(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--columns", default=300, help="Number of columns in the query.")
+@click.option("--parses", default=5, help="Number of times the SQL is parsed.")
+@click.option("--engine", default="postgresql", help="DB engine spec engine.")
+def main(columns: int, parses: int, engine: str) -> None:
+    sql = generate_sql(columns)
+    print(f"Parsing {len(sql)} characters of SQL {parses} times\n")
+
+    def parse() -> None:
+        for _ in range(parses):
+            SQLScript(sql, engine)
+
+    maxsize = parse_cache.maxsize
+    parse_cache.cache_clear()
+    try:
+        parse_cache.maxsize = 0
+        print(f"uncached: {measure(parse):.3f} s")
+        parse_cache.maxsize = maxsize
+        print(f"cached: {measure(parse):.3f} s")
+    finally:
+        parse_cache.maxsize = maxsize
+
+    print(f"\n{parse_cache.cache_info()}")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -18,6 +18,7 @@
  */
 import fetchMock from 'fetch-mock';
 import WS from 'jest-websocket-mock';
+import { waitFor } from 'spec/helpers/testing-library';
 import { parseErrorJson, isFeatureEnabled } from '@superset-ui/core';
 import * as asyncEvent from 'src/middleware/asyncEvent';
 
@@ -172,6 +173,75 @@ describe('asyncEvent middleware', () => {
     });
   });
 
+  describe('long_polling transport', () => {
+    const config = {
+      GLOBAL_ASYNC_QUERIES_TRANSPORT: 'long_polling',
+      GLOBAL_ASYNC_QUERIES_POLLING_DELAY: 50,
+      GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT: 5,
+      GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL: '',
+    };
+    let setTimeoutSpy: jest.SpyInstance;
+
+    // delays of the events requests, ignoring other timeouts
+    const pollingDelays = () =>
+      setTimeoutSpy.mock.calls
+        .filter(([callback]) => callback.name === 'loadEventsFromApi')
+        .map(([, delay]) => delay);
+
+    beforeEach(async () => {
+      fetchMock.get(EVENTS_ENDPOINT, {
+        status: 200,
+        body: { result: [asyncDoneEvent] },
+      });
+      fetchMock.get(CACHED_DATA_ENDPOINT, {
+        status: 200,
+        body: { result: chartData },
+      });
+      setTimeoutSpy = jest.spyOn(window, 'setTimeout');
+      asyncEvent.init(config);
+    });
+
+    afterEach(() => {
+      setTimeoutSpy.mockRestore();
+    });
+
+    it('sends the timeout with the events request', async () => {
+      const actualResolved =
+        await asyncEvent.waitForAsyncData(asyncPendingEvent);
+      expect(actualResolved).toEqual([chartData]);
+
+      const [[url]] = fetchMock.calls(EVENTS_ENDPOINT);
+      expect(new URL(url).searchParams.get('timeout')).toEqual('5');
+      expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(1);
+    });
+
+    it('reissues the request right away after receiving events', async () => {
+      // without listeners, the first request waits for the polling delay
+      expect(pollingDelays()).toEqual([50]);
+
+      await asyncEvent.waitForAsyncData(asyncPendingEvent);
+
+      await waitFor(() => expect(pollingDelays().slice(0, 2)).toEqual([50, 0]));
+    });
+
+    it('waits for the polling delay when no events are received', async () => {
+      fetchMock.reset();
+      fetchMock.get(EVENTS_ENDPOINT, {
+        status: 200,
+        body: { result: [] },
+      });
+      setTimeoutSpy.mockClear();
+
+      asyncEvent.waitForAsyncData(asyncPendingEvent);
+
+      await waitFor(() =>
+        expect(fetchMock.calls(EVENTS_ENDPOINT)).toHaveLength(1),
+      );
+      await waitFor(() => expect(pollingDelays()).toContain(50));
+      expect(pollingDelays()).not.toContain(0);
+    });
+  });
+
   describe('ws transport', () => {
     let wsServer: WS;
     const config = {
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import math
 
 from flask import request, Response
 from flask_appbuilder import expose
@@ -54,6 +55,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Seconds to wait for new events when there are none, capped by the
+              server's long polling timeout
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -83,6 +91,8 @@ class AsyncEventsRestApi(BaseSupersetApi):
                                     type: object
                                 result_url:
                                   type: string
+            400:
+              $ref: '#/components/responses/400'
             401:
               $ref: '#/components/responses/401'
             500:
@@ -93,7 +103,15 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = request.args.get("timeout", 0, type=float)
+            if not math.isfinite(timeout):
+                return self.response_400(message="Invalid timeout")
+            timeout = max(timeout, 0)
+            events = async_query_manager.read_events(
+                async_channel_id,
+                last_event_id,
+                timeout=timeout,
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
 from typing import Any, Literal, Optional
 
@@ -112,6 +113,8 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_polling_timeout: float = 0
+        self._long_polling_slots: Optional[threading.BoundedSemaphore] = None
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
@@ -147,6 +150,13 @@ class AsyncQueryManager:
         ]
         self._jwt_cookie_domain = app.config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = app.config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        self._long_polling_timeout = app.config[
+            "GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"
+        ]
+        if max_connections := app.config[
+            "GLOBAL_ASYNC_QUERIES_LONG_POLLING_MAX_CONNECTIONS"
+        ]:
+            self._long_polling_slots = threading.BoundedSemaphore(max_connections)
 
         if app.config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -258,14 +268,52 @@ class AsyncQueryManager:
         return job_metadata
 
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self,
+        channel: str,
+        last_id: Optional[str],
+        timeout: float = 0,
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel after a given event.
+
+        When there are no events and a timeout is given, the request is held with
+        ``XREAD BLOCK`` until new events arrive or the timeout (capped by
+        ``GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT``) expires. The number of
+        blocked requests per process is limited, and requests beyond the limit
+        return immediately.
+
+        :param channel: The channel ID
+        :param last_id: The ID of the last event received by the client
+        :param timeout: How many seconds to wait for new events
+        :returns: The events
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        timeout = min(timeout, self._long_polling_timeout)
+        if results or timeout <= 0:
+            return self._parse_events(results)
+
+        slots = self._long_polling_slots
+        if slots is None or not slots.acquire(blocking=False):
+            return []
+        try:
+            # XREAD returns the entries after the ID, so no events added since the
+            # XRANGE above are missed
+            streams = self._cache.xread(
+                {stream_name: last_id or "0-0"},
+                self.MAX_EVENT_COUNT,
+                int(timeout * 1000),
+            )
+        finally:
+            slots.release()
+
+        return self._parse_events(streams[0][1] if streams else [])
+
+    def _parse_events(self, results: list[Any]) -> list[Optional[dict[str, Any]]]:
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -20,7 +20,14 @@ import contextlib
 import logging
 from typing import Any, TYPE_CHECKING
 
-from flask import current_app as app, g, make_response, request, Response
+from flask import (
+    current_app as app,
+    g,
+    make_response,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -372,6 +379,9 @@ class ChartDataRestApi(ChartRestApi):
                 # return single query results
                 data = result["queries"][0]["data"]
                 if is_csv_format:
+                    if not isinstance(data, str):
+                        # the CSV is streamed in chunks, see `CSV_STREAMING_CHUNK_SIZE`
+                        data = stream_with_context(data)
                     return CsvResponse(data, headers=generate_download_headers("csv"))
 
                 return XlsxResponse(data, headers=generate_download_headers("xlsx"))
@@ -379,6 +389,8 @@ class ChartDataRestApi(ChartRestApi):
             # return multi-query results bundled as a zip file
             def _process_data(query_data: Any) -> Any:
                 if result_format == ChartDataResultFormat.CSV:
+                    if not isinstance(query_data, str):
+                        return b"".join(query_data)
                     encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
                     return query_data.encode(encoding)
                 return query_data
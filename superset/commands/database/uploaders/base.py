@@ -16,6 +16,7 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
@@ -83,6 +84,18 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into chunks of DataFrames
+
+        Readers that can parse a file incrementally should override this, so that
+        the whole file isn't held in memory during the upload.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -91,20 +104,20 @@ class BaseDataReader:
         schema_name: Optional[str],
     ) -> None:
         self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+            self.file_to_dataframes(file), database, table_name, schema_name
         )
 
     def _dataframe_to_database(
         self,
-        df: pd.DataFrame,
+        dfs: Iterable[pd.DataFrame],
         database: Database,
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
         """
-        Upload DataFrame to database
+        Upload DataFrames to database
 
-        :param df:
+        :param dfs: the chunks of the DataFrame
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
@@ -118,12 +131,14 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
+            database.db_engine_spec.df_chunks_to_sql(
                 database,
                 data_table,
-                df,
+                dfs,
                 to_sql_kwargs=to_sql_kwargs,
             )
+        except DatabaseUploadFailed:
+            raise
         except ValueError as ex:
             raise DatabaseUploadFailed(
                 message=_(
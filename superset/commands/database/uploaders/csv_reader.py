@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Optional
 
 import pandas as pd
@@ -30,7 +32,7 @@ from superset.commands.database.uploaders.base import (
 
 logger = logging.getLogger(__name__)
 
-READ_CSV_CHUNK_SIZE = 1000
+READ_CSV_CHUNK_SIZE = 10000
 ROWS_TO_READ_METADATA = 2
 
 
@@ -62,18 +64,29 @@ class CSVReader(BaseDataReader):
 
     @staticmethod
     def _read_csv(file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
-        try:
-            if "chunksize" in kwargs:
-                return pd.concat(
-                    pd.read_csv(
-                        filepath_or_buffer=file.stream,
-                        **kwargs,
-                    )
-                )
+        if "chunksize" in kwargs:
+            return pd.concat(CSVReader._read_csv_chunks(file, kwargs))
+        with CSVReader._handle_read_errors():
             return pd.read_csv(
                 filepath_or_buffer=file.stream,
                 **kwargs,
             )
+
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage, kwargs: dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        with CSVReader._handle_read_errors():
+            yield from pd.read_csv(
+                filepath_or_buffer=file.stream,
+                **kwargs,
+            )
+
+    @staticmethod
+    @contextmanager
+    def _handle_read_errors() -> Iterator[None]:
+        try:
+            yield
         except (
             pd.errors.ParserError,
             pd.errors.EmptyDataError,
@@ -93,7 +106,51 @@ class CSVReader(BaseDataReader):
         :return: pandas DataFrame
         :throws DatabaseUploadFailed: if there is an error reading the file
         """
-        kwargs = {
+        return self._read_csv(file, self._get_read_kwargs())
+
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into chunks of DataFrames
+
+        The types inferred by pandas can differ between chunks, eg, a column with
+        integers in the first chunk and strings in the second one. Since the table
+        is created from the first chunk, the file is read twice: first to find the
+        types that fit all the chunks, and then to read the chunks with those types.
+        This doubles the time spent parsing the file, which is the trade-off for
+        holding a single chunk in memory instead of the whole file; the types can't
+        be inferred while the chunks are inserted, since by then the table exists.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._get_read_kwargs()
+        position = file.stream.tell()
+        dtype = self._get_chunks_dtype(file, kwargs)
+        file.stream.seek(position)
+        return self._read_csv_chunks(file, {**kwargs, "dtype": dtype or None})
+
+    def _get_chunks_dtype(
+        self, file: FileStorage, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Return the types of the columns whose inferred type differs between chunks.
+
+        The types are widened the same way `pd.concat` does, and the types set by
+        the user take precedence.
+        """
+        empty_chunks = [chunk.head(0) for chunk in self._read_csv_chunks(file, kwargs)]
+        widened = pd.concat(empty_chunks).dtypes
+        date_columns = set(kwargs["parse_dates"] or [])
+        dtype = {
+            column: column_dtype
+            for column, column_dtype in widened.items()
+            if column not in date_columns
+            and any(chunk.dtypes[column] != column_dtype for chunk in empty_chunks)
+        }
+        return {**dtype, **(kwargs["dtype"] or {})}
+
+    def _get_read_kwargs(self) -> dict[str, Any]:
+        return {
             "chunksize": READ_CSV_CHUNK_SIZE,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
@@ -118,7 +175,6 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
@@ -0,0 +1,78 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import time
+
+from superset import db
+from superset.commands.base import BaseCommand
+from superset.daos.key_value import KeyValueDAO
+from superset.key_value.types import KeyValueResource
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=consider-using-transaction
+class KeyValuePruneCommand(BaseCommand):
+    """
+    Delete the expired entries of the key-value store in batches.
+
+    Each batch is committed on its own, so that a large backlog of expired entries
+    doesn't hold a long-running transaction on the `key_value` table.
+    """
+
+    def __init__(
+        self,
+        resources: list[KeyValueResource] | None = None,
+        batch_size: int = 1000,
+    ):
+        """
+        :param resources: The resources to prune, all of them by default
+        :param batch_size: The number of entries deleted in each statement
+        """
+        self.resources = resources or list(KeyValueResource)
+        self.batch_size = batch_size
+
+    def run(self) -> int:
+        """
+        Executes the prune command
+
+        :returns: The number of deleted entries
+        """
+        self.validate()
+        total_deleted = 0
+        start_time = time.time()
+
+        for resource in self.resources:
+            while True:
+                deleted = KeyValueDAO.delete_expired_entries(
+                    resource,
+                    limit=self.batch_size,
+                )
+                db.session.commit()
+                total_deleted += deleted
+                if deleted < self.batch_size:
+                    break
+
+        logger.info(
+            "Deleted %s expired key-value entries in %.2f seconds",
+            f"{total_deleted:,}",
+            time.time() - start_time,
+        )
+        return total_deleted
+
+    def validate(self) -> None:
+        pass
@@ -22,6 +22,7 @@ from uuid import UUID
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app
+from flask_appbuilder.security.sqla.models import User
 
 from superset import db, security_manager
 from superset.commands.base import BaseCommand
@@ -73,8 +74,18 @@ from superset.reports.notifications.exceptions import (
 )
 from superset.tasks.utils import get_executor
 from superset.utils import json
-from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.concurrency import map_concurrently
+from superset.utils.core import (
+    create_zip,
+    HeaderDataType,
+    override_user,
+    recipients_string_to_list,
+)
+from superset.utils.csv import (
+    chart_data_to_dataframe,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.decorators import logs_context, transaction
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
@@ -353,11 +364,24 @@ class BaseReportState:
                 )
                 for url in urls
             ]
+        # the sync Playwright API can't be shared between threads
+        workers = (
+            1
+            if feature_flag_manager.is_feature_enabled(
+                "PLAYWRIGHT_REPORTS_AND_THUMBNAILS"
+            )
+            else app.config["ALERT_REPORTS_SCREENSHOT_WORKERS"]
+        )
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            imges = [
+                imge
+                for imge in map_concurrently(
+                    lambda screenshot: screenshot.get_screenshot(user=user),
+                    screenshots,
+                    workers,
+                )
+                if imge
+            ]
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
@@ -379,22 +403,96 @@ class BaseReportState:
 
         return pdf
 
+    def _get_chart_data(
+        self,
+        user: User,
+        result_format: ChartDataResultFormat,
+    ) -> dict[str, Any]:
+        """
+        Run the chart query context in the worker, as the executor user.
+
+        This returns the same results as the chart data API with the
+        `post_processed` result type, without going through the web tier.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.charts.client_processing import apply_client_processing
+        from superset.charts.schemas import ChartDataQueryContextSchema
+        from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+        chart = self._report_schedule.chart
+        json_body = json.loads(chart.query_context)
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.JSONDecodeError):
+            form_data = {}
+
+        with override_user(user):
+            if result_format in ChartDataResultFormat.table_like() and (
+                not security_manager.can_access("can_csv", "Superset")
+            ):
+                raise ReportScheduleCsvFailedError(
+                    f"User {user.username} is not allowed to export CSV data"
+                )
+
+            query_context = ChartDataQueryContextSchema().load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            result = command.run()
+            return apply_client_processing(result, form_data, query_context.datasource)
+
+    def _get_chart_csv_data(self, user: User) -> Optional[bytes]:
+        result = self._get_chart_data(user, ChartDataResultFormat.CSV)
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+
+        queries = result["queries"]
+        if not queries:
+            return None
+        if len(queries) == 1:
+            return queries[0]["data"].encode(encoding)
+
+        # multi-query results are bundled as a zip file, like in the API
+        files = {
+            f"query_{idx + 1}.csv": query["data"].encode(encoding)
+            for idx, query in enumerate(queries)
+        }
+        return create_zip(files).getvalue()
+
+    def _get_chart_dataframe(self, user: User) -> Optional[pd.DataFrame]:
+        result = self._get_chart_data(user, ChartDataResultFormat.JSON)
+        if not result["queries"]:
+            return None
+        return chart_data_to_dataframe(result["queries"][0])
+
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                logger.info(
+                    "Getting chart %s data as user %s",
+                    self._report_schedule.chart_id,
+                    user.username,
+                )
+                csv_data = self._get_chart_csv_data(user)
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.CSV)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -409,22 +507,31 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                logger.info(
+                    "Getting chart %s data as user %s",
+                    self._report_schedule.chart_id,
+                    user.username,
+                )
+                dataframe = self._get_chart_dataframe(user)
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.JSON)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                dataframe = get_chart_dataframe(url, auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
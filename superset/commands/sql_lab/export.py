@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any, cast, TypedDict
 
 import pandas as pd
@@ -42,9 +43,15 @@ class SqlExportResult(TypedDict):
     data: list[Any]
 
 
+class SqlExportStreamResult(TypedDict):
+    query: Query
+    data: Iterator[bytes]
+
+
 class SqlResultExportCommand(BaseCommand):
     _client_id: str
     _query: Query
+    count: int = 0
 
     def __init__(
         self,
@@ -85,45 +92,10 @@ class SqlResultExportCommand(BaseCommand):
         self,
     ) -> SqlExportResult:
         self.validate()
-        blob = None
-        if results_backend and self._query.results_key:
-            logger.info(
-                "Fetching CSV from results backend [%s]", self._query.results_key
-            )
-            blob = results_backend.get(self._query.results_key)
-        if blob:
-            logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
-            obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
-            )
-
-            df = pd.DataFrame(
-                data=obj["data"],
-                dtype=object,
-                columns=[c["name"] for c in obj["columns"]],
-            )
-
-            logger.info("Using pandas to convert to CSV")
-        else:
+        df = self._get_results_backend_df()
+        if df is None:
             logger.info("Running a query to turn into CSV")
-            if self._query.select_sql:
-                sql = self._query.select_sql
-                limit = None
-            else:
-                sql = self._query.executed_sql
-                script = SQLScript(sql, self._query.database.db_engine_spec.engine)
-                # when a query has multiple statements only the last one returns data
-                limit = script.statements[-1].get_limit_value()
-            if limit is not None and self._query.limiting_factor in {
-                LimitingFactor.QUERY,
-                LimitingFactor.DROPDOWN,
-                LimitingFactor.QUERY_AND_DROPDOWN,
-            }:
-                # remove extra row from `increased_limit`
-                limit -= 1
+            sql, limit = self._get_sql_and_limit()
             df = self._query.database.get_df(
                 sql,
                 self._query.catalog,
@@ -139,3 +111,84 @@ class SqlResultExportCommand(BaseCommand):
             "count": len(df.index),
             "data": csv_data,
         }
+
+    def stream(self, chunk_size: int) -> SqlExportStreamResult:
+        """
+        Export the results as CSV chunks of at most `chunk_size` rows.
+
+        Results that are not in the results backend are fetched from the database in
+        chunks. The number of rows is only known once the iterator is exhausted.
+        """
+        self.validate()
+        self.count = 0
+        return {
+            "query": self._query,
+            "data": csv.dfs_to_escaped_csv_stream(
+                self._iter_dfs(chunk_size),
+                index=False,
+                **app.config["CSV_EXPORT"],
+            ),
+        }
+
+    def _iter_dfs(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        df = self._get_results_backend_df()
+        if df is not None:
+            chunks: Iterable[pd.DataFrame] = (
+                df.iloc[start : start + chunk_size]
+                for start in range(0, max(len(df.index), 1), chunk_size)
+            )
+        else:
+            logger.info("Streaming a query to turn into CSV")
+            sql, limit = self._get_sql_and_limit()
+            chunks = self._query.database.iter_df(
+                sql,
+                self._query.catalog,
+                self._query.schema,
+                chunk_size=chunk_size,
+                limit=limit,
+            )
+
+        for chunk in chunks:
+            self.count += len(chunk.index)
+            yield chunk
+
+    def _get_results_backend_df(self) -> pd.DataFrame | None:
+        blob = None
+        if results_backend and self._query.results_key:
+            logger.info(
+                "Fetching CSV from results backend [%s]", self._query.results_key
+            )
+            blob = results_backend.get(self._query.results_key)
+        if not blob:
+            return None
+
+        logger.info("Decompressing")
+        payload = utils.zlib_decompress(blob, decode=not results_backend_use_msgpack)
+        obj = _deserialize_results_payload(
+            payload, self._query, cast(bool, results_backend_use_msgpack)
+        )
+
+        logger.info("Using pandas to convert to CSV")
+        return pd.DataFrame(
+            data=obj["data"],
+            dtype=object,
+            columns=[c["name"] for c in obj["columns"]],
+        )
+
+    def _get_sql_and_limit(self) -> tuple[str, int | None]:
+        if self._query.select_sql:
+            sql = self._query.select_sql
+            limit = None
+        else:
+            sql = self._query.executed_sql
+            script = SQLScript(sql, self._query.database.db_engine_spec.engine)
+            # when a query has multiple statements only the last one returns data
+            limit = script.statements[-1].get_limit_value()
+        if limit is not None and self._query.limiting_factor in {
+            LimitingFactor.QUERY,
+            LimitingFactor.DROPDOWN,
+            LimitingFactor.QUERY_AND_DROPDOWN,
+        }:
+            # remove extra row from `increased_limit`
+            limit -= 1
+        return sql, limit
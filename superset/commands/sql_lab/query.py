@@ -15,19 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-import time
 from datetime import datetime, timedelta
 
-import sqlalchemy as sa
-
-from superset import db
 from superset.commands.base import BaseCommand
 from superset.models.sql_lab import Query
+from superset.utils.prune import PruneResult, TablePruner
 
 logger = logging.getLogger(__name__)
 
 
-# pylint: disable=consider-using-transaction
 class QueryPruneCommand(BaseCommand):
     """
     Command to prune the query table by deleting rows older than the specified retention period.
@@ -41,71 +37,35 @@ class QueryPruneCommand(BaseCommand):
                                      Records older than this period will be deleted.
     """  # noqa: E501
 
-    def __init__(self, retention_period_days: int):
+    def __init__(
+        self,
+        retention_period_days: int,
+        batch_size: int | None = None,
+        time_budget: float | None = None,
+    ):
         """
         :param retention_period_days: Number of days to keep in the query table
+        :param batch_size: Number of rows deleted per batch, `PRUNE_BATCH_SIZE` by
+            default
+        :param time_budget: Maximum duration in seconds, `PRUNE_TIME_BUDGET` by
+            default
         """
         self.retention_period_days = retention_period_days
+        self.batch_size = batch_size
+        self.time_budget = time_budget
 
-    def run(self) -> None:
+    def run(self) -> PruneResult:
         """
         Executes the prune command
         """
-        batch_size = 999  # SQLite has a IN clause limit of 999
-        total_deleted = 0
-        start_time = time.time()
-
-        # Select all IDs that need to be deleted
-        ids_to_delete = (
-            db.session.execute(
-                sa.select(Query.id).where(
-                    Query.changed_on
-                    < datetime.now() - timedelta(days=self.retention_period_days)
-                )
-            )
-            .scalars()
-            .all()
-        )
-
-        total_rows = len(ids_to_delete)
-
-        logger.info("Total rows to be deleted: %s", f"{total_rows:,}")
-
-        next_logging_threshold = 1
-
-        # Iterate over the IDs in batches
-        for i in range(0, total_rows, batch_size):
-            batch_ids = ids_to_delete[i : i + batch_size]
-
-            # Delete the selected batch using IN clause
-            result = db.session.execute(sa.delete(Query).where(Query.id.in_(batch_ids)))
-
-            # Update the total number of deleted records
-            total_deleted += result.rowcount
-
-            # Explicitly commit the transaction given that if an error occurs, we want to ensure that the  # noqa: E501
-            # records that have been deleted so far are committed
-            db.session.commit()
-
-            # Log the number of deleted records every 1% increase in progress
-            percentage_complete = (total_deleted / total_rows) * 100
-            if percentage_complete >= next_logging_threshold:
-                logger.info(
-                    "Deleted %s rows from the query table older than %s days (%d%% complete)",  # noqa: E501
-                    f"{total_deleted:,}",
-                    self.retention_period_days,
-                    percentage_complete,
-                )
-                next_logging_threshold += 1
-
-        elapsed_time = time.time() - start_time
-        minutes, seconds = divmod(elapsed_time, 60)
-        formatted_time = f"{int(minutes):02}:{int(seconds):02}"
-        logger.info(
-            "Pruning complete: %s rows deleted in %s",
-            f"{total_deleted:,}",
-            formatted_time,
-        )
+        cutoff = datetime.now() - timedelta(days=self.retention_period_days)
+        return TablePruner(
+            "prune_query",
+            Query,
+            Query.changed_on < cutoff,
+            batch_size=self.batch_size,
+            time_budget=self.time_budget,
+        ).run()
 
     def validate(self) -> None:
         pass
@@ -38,6 +38,7 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
     _blob: Any
     _query: Query
 
@@ -45,9 +46,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
 
     def validate(self) -> None:
         if not results_backend:
@@ -104,8 +107,13 @@ class SqlExecutionResultsCommand(BaseCommand):
             self._blob, decode=not results_backend_use_msgpack
         )
         try:
+            # only the requested page is deserialized, see `RESULTS_BACKEND_BATCH_ROWS`
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=self._rows,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
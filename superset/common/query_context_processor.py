@@ -19,7 +19,8 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
@@ -28,9 +29,10 @@ from flask import current_app
 from flask_babel import gettext as _
 from pandas import DateOffset
 
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
+from superset.common.query_object import get_impersonation_cache_key
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.common.utils.time_range_utils import (
@@ -52,6 +54,11 @@ from superset.models.sql_lab import Query
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import (
+    concurrency_limit,
+    map_concurrently,
+    merge_into_session,
+)
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -70,6 +77,9 @@ from superset.utils.core import (
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.decorators import stats_timing
+from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.json import json_int_dttm_ser
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -108,6 +118,14 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class TimeOffsetQuery(TypedDict):
+    offset: str
+    original_offset: str
+    cache_key: str | None
+    query_object: QueryObject
+    query_dict: dict[str, Any]
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -137,6 +155,10 @@ class QueryContextProcessor:
             force_query=force_query,
             force_cached=force_cached,
         )
+        if cache_key and not force_query:
+            current_app.config["STATS_LOGGER"].incr(
+                "chart_data.cache.hit" if cache.is_loaded else "chart_data.cache.miss"
+            )
 
         if query_obj and cache_key and not cache.is_loaded:
             try:
@@ -259,6 +281,90 @@ class QueryContextProcessor:
         )
         return cache_key
 
+    def query_datasource(self, query_dict: dict[str, Any]) -> QueryResult:
+        """
+        Run a query against the datasource.
+
+        When queries are executed concurrently (`CHART_DATA_QUERY_WORKERS` greater
+        than 1) at most `CHART_DATA_QUERY_WORKERS_PER_DATABASE` of them run against
+        the same database at once.
+        """
+        datasource = self._qc_datasource
+        raw_cache_key = self.raw_query_cache_key(query_dict)
+        if raw_cache_key:
+            cache = QueryCacheManager.get(
+                key=raw_cache_key,
+                region=CacheRegion.DATA,
+                force_query=self._query_context.force,
+            )
+            stats_logger = current_app.config["STATS_LOGGER"]
+            if cache.is_loaded:
+                stats_logger.incr("chart_data.raw_cache.hit")
+                return QueryResult(
+                    df=cache.df,
+                    query=cache.query,
+                    duration=timedelta(0),
+                    applied_template_filters=cache.applied_template_filters,
+                    applied_filter_columns=cache.applied_filter_columns,
+                    rejected_filter_columns=cache.rejected_filter_columns,
+                )
+            stats_logger.incr("chart_data.raw_cache.miss")
+
+        limit = (
+            current_app.config["CHART_DATA_QUERY_WORKERS_PER_DATABASE"]
+            if current_app.config["CHART_DATA_QUERY_WORKERS"] > 1
+            else 0
+        )
+        database_id = getattr(datasource, "database_id", None)
+        with concurrency_limit(("database", database_id), limit):
+            if isinstance(datasource, Query):
+                result = datasource.exc_query(query_dict)
+            else:
+                result = datasource.query(query_dict)
+
+        if raw_cache_key and result.status != QueryStatus.FAILED:
+            QueryCacheManager.set(
+                key=raw_cache_key,
+                value={
+                    "df": result.df,
+                    "query": result.query,
+                    "applied_template_filters": result.applied_template_filters,
+                    "applied_filter_columns": result.applied_filter_columns,
+                    "rejected_filter_columns": result.rejected_filter_columns,
+                },
+                timeout=self.get_cache_timeout(),
+                datasource_uid=datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        return result
+
+    def raw_query_cache_key(self, query_dict: dict[str, Any]) -> str | None:
+        """
+        Return the key of the raw results of a query, before any post-processing.
+
+        The key is made out of the compiled SQL, so that query objects that only
+        differ in their post-processing, time offsets or result type share the raw
+        results. Returns None if `CHART_DATA_RAW_CACHE` is disabled.
+        """
+        datasource = self._qc_datasource
+        if not current_app.config["CHART_DATA_RAW_CACHE"] or isinstance(
+            datasource, Query
+        ):
+            return None
+
+        return md5_sha_from_dict(
+            {
+                "datasource": datasource.uid,
+                "sql": datasource.get_query_str(query_dict),
+                "extra_cache_keys": datasource.get_extra_cache_keys(query_dict),
+                "rls": security_manager.get_rls_cache_key(datasource),
+                "impersonation_key": get_impersonation_cache_key(datasource),
+                "changed_on": datasource.changed_on,
+            },
+            default=json_int_dttm_ser,
+            ignore_nan=True,
+        )
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
         query_context = self._query_context
@@ -267,11 +373,9 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        # todo(hugh): add logic to manage all sip68 models here
+        result = self.query_datasource(query_object.to_dict())
+        if not isinstance(query_context.datasource, Query):
             query = result.query + ";\n\n"
 
         df = result.df
@@ -462,6 +566,10 @@ class QueryContextProcessor:
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # the results of every offset, in order: offset, df, query and cache key
+        offset_results: list[tuple[str, pd.DataFrame, str, str | None] | None] = []
+        missing_offsets: dict[int, TimeOffsetQuery] = {}
+        stats_logger = current_app.config["STATS_LOGGER"]
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -580,17 +688,10 @@ class QueryContextProcessor:
             )
             # whether hit on the cache
             if cache.is_loaded:
-                offset_dfs[offset] = cache.df
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
+                offset_results.append((offset, cache.df, cache.query, cache_key))
                 continue
 
             query_object_clone_dct = query_object_clone.to_dict()
-            # rename metrics: SUM(value) => SUM(value) 1 year ago
-            metrics_mapping = {
-                metric: TIME_COMPARISON.join([metric, original_offset])
-                for metric in metric_names
-            }
 
             # When the original query has limit or offset we wont apply those
             # to the subquery so we prevent data inconsistency due to missing records
@@ -599,44 +700,59 @@ class QueryContextProcessor:
                 query_object_clone_dct["row_limit"] = current_app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
-            cache_keys.append(None)
-
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
+            # `query_object_clone` is reused for the next offsets, so take a snapshot
+            # of it since the missing offsets are only queried once all are prepared
+            offset_query_object = copy.copy(query_object_clone)
+            offset_query_object.filter = copy.deepcopy(query_object_clone.filter)
+            missing_offsets[len(offset_results)] = TimeOffsetQuery(
+                offset=offset,
+                original_offset=original_offset,
+                cache_key=cache_key,
+                query_object=offset_query_object,
+                query_dict=copy.deepcopy(query_object_clone_dct),
+            )
+            offset_results.append(None)
+
+        def query_offset(
+            offset_query: TimeOffsetQuery,
+        ) -> tuple[str, pd.DataFrame, str, str | None]:
+            processor = self.copy_for_worker()
+            offset_query = offset_query.copy()
+            offset_query["query_object"] = processor.copy_query_object(
+                offset_query["query_object"]
+            )
+            # eg, "1 year ago" is timed as `chart_data.time_offset.query.1_year_ago`
+            offset_key = re.sub(
+                r"[^a-z0-9]+", "_", offset_query["original_offset"].lower()
+            ).strip("_")
+            with stats_timing(
+                f"chart_data.time_offset.query.{offset_key}", stats_logger
+            ):
+                offset_df, offset_sql = processor.query_time_offset(
+                    offset_query, metric_names, join_keys
                 )
-            else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+            return offset_query["offset"], offset_df, offset_sql, None
+
+        if missing_offsets:
+            self.load_datasource_relationships()
+            with stats_timing("chart_data.time_offsets", stats_logger):
+                missing_results = map_concurrently(
+                    query_offset,
+                    missing_offsets.values(),
+                    current_app.config["CHART_DATA_QUERY_WORKERS"],
                 )
+            for idx, missing_result in zip(
+                missing_offsets, missing_results, strict=True
+            ):
+                offset_results[idx] = missing_result
 
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
-
-            # cache df and query
-            value = {
-                "df": offset_metrics_df,
-                "query": result.query,
-            }
-            cache.set(
-                key=cache_key,
-                value=value,
-                timeout=self.get_cache_timeout(),
-                datasource_uid=query_context.datasource.uid,
-                region=CacheRegion.DATA,
+        for offset_result in offset_results:
+            offset, offset_df, offset_sql, offset_cache_key = cast(
+                tuple[str, pd.DataFrame, str, str | None], offset_result
             )
-            offset_dfs[offset] = offset_metrics_df
+            offset_dfs[offset] = offset_df
+            queries.append(offset_sql)
+            cache_keys.append(offset_cache_key)
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -648,6 +764,52 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def query_time_offset(
+        self,
+        offset_query: TimeOffsetQuery,
+        metric_names: list[str],
+        join_keys: list[str],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Query the data of a time offset that is missing from the cache, and cache it.
+
+        :returns: The offset DataFrame, with the metrics renamed, and its query
+        """
+        query_object = offset_query["query_object"]
+        # rename metrics: SUM(value) => SUM(value) 1 year ago
+        metrics_mapping = {
+            metric: TIME_COMPARISON.join([metric, offset_query["original_offset"]])
+            for metric in metric_names
+        }
+
+        result = self.query_datasource(offset_query["query_dict"])
+
+        offset_metrics_df = result.df
+        if offset_metrics_df.empty:
+            offset_metrics_df = pd.DataFrame(
+                {col: [np.NaN] for col in join_keys + list(metrics_mapping.values())}
+            )
+        else:
+            # 1. normalize df, set dttm column
+            offset_metrics_df = self.normalize_df(offset_metrics_df, query_object)
+
+            # 2. rename extra query columns
+            offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+
+        # cache df and query
+        value = {
+            "df": offset_metrics_df,
+            "query": result.query,
+        }
+        QueryCacheManager.set(
+            key=offset_query["cache_key"],
+            value=value,
+            timeout=self.get_cache_timeout(),
+            datasource_uid=self._query_context.datasource.uid,
+            region=CacheRegion.DATA,
+        )
+        return offset_metrics_df, result.query
+
     def join_offset_dfs(
         self,
         df: pd.DataFrame,
@@ -761,7 +923,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | Iterator[bytes] | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -771,6 +933,19 @@ class QueryContextProcessor:
 
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
+                chunk_size = current_app.config["CSV_STREAMING_CHUNK_SIZE"]
+                # post-processed results are read back from the CSV on the server
+                if (
+                    chunk_size
+                    and self._query_context.result_type
+                    != ChartDataResultType.POST_PROCESSED
+                ):
+                    return csv.df_to_escaped_csv_stream(
+                        df,
+                        chunk_size,
+                        index=include_index,
+                        **current_app.config["CSV_EXPORT"],
+                    )
                 result = csv.df_to_escaped_csv(
                     df, index=include_index, **current_app.config["CSV_EXPORT"]
                 )
@@ -831,15 +1006,7 @@ class QueryContextProcessor:
 
         self.ensure_totals_available()
 
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        query_results = self.get_all_query_results(force_cached)
 
         return_value = {"queries": query_results}
 
@@ -863,6 +1030,73 @@ class QueryContextProcessor:
 
         return return_value
 
+    def get_all_query_results(self, force_cached: bool = False) -> list[dict[str, Any]]:
+        """
+        Returns the results of every query object, in order.
+
+        Independent query objects are executed concurrently when
+        `CHART_DATA_QUERY_WORKERS` is greater than 1.
+        """
+        queries = self._query_context.queries
+        max_workers = current_app.config["CHART_DATA_QUERY_WORKERS"]
+
+        if max_workers <= 1 or len(queries) <= 1:
+            return [
+                get_query_results(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in queries
+            ]
+
+        self.load_datasource_relationships()
+
+        def get_result(query_obj: QueryObject) -> dict[str, Any]:
+            processor = self.copy_for_worker()
+            return get_query_results(
+                query_obj.result_type or self._query_context.result_type,
+                processor._query_context,  # pylint: disable=protected-access
+                processor.copy_query_object(query_obj),
+                force_cached,
+            )
+
+        return map_concurrently(get_result, queries, max_workers)
+
+    def load_datasource_relationships(self) -> None:
+        """
+        Load the relationships of the datasource before handing it over to other
+        threads, so they are copied to each worker instead of being loaded by all.
+        """
+        for attr in ("database", "columns", "metrics"):
+            getattr(self._qc_datasource, attr, None)
+
+    def copy_for_worker(self) -> QueryContextProcessor:
+        """
+        Copy the processor and its query context for a worker thread.
+
+        The datasource is merged into the session of the worker, since the session of
+        the thread handling the request can't be used from other threads.
+        """
+        query_context = copy.copy(self._query_context)
+        query_context.datasource = merge_into_session(self._qc_datasource)
+        processor = copy.copy(self)
+        processor._query_context = query_context
+        processor._qc_datasource = query_context.datasource
+        query_context._processor = processor  # pylint: disable=protected-access
+        return processor
+
+    def copy_query_object(self, query_obj: QueryObject) -> QueryObject:
+        """
+        Copy a query object for a worker thread, with its datasource merged into the
+        session of the worker.
+        """
+        query_obj = copy.copy(query_obj)
+        if query_obj.datasource:
+            query_obj.datasource = merge_into_session(query_obj.datasource)
+        return query_obj
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
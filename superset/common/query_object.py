@@ -76,6 +76,28 @@ DEPRECATED_EXTRAS_FIELDS = (
 )
 
 
+def get_impersonation_cache_key(datasource: BaseDatasource | None) -> str | None:
+    """
+    Return the key of the current user, if cached results must be kept per user.
+
+    This is the case if impersonation is enabled on the database, or if the
+    CACHE_QUERY_BY_USER flag is on.
+    """
+    try:
+        database = datasource.database  # type: ignore
+        if (
+            feature_flag_manager.is_feature_enabled("CACHE_IMPERSONATION")
+            and database.impersonate_user
+        ) or feature_flag_manager.is_feature_enabled("CACHE_QUERY_BY_USER"):
+            return database.db_engine_spec.get_impersonation_key(
+                getattr(g, "user", None)
+            )
+    except AttributeError:
+        # datasource or database do not exist
+        pass
+    return None
+
+
 class QueryObject:  # pylint: disable=too-many-instance-attributes
     """
     The query objects are constructed on the client.
@@ -421,25 +443,9 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         if annotation_layers:
             cache_dict["annotation_layers"] = annotation_layers
 
-        # Add an impersonation key to cache if impersonation is enabled on the db
-        # or if the CACHE_QUERY_BY_USER flag is on
-        try:
-            database = self.datasource.database  # type: ignore
-            if (
-                feature_flag_manager.is_feature_enabled("CACHE_IMPERSONATION")
-                and database.impersonate_user
-            ) or feature_flag_manager.is_feature_enabled("CACHE_QUERY_BY_USER"):
-                if key := database.db_engine_spec.get_impersonation_key(
-                    getattr(g, "user", None)
-                ):
-                    logger.debug(
-                        "Adding impersonation key to QueryObject cache dict: %s", key
-                    )
-
-                    cache_dict["impersonation_key"] = key
-        except AttributeError:
-            # datasource or database do not exist
-            pass
+        if key := get_impersonation_cache_key(self.datasource):
+            logger.debug("Adding impersonation key to QueryObject cache dict: %s", key)
+            cache_dict["impersonation_key"] = key
 
         return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
 
@@ -31,6 +31,11 @@ from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
+from superset.utils.cache_codecs import (
+    DataFrameCacheCodecError,
+    decode_cache_value,
+    encode_cache_value,
+)
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
 logger = logging.getLogger(__name__)
@@ -160,7 +165,9 @@ class QueryCacheManager:
             logger.debug("Cache key: %s", key)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = decode_cache_value(
+                    cache_value, current_app.config["DATA_CACHE_CODEC"]
+                )
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -181,7 +188,7 @@ class QueryCacheManager:
                 )
                 query_cache.cache_value = cache_value
                 current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
-            except KeyError as ex:
+            except (KeyError, DataFrameCacheCodecError) as ex:
                 logger.exception(ex)
                 logger.error(
                     "Error reading cache: %s",
@@ -209,6 +216,7 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            value = encode_cache_value(value, current_app.config["DATA_CACHE_CODEC"])
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
     @staticmethod
@@ -59,6 +59,7 @@ from superset.superset_typing import CacheConfig
 from superset.tasks.types import ExecutorType
 from superset.themes.types import Theme
 from superset.utils import core as utils
+from superset.utils.cache_codecs import DataFrameCacheCodec
 from superset.utils.core import NO_TIME_RANGE, parse_boolean_string, QuerySource
 from superset.utils.encrypt import SQLAlchemyUtilsAdapter
 from superset.utils.log import DBEventLogger
@@ -82,6 +83,9 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `AsyncDBEventLogger` writes the logs in batches from a background thread
+# instead of committing them on every request, eg:
+# EVENT_LOGGER = AsyncDBEventLogger(flush_interval=1.0, batch_size=500)
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -162,6 +166,19 @@ DEFAULT_VIZ_TYPE = "table"
 ROW_LIMIT = 50000
 # default row limit when requesting samples from datasource in explore view
 SAMPLES_ROW_LIMIT = 1000
+# Maximum number of threads used to execute the queries of a single chart data
+# request concurrently, eg, for mixed charts or charts with totals. Set to 1 to
+# execute them serially.
+CHART_DATA_QUERY_WORKERS = 1
+# Maximum number of chart data queries executed concurrently against the same
+# database by each Superset process, when `CHART_DATA_QUERY_WORKERS` is greater
+# than 1. Set to 0 for no limit.
+CHART_DATA_QUERY_WORKERS_PER_DATABASE = 4
+# Also cache the raw results of chart data queries, before post-processing, in the
+# data cache. The raw results are keyed by the compiled SQL, so charts that run the
+# same query with different post-processing (or a chart and its CSV export) only hit
+# the database once. Requires compiling the SQL of a query before running it.
+CHART_DATA_RAW_CACHE = False
 # default row limit for native filters
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
@@ -798,6 +815,15 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# Warm up the cache of charts in the Celery worker running the `cache-warmup` task,
+# instead of scheduling a `fetch_url` task per chart that calls the warm up API over
+# HTTP. Charts are warmed up by up to CACHE_WARMUP_WORKERS threads, with at most
+# CACHE_WARMUP_WORKERS_PER_DATABASE of them querying the same database at once, and
+# charts with the same query cache keys as an already warmed up chart are skipped.
+CACHE_WARMUP_IN_PROCESS = False
+CACHE_WARMUP_WORKERS = 4
+CACHE_WARMUP_WORKERS_PER_DATABASE = 2
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -863,6 +889,14 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "domcontentloaded"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=60).total_seconds() * 1000
 )
+# Keep up to this many authenticated browsers per process (or browser contexts per
+# thread, with Playwright) after a screenshot, and reuse them for the next
+# screenshots of the same user. Set to 0 to start a new browser for each screenshot.
+SCREENSHOT_WEBDRIVER_POOL_SIZE = 0
+# Recycle a pooled browser after this many screenshots
+SCREENSHOT_WEBDRIVER_POOL_MAX_USES = 20
+# Recycle a pooled browser after being idle for this many seconds
+SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT = int(timedelta(minutes=5).total_seconds())
 
 # ---------------------------------------------------
 # Image and file configuration
@@ -884,6 +918,13 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How should the DataFrames of cached query results be serialized? By default they're
+# pickled by the cache backend. `ArrowIPCCacheCodec` stores them as columnar Arrow IPC
+# streams instead, which avoid unpickling every value of object columns on cache hits
+# and can optionally be compressed, eg `ArrowIPCCacheCodec(compression="zstd")`.
+# Entries written with a different codec are ignored and recomputed.
+DATA_CACHE_CODEC: DataFrameCacheCodec | None = None
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -915,6 +956,24 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Row level security filters are always memoized for the duration of a request. When
+# set, they are also stored in `CACHE_CONFIG` for this many seconds, and shared across
+# requests for users with the same roles. The cached filters are invalidated whenever
+# a row level security filter is changed.
+RLS_FILTERS_CACHE_TIMEOUT = 0
+
+# The permissions of a set of roles are compiled into an index of view menu names by
+# permission name, which is memoized for the duration of a request. When set, the
+# index is also stored in `CACHE_CONFIG` for this many seconds. The cached indexes are
+# invalidated whenever roles, permissions, databases or datasets are changed.
+PERMISSION_INDEX_CACHE_TIMEOUT = 0
+
+# When set, the datasets of a dashboard trimmed to the data needed by its charts (as
+# returned by `/api/v1/dashboard/<id>/datasets`) are stored in `CACHE_CONFIG` for
+# this many seconds, and shared between users with the same roles. The cached payload
+# is refreshed whenever the dashboard, its charts or its datasets are modified.
+DASHBOARD_DATASETS_CACHE_TIMEOUT = 0
+
 # CORS Options
 # NOTE: enabling this requires installing the cors-related python dependencies
 # `pip install .[cors]` or `pip install apache_superset[cors]`, depending
@@ -967,6 +1026,12 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8-sig"}
 
+# When set, CSV exports of charts and SQL Lab results are streamed to the client in
+# chunks of this many rows, instead of being built in memory before being sent.
+# Results from SQL Lab that are not in the results backend are also fetched from the
+# database in chunks.
+CSV_STREAMING_CHUNK_SIZE = 0
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1113,6 +1178,12 @@ DASHBOARD_AUTO_REFRESH_INTERVALS = [
 # celery beat triggered it, see https://github.com/celery/celery/issues/6974 for details
 CELERY_BEAT_SCHEDULER_EXPIRES = timedelta(weeks=1)
 
+# Number of rows deleted per statement, and maximum duration in seconds (or None for
+# no limit), of the tasks pruning old rows, eg, `prune_logs` and `prune_query`. Each
+# batch is committed, so a run stopped by the time budget is resumed by the next one.
+PRUNE_BATCH_SIZE = 10_000
+PRUNE_TIME_BUDGET: float | None = None
+
 # Default celery config is to use SQLA as a broker, in a production setting
 # you'll want to use a proper broker as specified here:
 # https://docs.celeryq.dev/en/stable/getting-started/backends-and-brokers/index.html
@@ -1151,11 +1222,18 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "schedule": crontab(minute=0, hour=0, day_of_month=1),
         #     "kwargs": {"retention_period_days": 180},
         # },
-        # Uncomment to enable pruning of the logs table
+        # Uncomment to enable pruning of the logs table, with a time budget
         # "prune_logs": {
         #     "task": "prune_logs",
         #     "schedule": crontab(minute="*", hour="*"),
-        #     "kwargs": {"retention_period_days": 180},
+        #     "kwargs": {"retention_period_days": 180, "time_budget": 50},
+        # },
+        # Uncomment to delete expired entries from the key-value store, eg, when
+        # using SupersetMetastoreCache for the explore or filter state caches
+        # "prune_key_value": {
+        #     "task": "prune_key_value",
+        #     "schedule": crontab(minute="*/15", hour="*"),
+        #     "kwargs": {"batch_size": 1000},
         # },
         # Uncomment to enable Slack channel cache warm-up
         # "slack.cache_channels": {
@@ -1270,6 +1348,12 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# When set, and results are serialized with PyArrow and MessagePack, the results of
+# SQL Lab queries are split into batches of this many rows, each stored under its own
+# key in the results backend. Pages of results can then be read without fetching and
+# decompressing the whole result set.
+RESULTS_BACKEND_BATCH_ROWS = 0
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1399,10 +1483,25 @@ TRACKING_URL_TRANSFORMER = lambda url: url  # noqa: E731
 # customize the polling time of each engine
 DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 
+# Time in seconds that the partition lookups of the `latest_partition` and
+# `latest_sub_partition` Jinja macros (Presto, Trino and Hive) are cached for, in
+# each process. Entries can be invalidated with
+# `DELETE /api/v1/database/<pk>/partition_cache/`. Set to 0 to disable the cache.
+PARTITION_CACHE_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+
 # Interval between consecutive polls when using Presto Engine
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # noqa: E501
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# Engines that poll the cursor for progress (eg, Presto and Hive) write the progress
+# of running queries to the query table at most once per interval, in seconds, and
+# check whether the query was stopped by reading its status from the query table.
+SQLLAB_QUERY_PROGRESS_INTERVAL = int(timedelta(seconds=5).total_seconds())
+# Signal stopped queries through the cache defined in CACHE_CONFIG, so that pollers
+# only read a cache key and check the query table once per interval. The cache must
+# be shared by the web servers and the Celery workers, eg, Redis.
+SQLLAB_QUERY_STOP_SIGNAL = False
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -1451,6 +1550,13 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Databases with `"pool_connections": true` in their extra reuse their SQLAlchemy
+# engines, and the connection pools in them, between requests instead of opening a
+# new connection every time. The pool can be configured with `engine_params`, eg,
+# `"engine_params": {"pool_size": 5, "pool_pre_ping": true}`. Engines that haven't
+# been used for this many seconds are disposed of (0 to keep them forever).
+ENGINE_POOL_IDLE_TIMEOUT = 300
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -1650,6 +1756,11 @@ ALERT_REPORTS_WORKING_TIME_OUT_KILL = True
 #     FixedExecutor("admin"),
 # ]
 ALERT_REPORTS_EXECUTORS: list[ExecutorType] = [ExecutorType.OWNER]
+# Generate the data of CSV and text reports by running the chart query in the Celery
+# worker, as the executor user, instead of requesting it from the chart data API
+# over HTTP. Results are served from the data cache unless the report forces a
+# refresh.
+ALERT_REPORTS_IN_PROCESS_DATA = False
 # if ALERT_REPORTS_WORKING_TIME_OUT_KILL is True, set a celery hard timeout
 # Equal to working timeout + ALERT_REPORTS_WORKING_TIME_OUT_LAG
 ALERT_REPORTS_WORKING_TIME_OUT_LAG = int(timedelta(seconds=10).total_seconds())
@@ -1667,6 +1778,9 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # Custom width for screenshots
+# Number of screenshots of a report (eg, the tabs of a dashboard) taken concurrently.
+# Only applies to Selenium, since the sync Playwright API is bound to its thread.
+ALERT_REPORTS_SCREENSHOT_WORKERS = 1
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
 # Set a minimum interval threshold between executions (for each Alert/Report)
@@ -1960,10 +2074,17 @@ GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE: None | (Literal["None", "Lax", "Strict
 )
 GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN = None
 GLOBAL_ASYNC_QUERIES_JWT_SECRET = "test-secret-change-me"  # noqa: S105
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "long_polling", "ws"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# With the "long_polling" transport the async event endpoint holds requests until
+# new events arrive, for up to this many seconds, using Redis' blocking XREAD. Each
+# held request occupies a web server thread and a Redis connection, so the number of
+# held requests per web server process is capped; requests beyond the cap return
+# immediately and clients fall back to polling every GLOBAL_ASYNC_QUERIES_POLLING_DELAY.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 25
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_MAX_CONNECTIONS = 10
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
 # Global async queries cache backend configuration options:
@@ -1971,3 +1971,25 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+    @staticmethod
+    def after_change(
+        mapper: Mapper,
+        connection: Connection,
+        target: RowLevelSecurityFilter,
+    ) -> None:
+        """
+        Invalidate the cached RLS filters after insert, update or delete
+        """
+        security_manager.rls_filter_after_change(mapper, connection, target)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", RowLevelSecurityFilter.after_change
+)
@@ -21,7 +21,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 
 from superset import db
 from superset.daos.base import BaseDAO
@@ -46,6 +46,38 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         filter_ = get_filter(resource, key)
         return db.session.query(KeyValueEntry).filter_by(**filter_).first()
 
+    @staticmethod
+    def get_entries(
+        resource: KeyValueResource,
+        keys: list[UUID],
+    ) -> list[KeyValueEntry]:
+        if not keys:
+            return []
+
+        return (
+            db.session.query(KeyValueEntry)
+            .filter(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(keys),
+            )
+            .all()
+        )
+
+    @staticmethod
+    def has_entry(resource: KeyValueResource, key: Key) -> bool:
+        filter_ = get_filter(resource, key)
+        query = (
+            db.session.query(KeyValueEntry.id)
+            .filter_by(**filter_)
+            .filter(
+                or_(
+                    KeyValueEntry.expires_on.is_(None),
+                    KeyValueEntry.expires_on > datetime.now(),
+                )
+            )
+        )
+        return db.session.query(query.exists()).scalar()
+
     @classmethod
     def get_value(
         cls,
@@ -59,6 +91,24 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return codec.decode(entry.value)
 
+    @classmethod
+    def get_values(
+        cls,
+        resource: KeyValueResource,
+        keys: list[UUID],
+        codec: KeyValueCodec,
+    ) -> list[Any]:
+        entries = {entry.uuid: entry for entry in cls.get_entries(resource, keys)}
+        values = []
+        for key in keys:
+            entry = entries.get(key)
+            if not entry or entry.is_expired():
+                values.append(None)
+            else:
+                values.append(codec.decode(entry.value))
+
+        return values
+
     @staticmethod
     def delete_entry(resource: KeyValueResource, key: Key) -> bool:
         if entry := KeyValueDAO.get_entry(resource, key):
@@ -68,16 +118,69 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         return False
 
     @staticmethod
-    def delete_expired_entries(resource: KeyValueResource) -> None:
-        (
-            db.session.query(KeyValueEntry)
-            .filter(
-                and_(
-                    KeyValueEntry.resource == resource.value,
-                    KeyValueEntry.expires_on <= datetime.now(),
-                )
+    def delete_entries(resource: KeyValueResource, keys: list[UUID]) -> list[UUID]:
+        """
+        Delete several entries of a resource.
+
+        :param resource: The resource of the entries
+        :param keys: The keys of the entries
+        :returns: The keys of the entries that existed and were deleted
+        """
+        if not keys:
+            return []
+
+        # select the keys first, since not all databases support
+        # `DELETE ... RETURNING`
+        deleted = [
+            uuid
+            for (uuid,) in db.session.query(KeyValueEntry.uuid).filter(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(keys),
             )
-            .delete()
+        ]
+        if deleted:
+            db.session.query(KeyValueEntry).filter(
+                KeyValueEntry.resource == resource.value,
+                KeyValueEntry.uuid.in_(deleted),
+            ).delete(synchronize_session="fetch")
+
+        return deleted
+
+    @staticmethod
+    def delete_expired_entries(
+        resource: KeyValueResource,
+        limit: int | None = None,
+    ) -> int:
+        """
+        Delete the expired entries of a resource.
+
+        :param resource: The resource of the entries
+        :param limit: Delete at most this many entries, oldest first
+        :returns: The number of deleted entries
+        """
+        expired = and_(
+            KeyValueEntry.resource == resource.value,
+            KeyValueEntry.expires_on <= datetime.now(),
+        )
+        if limit is None:
+            return db.session.query(KeyValueEntry).filter(expired).delete()
+
+        # select the primary keys first, since not all databases support
+        # `DELETE ... LIMIT`, and delete them in a single statement
+        ids = [
+            id_
+            for (id_,) in db.session.query(KeyValueEntry.id)
+            .filter(expired)
+            .order_by(KeyValueEntry.expires_on)
+            .limit(limit)
+        ]
+        if not ids:
+            return 0
+
+        return (
+            db.session.query(KeyValueEntry)
+            .filter(KeyValueEntry.id.in_(ids))
+            .delete(synchronize_session=False)
         )
 
     @staticmethod
@@ -127,6 +230,33 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return KeyValueDAO.create_entry(resource, value, codec, key, expires_on)
 
+    @classmethod
+    def upsert_entries(
+        cls,
+        resource: KeyValueResource,
+        values: dict[UUID, Any],
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> list[KeyValueEntry]:
+        """
+        Create or update several entries, fetching the existing ones in one query.
+        """
+        existing = {
+            entry.uuid: entry for entry in cls.get_entries(resource, list(values))
+        }
+        entries = []
+        for key, value in values.items():
+            if entry := existing.get(key):
+                entry.value = codec.encode(value)
+                entry.expires_on = expires_on
+                entry.changed_on = datetime.now()
+                entry.changed_by_fk = get_user_id()
+            else:
+                entry = cls.create_entry(resource, value, codec, key, expires_on)
+            entries.append(entry)
+
+        return entries
+
     @staticmethod
     def update_entry(
         resource: KeyValueResource,
@@ -26,6 +26,7 @@ from superset.extensions import db
 from superset.models.sql_lab import Query, SavedQuery
 from superset.queries.filters import QueryFilter
 from superset.queries.saved_queries.filters import SavedQueryFilter
+from superset.sqllab.query_progress import signal_stop
 from superset.utils.core import get_user_id
 from superset.utils.dates import now_as_float
 
@@ -77,6 +78,7 @@ class QueryDAO(BaseDAO[Query]):
 
         query.status = QueryStatus.STOPPED
         query.end_time = now_as_float()
+        signal_stop(query)
 
 
 class SavedQueryDAO(BaseDAO[SavedQuery]):
@@ -135,6 +135,7 @@ from superset.utils.core import (
 )
 from superset.utils.decorators import transaction
 from superset.utils.oauth2 import decode_oauth2_state
+from superset.utils.partition_cache import partition_cache
 from superset.utils.ssh_tunnel import mask_password_info
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
@@ -178,6 +179,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         "upload",
         "oauth2",
         "sync_permissions",
+        "invalidate_partition_cache",
     }
 
     resource_name = "database"
@@ -1820,6 +1822,81 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             function_names=database.function_names,
         )
 
+    @expose("/<int:pk>/partition_cache/", methods=("DELETE",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".invalidate_partition_cache",
+        log_to_statsd=False,
+    )
+    def invalidate_partition_cache(self, pk: int) -> Response:
+        """Invalidate the cached partition lookups of a database.
+        ---
+        delete:
+          summary: Invalidate the cached partition lookups of a database or table
+          description: >-
+            Invalidate the cached results of the `latest_partition` and
+            `latest_sub_partition` lookups, for a single table if a table name is
+            passed, or for the whole database otherwise.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            schema:
+              type: string
+            name: name
+            description: Optional table name
+          - in: query
+            schema:
+              type: string
+            name: schema
+            description: Optional table schema
+          - in: query
+            schema:
+              type: string
+            name: catalog
+            description: Optional table catalog
+          responses:
+            200:
+              description: Partition cache invalidated
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      message:
+                        type: string
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        database = DatabaseDAO.find_by_id(pk)
+        if not database:
+            return self.response_404()
+
+        try:
+            parameters = QualifiedTableSchema().load(request.args, partial=("name",))
+        except ValidationError as ex:
+            return self.response_400(message=ex.messages)
+
+        table = (
+            Table(parameters["name"], parameters["schema"], parameters["catalog"])
+            if parameters.get("name")
+            else None
+        )
+        partition_cache.invalidate(database.id, table)
+        return self.response(200, message="OK")
+
     @expose("/available/", methods=("GET",))
     @protect()
     @statsd_metrics
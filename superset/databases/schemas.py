@@ -162,7 +162,9 @@ extra_description = markdown(
     "7. The ``disable_drill_to_detail`` field is a boolean specifying whether or not"
     "drill to detail is disabled for the database."
     "8. The ``allow_multi_catalog`` indicates if the database allows changing "
-    "the default catalog when running queries and creating datasets.",
+    "the default catalog when running queries and creating datasets.<br/>"
+    "9. The ``pool_connections`` field is a boolean specifying whether or not the "
+    "connections to the database are pooled and reused between requests.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -831,6 +833,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     disable_data_preview = fields.Boolean(required=False)
     disable_drill_to_detail = fields.Boolean(required=False)
     allow_multi_catalog = fields.Boolean(required=False)
+    pool_connections = fields.Boolean(required=False)
     version = fields.String(required=False, allow_none=True)
     schema_options = fields.Dict(keys=fields.Str(), values=fields.Raw())
 
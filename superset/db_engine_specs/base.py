@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -38,6 +39,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -47,7 +49,7 @@ from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
-from sqlalchemy import column, select, types
+from sqlalchemy import column, inspect, MetaData, select, Table as SqlaTable, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
@@ -401,6 +403,13 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Can the DBAPI driver return results as a ``pyarrow.Table``? When true the engine
+    # spec MUST implement ``fetch_data_arrow``, which is then used instead of
+    # ``fetch_data`` when loading results, skipping the conversion of every row into
+    # a Python tuple. Since ``column_type_mutators`` can't be applied to Arrow results,
+    # engine specs that define them always fetch rows.
+    supports_arrow_fetch = False
+
     # Is the DB engine spec able to change the default schema? This requires implementing  # noqa: E501
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -982,32 +991,108 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
+            return cls._mutate_column_values(cursor.description or [], data)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        chunk_size: int,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a query in chunks, so they can be streamed.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows in each chunk
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator over the chunks of rows
+        """
+        fetched = 0
+        while limit is None or fetched < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - fetched)
+            try:
+                data = list(cursor.fetchmany(size))
+                if not data:
+                    return
+                data = cls._mutate_column_values(cursor.description or [], data)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            fetched += len(data)
+            yield data
+
+    @classmethod
+    def _mutate_column_values(
+        cls,
+        description: Any,
+        data: list[tuple[Any, ...]],
+    ) -> list[tuple[Any, ...]]:
+        # Create a mapping between column name and a mutator function to normalize
+        # values with. The first two items in the description row are
+        # the column name and type.
+        column_mutators = {
+            row[0]: func
+            for row in description
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
                 )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            )
+        }
+        if column_mutators:
+            indexes = {row[0]: idx for idx, row in enumerate(description)}
+            for row_idx, row in enumerate(data):
+                new_row = list(row)
+                for col, func in column_mutators.items():
+                    col_idx = indexes[col]
+                    new_row[col_idx] = func(row[col_idx])
+                data[row_idx] = tuple(new_row)
+
+        return data
+
+    @classmethod
+    def fetch_data_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table:
+        """
+        Fetch the results of a query as a ``pyarrow.Table``.
+
+        Only called when ``supports_arrow_fetch`` is true.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} sets `supports_arrow_fetch` but doesn't implement "
+            "`fetch_data_arrow`"
+        )
+
+    @classmethod
+    def fetch_data_or_arrow(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> list[tuple[Any, ...]] | pa.Table:
+        """
+        Fetch the results of a query, natively as Arrow if the driver supports it.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, either as a list of rows or a ``pyarrow.Table``
+        """
+        if not cls.supports_arrow_fetch or cls.column_type_mutators:
+            return cls.fetch_data(cursor, limit)
+
+        try:
+            table = cls.fetch_data_arrow(cursor, limit)
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+        if limit is not None and table.num_rows > limit:
+            table = table.slice(0, limit)
+        return table
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1185,13 +1270,86 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_df_insert_method(engine.dialect):
+                to_sql_kwargs["method"] = method
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from an iterable of Pandas DataFrames to a database.
+
+        The chunks are inserted one at a time in a single transaction, so that only
+        one of them is held in memory. The first chunk follows the `if_exists`
+        strategy, and the following ones are appended to the table. If the upload
+        fails and the table didn't exist before it's dropped, since not every
+        database supports transactional DDL.
+
+        Engines that override `df_to_sql` receive all the chunks concatenated in a
+        single DataFrame instead.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        if cls.df_to_sql.__func__ is not BaseEngineSpec.df_to_sql.__func__:  # type: ignore
+            cls.df_to_sql(database, table, pd.concat(dfs), to_sql_kwargs)
+            return
+
+        to_sql_kwargs = {**to_sql_kwargs, "name": table.table}
+        if table.schema:
+            to_sql_kwargs["schema"] = table.schema
+        if_exists = to_sql_kwargs.pop("if_exists", "fail")
+
+        with cls.get_engine(
+            database,
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as engine:
+            if method := cls.get_df_insert_method(engine.dialect):
+                to_sql_kwargs["method"] = method
+            existed = inspect(engine).has_table(table.table, schema=table.schema)
+            try:
+                with engine.begin() as connection:
+                    for df in dfs:
+                        df.to_sql(con=connection, if_exists=if_exists, **to_sql_kwargs)
+                        if_exists = "append"
+            except Exception:
+                if not existed:
+                    try:
+                        SqlaTable(table.table, MetaData(), schema=table.schema).drop(
+                            engine,
+                            checkfirst=True,
+                        )
+                    except Exception:  # pylint: disable=broad-except
+                        logger.warning("Unable to drop table %s", table, exc_info=True)
+                raise
+
+    @classmethod
+    def get_df_insert_method(
+        cls,
+        dialect: Dialect,
+    ) -> str | Callable[..., Any] | None:
+        """
+        Return the method used by `pandas.DataFrame.to_sql` to insert rows.
+
+        Defaults to multi-row `INSERT` statements when supported, and can be
+        overridden for engines that have a faster way of loading data, eg, `COPY`.
+
+        :param dialect: The dialect of the engine the data is uploaded to
+        :return: A method name or a callable, as expected by `pandas.DataFrame.to_sql`
+        """
+        if dialect.supports_multivalues_insert or cls.supports_multivalues_insert:
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
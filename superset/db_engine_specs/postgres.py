@@ -17,15 +17,18 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -94,6 +97,43 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def copy_from_stdin(
+    pd_table: Any,
+    conn: Any,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with ``COPY ... FROM STDIN``, for ``pandas.DataFrame.to_sql``.
+
+    Rows are serialized as CSV, where ``NULL`` is an unquoted empty field. Every
+    other value is quoted, so that empty strings are not read as ``NULL``.
+    """
+    buffer = io.StringIO()
+    buffer.writelines(
+        ",".join(
+            "" if value is None else '"' + str(value).replace('"', '""') + '"'
+            for value in row
+        )
+        + "\n"
+        for row in data_iter
+    )
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(pd_table.name)
+    if pd_table.schema:
+        table_name = f"{preparer.quote_schema(pd_table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        return cursor.rowcount
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -240,6 +280,18 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
         ),
     )
 
+    @classmethod
+    def get_df_insert_method(
+        cls,
+        dialect: Dialect,
+    ) -> str | Callable[..., Any] | None:
+        """
+        Use ``COPY`` to upload data, which is much faster than ``INSERT`` statements.
+        """
+        if dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_insert_method(dialect)
+
     @classmethod
     def get_schema_from_engine_params(
         cls,
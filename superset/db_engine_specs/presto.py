@@ -41,7 +41,6 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.sql.expression import ColumnClause, Select
 
 from superset import cache_manager, db, is_feature_enabled
-from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import SupersetErrorType
@@ -57,9 +56,11 @@ from superset.models.sql_types.presto_sql_types import (
     TinyInteger,
 )
 from superset.result_set import destringify
+from superset.sqllab.query_progress import QueryProgressTracker
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
+from superset.utils.partition_cache import partition_cache
 
 if TYPE_CHECKING:
     from superset.models.core import Database
@@ -566,7 +567,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
     def latest_partition(
         cls,
         database: Database,
@@ -588,7 +588,7 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         (['ds'], ('2018-01-01',))
         """
         if indexes is None:
-            indexes = database.get_indexes(table)
+            indexes = cls._get_partition_indexes(database, table)
 
         if not indexes:
             raise SupersetTemplateException(
@@ -610,18 +610,35 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
 
         column_names = indexes[0]["column_names"]
 
-        return column_names, cls._latest_partition_from_df(
-            df=database.get_df(
-                sql=cls._partition_query(
-                    table,
-                    indexes,
-                    database,
-                    limit=1,
-                    order_by=[(column_name, True) for column_name in column_names],
-                ),
-                catalog=table.catalog,
-                schema=table.schema,
-            )
+        return column_names, partition_cache.get(
+            database,
+            table,
+            ("latest_partition", tuple(column_names)),
+            lambda: cls._latest_partition_from_df(
+                df=database.get_df(
+                    sql=cls._partition_query(
+                        table,
+                        indexes,
+                        database,
+                        limit=1,
+                        order_by=[(column_name, True) for column_name in column_names],
+                    ),
+                    catalog=table.catalog,
+                    schema=table.schema,
+                )
+            ),
+        )
+
+    @staticmethod
+    def _get_partition_indexes(
+        database: Database,
+        table: Table,
+    ) -> list[dict[str, Any]]:
+        return partition_cache.get(
+            database,
+            table,
+            ("indexes",),
+            lambda: database.get_indexes(table),
         )
 
     @classmethod
@@ -653,7 +670,7 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
-        indexes = database.get_indexes(table)
+        indexes = cls._get_partition_indexes(database, table)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
             if k not in k in part_fields:  # pylint: disable=comparison-with-itself
@@ -670,18 +687,26 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
             if field not in kwargs:
                 field_to_return = field
 
-        sql = cls._partition_query(
-            table,
-            indexes,
+        def load() -> Any:
+            sql = cls._partition_query(
+                table,
+                indexes,
+                database,
+                limit=1,
+                order_by=[(field_to_return, True)],
+                filters=kwargs,
+            )
+            df = database.get_df(sql, table.catalog, table.schema)
+            if df.empty:
+                return ""
+            return df.to_dict()[field_to_return][0]
+
+        return partition_cache.get(
             database,
-            limit=1,
-            order_by=[(field_to_return, True)],
-            filters=kwargs,
+            table,
+            ("latest_sub_partition", tuple(sorted(kwargs.items()))),
+            load,
         )
-        df = database.get_df(sql, table.catalog, table.schema)
-        if df.empty:
-            return ""
-        return df.to_dict()[field_to_return][0]
 
     @classmethod
     def _show_columns(
@@ -1320,6 +1345,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", app.config["PRESTO_POLL_INTERVAL"]
         )
+        tracker = QueryProgressTracker(query)
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
@@ -1330,8 +1356,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
             # Update the object and wait for the kill signal.
             stats = polled.get("stats", {})
 
-            query = db.session.query(type(query)).filter_by(id=query_id).one()
-            if query.status in [QueryStatus.STOPPED, QueryStatus.TIMED_OUT]:
+            if tracker.is_stopped():
                 cursor.cancel()
                 break
 
@@ -1352,12 +1377,13 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                         completed_splits,
                         total_splits,
                     )
-                    query.progress = max(query.progress, progress)
-                    db.session.commit()
+                    tracker.set_progress(progress)
             time.sleep(poll_interval)
             logger.info("Query %i: Polling the cursor for progress", query_id)
             polled = cursor.poll()
 
+        tracker.flush()
+
     @classmethod
     def _extract_error_message(cls, ex: Exception) -> str:
         if (
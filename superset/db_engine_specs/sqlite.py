@@ -20,10 +20,11 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy import types
+from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.constants import TimeGrain
@@ -112,6 +113,17 @@ class SqliteEngineSpec(BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
 
+    @classmethod
+    def get_df_insert_method(
+        cls,
+        dialect: Dialect,
+    ) -> str | Callable[..., Any] | None:
+        """
+        Use ``executemany``, since SQLite inserts prepared rows faster than it parses
+        multi-row ``INSERT`` statements, which are also limited in size.
+        """
+        return None
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -91,6 +91,21 @@ class SupersetMetastoreCache(BaseCache):
         db.session.commit()  # pylint: disable=consider-using-transaction
         return True
 
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        KeyValueDAO.upsert_entries(
+            resource=RESOURCE,
+            values={self.get_key(key): value for key, value in mapping.items()},
+            codec=self.codec,
+            expires_on=self._get_expiry(timeout),
+        )
+        db.session.commit()  # pylint: disable=consider-using-transaction
+        return list(mapping)
+
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
@@ -116,11 +131,19 @@ class SupersetMetastoreCache(BaseCache):
 
         return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
 
+    def get_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        return KeyValueDAO.get_values(
+            RESOURCE, [self.get_key(key) for key in keys], self.codec
+        )
+
     def has(self, key: str) -> bool:
-        entry = self.get(key)
-        if entry:
-            return True
-        return False
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        return KeyValueDAO.has_entry(RESOURCE, self.get_key(key))
 
     @transaction()
     def delete(self, key: str) -> Any:
@@ -128,3 +151,12 @@ class SupersetMetastoreCache(BaseCache):
         from superset.daos.key_value import KeyValueDAO
 
         return KeyValueDAO.delete_entry(RESOURCE, self.get_key(key))
+
+    @transaction()
+    def delete_many(self, *keys: str) -> list[Any]:
+        # pylint: disable=import-outside-toplevel
+        from superset.daos.key_value import KeyValueDAO
+
+        uuids = {self.get_key(key): key for key in keys}
+        deleted = KeyValueDAO.delete_entries(RESOURCE, list(uuids))
+        return [uuids[uuid] for uuid in deleted]
@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
@@ -27,8 +28,9 @@ from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment
+from jinja2 import DebugUndefined, Environment, nodes, Template
 from jinja2.sandbox import SandboxedEnvironment
+from jinja2.utils import LRUCache
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
 from sqlalchemy.types import String
@@ -634,6 +636,70 @@ def to_datetime(
     return datetime.strptime(value, format)
 
 
+class CachingSandboxedEnvironment(SandboxedEnvironment):
+    """
+    A sandboxed environment that caches the code compiled from template strings.
+
+    Jinja only caches templates loaded from a loader, so by default every call to
+    `from_string` lexes, parses and compiles the template again. The compiled code
+    doesn't hold any render state, so it can be safely reused across requests, and
+    by the copies of the environment that have the same filters: Jinja checks the
+    filters and how they are called (and may even call them) when compiling.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.compiled: LRUCache = LRUCache(LRU_CACHE_MAX_SIZE)
+
+    def copy(self) -> CachingSandboxedEnvironment:
+        """
+        Return a copy of the environment that shares the compiled code.
+
+        The copy has its own filters and globals, so that changes to them don't
+        affect other copies.
+        """
+        env = cast(CachingSandboxedEnvironment, self.overlay())
+        env.filters = dict(self.filters)
+        env.globals = dict(self.globals)
+        return env
+
+    def from_string(
+        self,
+        source: str | nodes.Template,
+        globals: MutableMapping[str, Any] | None = None,  # noqa: A002
+        template_class: type[Template] | None = None,
+    ) -> Template:
+        if not isinstance(source, str) or globals or template_class:
+            return super().from_string(source, globals, template_class)
+
+        try:
+            key = (source, frozenset(self.filters.items()))
+        except TypeError:
+            # unhashable filters can't be part of the key
+            return super().from_string(source)
+
+        code = self.compiled.get(key)
+        if code is None:
+            code = self.compile(source)
+            self.compiled[key] = code
+        return self.template_class.from_code(self, code, self.make_globals(None), None)
+
+
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def get_environment(dialect: type[Dialect]) -> CachingSandboxedEnvironment:
+    """
+    Return the Jinja environment of a dialect, copied by its template processors.
+
+    The request-specific context is passed when rendering, so the environment only
+    holds the filters, which depend on the dialect. It should not be modified, use
+    a copy instead.
+    """
+    env = CachingSandboxedEnvironment(undefined=DebugUndefined)
+    env.filters["where_in"] = WhereInMacro(dialect())
+    env.filters["to_datetime"] = to_datetime
+    return env
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -664,13 +730,9 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self.env: Environment = SandboxedEnvironment(undefined=DebugUndefined)
+        self.env: Environment = get_environment(type(database.get_dialect())).copy()
         self.set_context(**kwargs)
 
-        # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
-        self.env.filters["to_datetime"] = to_datetime
-
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
         self._context.update(context_addons())
@@ -0,0 +1,47 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add_key_value_expires_on_index
+
+Revision ID: b7185f239557
+Revises: cd1fb11291f2
+Create Date: 2025-07-21 10:12:37.482915
+
+"""
+
+from alembic import op
+
+from superset.migrations.shared.utils import create_index, drop_index
+
+# revision identifiers, used by Alembic.
+revision = "b7185f239557"
+down_revision = "cd1fb11291f2"
+
+table = "key_value"
+index = "ix_key_value_expires_on"
+
+
+def upgrade():
+    create_index(
+        table,
+        op.f(index),
+        ["expires_on"],
+        unique=False,
+    )
+
+
+def downgrade():
+    drop_index(index_name=op.f(index), table_name=table)
@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -34,6 +35,7 @@ from typing import Any, Callable, cast, TYPE_CHECKING
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import current_app as app, g, has_app_context
@@ -57,6 +59,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
@@ -84,6 +87,8 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.engine_registry import engine_registry
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -255,6 +260,10 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     def allow_multi_catalog(self) -> bool:
         return self.get_extra().get("allow_multi_catalog", False)
 
+    @property
+    def pool_connections(self) -> bool:
+        return self.get_extra().get("pool_connections", False) is True
+
     @property
     def schema_options(self) -> dict[str, Any]:
         """Additional schema display config for engines with complex schemas"""
@@ -468,6 +477,9 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                         nullpool=nullpool,
                         source=source,
                         sqlalchemy_uri=sqlalchemy_uri,
+                        # tunnels are closed when the context manager exits, so
+                        # their connections can't be pooled
+                        pooled=self.pool_connections and not ssh_context,
                     )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
@@ -477,6 +489,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = False,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
@@ -485,7 +498,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        if nullpool and not pooled:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -538,10 +551,35 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 security_manager,
                 source,
             )
+
+        def create() -> Engine:
+            try:
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if not pooled:
+            return create()
+
         try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+            engine_hash = md5_sha_from_dict(
+                {
+                    "url": sqlalchemy_url.render_as_string(hide_password=False),
+                    "engine_kwargs": engine_kwargs,
+                }
+            )
+        except TypeError:
+            # arguments that can't be serialized (eg, callables or SSL contexts) can't
+            # be compared across calls, so the engine can't be reused
+            logger.debug("Not pooling the engine of %s", self.database_name)
+            return create()
+
+        key = (self.id, catalog, schema, effective_username, engine_hash)
+        return engine_registry.get_engine(
+            key,
+            create,
+            app.config["ENGINE_POOL_IDLE_TIMEOUT"],
+        )
 
     def add_database_to_signature(
         self,
@@ -666,20 +704,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         mutator: Callable[[pd.DataFrame], None] | None = None,
     ) -> pd.DataFrame:
         script = SQLScript(sql, self.db_engine_spec.engine)
-        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
-            engine_url = engine.url
-
-        log_query = app.config["QUERY_LOGGER"]
-
-        def _log_query(sql: str) -> None:
-            if log_query:
-                log_query(
-                    engine_url,
-                    sql,
-                    schema,
-                    __name__,
-                    security_manager,
-                )
+        _log_query = self._get_query_logger(catalog, schema)
 
         with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
             cursor = conn.cursor()
@@ -706,19 +731,108 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
             return self.post_process_df(df)
 
+    def iter_df(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        chunk_size: int = 10_000,
+        limit: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query, yielding the results in dataframes of at most `chunk_size` rows.
+
+        Only one chunk of rows is held in memory at a time. The connection is kept open
+        until the iterator is exhausted or closed, and at least one (possibly empty)
+        dataframe is yielded, so the columns of a result set without rows are still
+        known. Statements that don't return a result set yield a single dataframe
+        without columns.
+        """
+        script = SQLScript(sql, self.db_engine_spec.engine)
+        _log_query = self._get_query_logger(catalog, schema)
+
+        with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
+            cursor = conn.cursor()
+            for i, statement in enumerate(script.statements):
+                sql_ = self.mutate_sql_based_on_config(
+                    statement.format(),
+                    is_split=True,
+                )
+                _log_query(sql_)
+                with event_logger.log_context(
+                    action="execute_sql",
+                    database=self,
+                    object_ref=__name__,
+                ):
+                    self.db_engine_spec.execute(cursor, sql_, self)
+
+                # when a query has multiple statements only the last one returns data
+                if i < len(script.statements) - 1:
+                    cursor.fetchall()
+
+            if cursor.description is None:
+                yield pd.DataFrame()
+                return
+
+            empty = True
+            for rows in self.db_engine_spec.fetch_data_chunks(
+                cursor,
+                chunk_size,
+                limit,
+            ):
+                empty = False
+                yield self._rows_to_df(cursor.description, rows)
+
+            if empty:
+                yield self._rows_to_df(cursor.description, [])
+
+    def _rows_to_df(
+        self,
+        description: DbapiDescription,
+        rows: list[tuple[Any, ...]],
+    ) -> pd.DataFrame:
+        result_set = SupersetResultSet(rows, description, self.db_engine_spec)
+        return self.post_process_df(result_set.to_pandas_df())
+
+    def _get_query_logger(
+        self,
+        catalog: str | None,
+        schema: str | None,
+    ) -> Callable[[str], None]:
+        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+            engine_url = engine.url
+
+        log_query = app.config["QUERY_LOGGER"]
+
+        def _log_query(sql: str) -> None:
+            if log_query:
+                log_query(
+                    engine_url,
+                    sql,
+                    schema,
+                    __name__,
+                    security_manager,
+                )
+
+        return _log_query
+
     @event_logger.log_this
-    def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
+    def fetch_rows(
+        self,
+        cursor: Any,
+        last: bool,
+    ) -> list[tuple[Any, ...]] | pa.Table | None:
         if not last:
             cursor.fetchall()
             return None
 
-        return self.db_engine_spec.fetch_data(cursor)
+        return self.db_engine_spec.fetch_data_or_arrow(cursor)
 
     @event_logger.log_this
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -1183,9 +1297,15 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         ).delete()
 
 
+def evict_engines(_mapper: Mapper, _connection: Connection, target: Database) -> None:
+    engine_registry.evict(target.id)
+
+
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", evict_engines)
+sqla.event.listen(Database, "after_delete", evict_engines)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
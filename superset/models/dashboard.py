@@ -22,7 +22,7 @@ from collections import defaultdict, deque
 from typing import Any, Callable
 
 import sqlalchemy as sqla
-from flask import current_app as app
+from flask import current_app as app, g
 from flask_appbuilder import Model
 from flask_appbuilder.models.decorators import renders
 from flask_appbuilder.security.sqla.models import User
@@ -38,7 +38,7 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import relationship, subqueryload
+from sqlalchemy.orm import relationship, selectinload, subqueryload
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.sql.elements import BinaryExpression
 
@@ -52,6 +52,7 @@ from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.tasks.utils import get_current_user
 from superset.thumbnails.digest import get_dashboard_digest
 from superset.utils import core as utils, json
+from superset.utils.hashing import md5_sha_from_dict
 
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
@@ -269,6 +270,12 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         }
 
     def datasets_trimmed_for_slices(self) -> list[dict[str, Any]]:
+        """
+        The datasets of the dashboard, trimmed to the data needed by its charts.
+
+        When `DASHBOARD_DATASETS_CACHE_TIMEOUT` is set the result is cached, until the
+        dashboard, its charts or its datasets change, for users with the same roles.
+        """
         # Verbose but efficient database enumeration of dashboard datasources.
         slices_by_datasource: dict[tuple[type[BaseDatasource], int], set[Slice]] = (
             defaultdict(set)
@@ -277,18 +284,94 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        ids_by_model: dict[type[BaseDatasource], list[int]] = defaultdict(list)
+        for cls_model, datasource_id in slices_by_datasource:
+            ids_by_model[cls_model].append(datasource_id)
+
+        cache_key = self._get_datasets_cache_key(ids_by_model)
+        if cache_key and (result := cache_manager.cache.get(cache_key)) is not None:
+            app.config["STATS_LOGGER"].incr("dashboard_datasets.cache_hit")
+            return result
+
+        # load the datasets of each type in a single query
+        datasources: dict[tuple[type[BaseDatasource], int], BaseDatasource] = {}
+        for cls_model, ids in ids_by_model.items():
+            relationships = sqla.inspect(cls_model).relationships.keys()
+            query = db.session.query(cls_model).filter(cls_model.id.in_(ids))
+            for name in ("columns", "metrics", "owners"):
+                if name in relationships:
+                    query = query.options(selectinload(getattr(cls_model, name)))
+            datasources.update(
+                ((cls_model, datasource.id), datasource) for datasource in query
+            )
 
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
+        result: list[dict[str, Any]] = [
+            # Filter out unneeded fields from the datasource payload
+            datasource.data_for_slices(slices)
+            for key, slices in slices_by_datasource.items()
+            if (datasource := datasources.get(key))
+        ]
+
+        if cache_key:
+            cache_manager.cache.set(
+                cache_key,
+                result,
+                timeout=app.config["DASHBOARD_DATASETS_CACHE_TIMEOUT"],
             )
+        return result
 
-            if datasource:
-                # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+    def _get_datasets_cache_key(
+        self,
+        ids_by_model: dict[type[BaseDatasource], list[int]],
+    ) -> str | None:
+        if not app.config["DASHBOARD_DATASETS_CACHE_TIMEOUT"] or not getattr(
+            g, "user", None
+        ):
+            return None
+
+        # only the modification times are loaded, to check if the cache is fresh
+        datasets = []
+        children = []
+        for cls_model, ids in ids_by_model.items():
+            datasets.extend(
+                (cls_model.__name__, datasource_id, changed_on)
+                for datasource_id, changed_on in db.session.query(
+                    cls_model.id, cls_model.changed_on
+                ).filter(cls_model.id.in_(ids))
+            )
 
-        return result
+            # columns and metrics are modified without changing the dataset, so the
+            # number of them and their latest modification time are part of the key
+            relationships = sqla.inspect(cls_model).relationships
+            for name in ("columns", "metrics"):
+                if name not in relationships.keys():
+                    continue
+                child_model = relationships[name].mapper.class_
+                (parent_id,) = relationships[name].remote_side
+                children.extend(
+                    (cls_model.__name__, name, datasource_id, count, changed_on)
+                    for datasource_id, count, changed_on in db.session.query(
+                        parent_id,
+                        sqla.func.count(),
+                        sqla.func.max(child_model.changed_on),
+                    )
+                    .filter(parent_id.in_(ids))
+                    .group_by(parent_id)
+                )
+
+        return "dashboard_datasets:" + md5_sha_from_dict(
+            {
+                "dashboard": (self.id, self.changed_on),
+                "slices": sorted((slc.id, slc.changed_on) for slc in self.slices),
+                "datasets": sorted(datasets),
+                "children": sorted(children),
+                "roles": sorted(role.id for role in security_manager.get_user_roles()),
+            },
+            default=json.json_int_dttm_ser,
+        )
 
     @property
     def params(self) -> str:
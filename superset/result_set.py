@@ -18,6 +18,8 @@
 
 import datetime
 import logging
+from collections.abc import Iterable, Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -102,17 +104,14 @@ def convert_to_string(value: Any) -> str:
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals  # noqa: C901
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -128,55 +127,27 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, (pa.Table, pa.RecordBatch)):
+            # the driver already returned columnar data, no need to go through
+            # Python objects unless a column has to be stringified
+            if not column_names:
+                column_names = dedup(data.schema.names)
+            if data.num_rows > 0:
+                pa_data = self._arrow_to_pa_data(data)
+        else:
+            data = data or []
+            # only do expensive recasting if datatype is not standard list of tuples
+            if data and (
+                not isinstance(data, (list, tuple))
+                or not isinstance(data[0], (list, tuple))
+            ):
+                data = [tuple(row) for row in data]
+            if data and column_names:
+                if len(data[0]) != len(column_names):
+                    raise ValueError(
+                        f"Expected {len(column_names)} columns, got {len(data[0])}"
+                    )
+                pa_data = self._rows_to_pa_data(data, len(column_names))
 
         if not pa_data:
             column_names = []
@@ -193,6 +164,82 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @staticmethod
+    def _to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+        return np.fromiter(values, dtype=object, count=len(values))
+
+    def _rows_to_pa_data(self, data: DbapiResult, num_columns: int) -> list[pa.Array]:
+        """
+        Convert row-oriented DBAPI data to Arrow one column at a time.
+
+        Only the values of the column being converted are materialized as a
+        Python list, instead of copying the whole result into a NumPy
+        structured array of objects first.
+        """
+        pa_data: list[pa.Array] = []
+        for idx in range(num_columns):
+            values = list(map(itemgetter(idx), data))
+            try:
+                array = pa.array(values)
+            except (
+                pa.lib.ArrowInvalid,
+                pa.lib.ArrowTypeError,
+                pa.lib.ArrowNotImplementedError,
+                ValueError,
+                TypeError,  # this is super hackey,
+                # https://issues.apache.org/jira/browse/ARROW-7855
+            ):
+                # attempt serialization of values as strings
+                array = self._stringify_column(values)
+
+            if pa.types.is_nested(array.type):
+                # TODO: revisit nested column serialization once nested types
+                #  are added as a natively supported column type in Superset
+                #  (superset.utils.core.GenericDataType).
+                array = self._stringify_column(values)
+
+            elif pa.types.is_temporal(array.type):
+                array = self._localize_temporal_column(values, array)
+
+            pa_data.append(array)
+
+        return pa_data
+
+    def _arrow_to_pa_data(
+        self, data: pa.Table | pa.RecordBatch
+    ) -> list[pa.Array | pa.ChunkedArray]:
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
+        for array in data.columns:
+            if pa.types.is_nested(array.type):
+                array = self._stringify_column(array.to_pylist())
+            pa_data.append(array)
+        return pa_data
+
+    def _stringify_column(self, values: Sequence[Any]) -> pa.Array:
+        stringified_arr = stringify_values(self._to_object_array(values))
+        return pa.array(stringified_arr.tolist())
+
+    def _localize_temporal_column(
+        self, values: Sequence[Any], array: pa.Array
+    ) -> pa.Array:
+        # workaround for bug converting
+        # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+        # related: https://issues.apache.org/jira/browse/ARROW-5248
+        sample = self.first_nonempty(values)
+        if sample and isinstance(sample, datetime.datetime):
+            try:
+                if sample.tzinfo:
+                    tz = sample.tzinfo
+                    series = pd.Series(self._to_object_array(values))
+                    series = pd.to_datetime(series)
+                    return pa.Array.from_pandas(
+                        series,
+                        type=pa.timestamp("ns", tz=tz),
+                    )
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception(ex)
+        return array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -215,7 +262,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Iterable[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -21,17 +21,17 @@ import logging
 import re
 import time
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
-    assoc_group_role,
     assoc_permissionview_role,
-    assoc_user_group,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -47,12 +47,11 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, object_session, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
-from sqlalchemy.sql import exists
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -81,6 +80,8 @@ from superset.utils.filters import get_dataset_access_filters
 from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
+    from flask_caching import Cache
+
     from superset.common.query_context import QueryContext
     from superset.connectors.sqla.models import (
         BaseDatasource,
@@ -102,6 +103,25 @@ def get_conf() -> Any:
 
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
+# attribute of `flask.g` memoizing the RLS filters of the current request
+RLS_FILTERS_REQUEST_CACHE = "rls_filters"
+# key of the generation of the RLS filters in the shared cache, changed to invalidate
+# all the cached filters whenever a RLS filter is changed
+RLS_FILTERS_GENERATION_CACHE_KEY = "rls_filters_generation"
+# attribute of `flask.g` memoizing the permission indexes of the current request
+PERMISSION_INDEX_REQUEST_CACHE = "permission_index"
+# key of the version of the permission indexes in the shared cache, changed to
+# invalidate all the cached indexes whenever roles or permissions are changed
+PERMISSION_INDEX_VERSION_CACHE_KEY = "permission_index_version"
+# key of `Session.info` flagging that the shared permission indexes must be invalidated
+# once the changes are committed
+PERMISSION_INDEX_SESSION_FLAG = "invalidate_permission_index"
+# attribute of `flask.g` set while invalidations are deferred, true when one is pending
+PERMISSION_INDEX_DEFERRED = "permission_index_deferred"
+
+# the view menu names granted to a set of roles, by permission name
+PermissionIndex = dict[str, frozenset[str]]
+
 
 class DatabaseCatalogSchema(NamedTuple):
     database: str
@@ -731,6 +751,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import SqlaTable
+        from superset.models.core import Database
 
         user_datasources.update(
             self.get_session.query(SqlaTable)
@@ -738,16 +759,26 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .all()
         )
 
-        # group all datasources by database
-        all_datasources = SqlaTable.get_all_datasources()
-        datasources_by_database: dict["Database", set["SqlaTable"]] = defaultdict(set)
-        for datasource in all_datasources:
-            datasources_by_database[datasource.database].add(datasource)
-
-        # add datasources with implicit permission (eg, database access)
-        for database, datasources in datasources_by_database.items():
-            if self.can_access_database(database):
-                user_datasources.update(datasources)
+        # add datasources with implicit permission (eg, database access), only loading
+        # the datasources of the databases the user can access
+        if self.can_access_all_datasources() or self.can_access_all_databases():
+            user_datasources.update(SqlaTable.get_all_datasources())
+        elif database_ids := self.get_accessible_databases():
+            databases = (
+                self.get_session.query(Database)
+                .filter(Database.id.in_(database_ids))
+                .all()
+            )
+            if accessible_ids := [
+                database.id
+                for database in databases
+                if self.can_access_database(database)
+            ]:
+                user_datasources.update(
+                    SqlaTable.default_query(self.get_session.query(SqlaTable))
+                    .filter(SqlaTable.database_id.in_(accessible_ids))
+                    .all()
+                )
 
         return list(user_datasources)
 
@@ -768,45 +799,158 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.get_session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
-            .join(self.permission_model)
-            .join(assoc_permissionview_role)
-            .join(self.role_model)
-        )
-
-        if not g.user.is_anonymous:
-            user_id = get_user_id()
-
-            user_roles_filter = or_(
-                exists().where(
-                    (assoc_user_role.c.user_id == user_id)
-                    & (assoc_user_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-                exists().where(
-                    (assoc_user_group.c.user_id == user_id)
-                    & (assoc_user_group.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-            )
-
-            view_menu_names = base_query.filter(user_roles_filter).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
+        if not g.user.is_anonymous and get_user_id() is None:
+            return set()
+
+        # for anonymous users this is the public role, if any
+        role_ids = [role.id for role in self.get_user_roles(g.user)]
+        return set(self.get_permission_index(role_ids).get(permission_name, ()))
+
+    def get_permission_index(self, role_ids: list[int]) -> PermissionIndex:
+        """
+        Return the permissions granted to the roles, compiled into an index.
+
+        The index is memoized for the duration of the request, and when
+        `PERMISSION_INDEX_CACHE_TIMEOUT` is set it's also shared across requests until
+        roles or permissions are changed.
+
+        The index also holds the resource grants: the `database_access`,
+        `catalog_access`, `schema_access` and `datasource_access` entries are the
+        permissions of the databases, catalogs, schemas and datasets granted, so the
+        access checks of `can_access_database`, `can_access_schema` and
+        `raise_for_access` are set lookups. They still go through `can_access`, since
+        builtin roles are defined by patterns that can't be compiled into the index.
+
+        :param role_ids: The role IDs
+        :returns: The view menu names granted to the roles, by permission name
+        """
+        if not role_ids:
+            return {}
+
+        key = frozenset(role_ids)
+        request_cache = (
+            g.setdefault(PERMISSION_INDEX_REQUEST_CACHE, {})
+            if has_app_context()
+            else {}
+        )
+        if (index := request_cache.get(key)) is not None:
+            return index
+
+        cache_key = self._get_permission_index_cache_key(key)
+        if (
+            cache_key is None
+            or (index := self._get_security_cache().get(cache_key)) is None
+        ):
+            index = self._compile_permission_index(key)
+            if cache_key:
+                self._get_security_cache().set(
+                    cache_key,
+                    index,
+                    timeout=get_conf()["PERMISSION_INDEX_CACHE_TIMEOUT"],
                 )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+
+        request_cache[key] = index
+        return index
+
+    def _compile_permission_index(self, role_ids: frozenset[int]) -> PermissionIndex:
+        rows = (
+            self.get_session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
+            .join(
+                self.permission_model,
+                self.permissionview_model.permission_id == self.permission_model.id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.permissionview_model.view_menu_id == self.viewmenu_model.id,
+            )
+            .join(
+                assoc_permissionview_role,
+                assoc_permissionview_role.c.permission_view_id
+                == self.permissionview_model.id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            .distinct()
+        )
+        index: dict[str, set[str]] = defaultdict(set)
+        for permission_name, view_menu_name in rows:
+            index[permission_name].add(view_menu_name)
+        return {name: frozenset(view_menus) for name, view_menus in index.items()}
+
+    def _get_permission_index_cache_key(
+        self,
+        role_ids: frozenset[int],
+    ) -> Optional[str]:
+        if not get_conf()["PERMISSION_INDEX_CACHE_TIMEOUT"]:
+            return None
+        cache = self._get_security_cache()
+        version = cache.get(PERMISSION_INDEX_VERSION_CACHE_KEY) or ""
+        roles = ",".join(sorted(str(role_id) for role_id in role_ids))
+        return f"permission_index:{version}:{roles}"
+
+    @classmethod
+    def invalidate_permission_index(cls, *args: Any) -> None:
+        """
+        Invalidate the compiled permission indexes, after roles or permissions change.
+
+        Also triggered by SQLAlchemy events on roles, permissions, databases and
+        datasets, with the mapper, connection and target of the event. In that case
+        the indexes of the request are invalidated right away, but the shared indexes
+        are only invalidated once the session is committed, instead of once per row.
+        """
+        if not has_app_context():
+            return
+        g.pop(PERMISSION_INDEX_REQUEST_CACHE, None)
+        if args and (session := object_session(args[-1])) is not None:
+            session.info[PERMISSION_INDEX_SESSION_FLAG] = True
+            return
+        if PERMISSION_INDEX_DEFERRED in g:
+            setattr(g, PERMISSION_INDEX_DEFERRED, True)
+            return
+        if get_conf()["PERMISSION_INDEX_CACHE_TIMEOUT"]:
+            cls._get_security_cache().set(
+                PERMISSION_INDEX_VERSION_CACHE_KEY,
+                uuid4().hex,
+                timeout=0,
+            )
+
+    @contextmanager
+    def defer_permission_index_invalidation(self) -> Iterator[None]:
+        """
+        Invalidate the permission indexes at most once, after a block making many
+        changes to roles and permissions, eg, when syncing the role definitions.
+        """
+        if PERMISSION_INDEX_DEFERRED in g:
+            yield
+            return
+
+        setattr(g, PERMISSION_INDEX_DEFERRED, False)
+        try:
+            yield
+        finally:
+            if g.pop(PERMISSION_INDEX_DEFERRED):
+                self.invalidate_permission_index()
+
+    def _has_view_access(
+        self,
+        user: object,
+        permission_name: str,
+        view_name: str,
+    ) -> bool:
+        roles = self.get_user_roles(user)
+
+        # First check against built-in roles (avoiding unnecessary DB queries)
+        if any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        ):
+            return True
+
+        db_role_ids = [role.id for role in roles if role.name not in self.builtin_roles]
+        return view_name in self.get_permission_index(db_role_ids).get(
+            permission_name, ()
+        )
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -1108,25 +1252,26 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         logger.info("Syncing role definition")
 
-        self.create_custom_permissions()
+        with self.defer_permission_index_invalidation():
+            self.create_custom_permissions()
 
-        pvms = self._get_all_pvms()
+            pvms = self._get_all_pvms()
 
-        # Creating default roles
-        self.set_role("Admin", self._is_admin_pvm, pvms)
-        self.set_role("Alpha", self._is_alpha_pvm, pvms)
-        self.set_role("Gamma", self._is_gamma_pvm, pvms)
-        self.set_role("sql_lab", self._is_sql_lab_pvm, pvms)
+            # Creating default roles
+            self.set_role("Admin", self._is_admin_pvm, pvms)
+            self.set_role("Alpha", self._is_alpha_pvm, pvms)
+            self.set_role("Gamma", self._is_gamma_pvm, pvms)
+            self.set_role("sql_lab", self._is_sql_lab_pvm, pvms)
 
-        # Configure public role
-        if get_conf()["PUBLIC_ROLE_LIKE"]:
-            self.copy_role(
-                get_conf()["PUBLIC_ROLE_LIKE"],
-                self.auth_role_public,
-                merge=True,
-            )
-        self.create_missing_perms()
-        self.clean_perms()
+            # Configure public role
+            if get_conf()["PUBLIC_ROLE_LIKE"]:
+                self.copy_role(
+                    get_conf()["PUBLIC_ROLE_LIKE"],
+                    self.auth_role_public,
+                    merge=True,
+                )
+            self.create_missing_perms()
+            self.clean_perms()
 
     def _get_all_pvms(self) -> list[PermissionView]:
         """
@@ -1359,6 +1504,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The changed database object
         :return:
         """
+        self.invalidate_permission_index(mapper, connection, target)
         self._insert_pvm_on_sqla_event(
             mapper, connection, "database_access", target.get_perm()
         )
@@ -1381,6 +1527,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The changed database object
         :return:
         """
+        self.invalidate_permission_index(mapper, connection, target)
         self._delete_vm_database_access(
             mapper, connection, target.id, target.database_name
         )
@@ -1407,6 +1554,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The changed database object
         :return:
         """
+        self.invalidate_permission_index(mapper, connection, target)
         # Check if database name has changed
         state = inspect(target)
         history = state.get_history("database_name", True)
@@ -1609,6 +1757,8 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             Database,
         )
 
+        self.invalidate_permission_index(mapper, connection, target)
+
         try:
             dataset_perm: Optional[str] = target.get_perm()
             database = target.database
@@ -1690,6 +1840,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The changed dataset object
         :return:
         """
+        self.invalidate_permission_index(mapper, connection, target)
         dataset_vm_name = self.get_dataset_perm(
             target.id, target.table_name, target.database.database_name
         )
@@ -1717,6 +1868,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The changed dataset object
         :return:
         """
+        self.invalidate_permission_index(mapper, connection, target)
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import SqlaTable
 
@@ -2513,6 +2665,27 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = [role.id for role in self.get_user_roles(g.user)]
+        cache_key = (frozenset(user_roles), table.id)
+        # the filters are looked up several times per chart (for the cache key and for
+        # the query itself), so they are memoized for the duration of the request
+        request_cache = g.setdefault(RLS_FILTERS_REQUEST_CACHE, {})
+        if (filters := request_cache.get(cache_key)) is None:
+            filters = self._get_rls_filters_from_cache(user_roles, table.id)
+        if filters is None:
+            filters = self._query_rls_filters(user_roles, table)
+            self._set_rls_filters_in_cache(user_roles, table.id, filters)
+        else:
+            get_conf()["STATS_LOGGER"].incr("rls_filters.cache_hit")
+
+        request_cache[cache_key] = filters
+        return list(filters)
+
+    def _query_rls_filters(
+        self,
+        user_roles: list[int],
+        table: "BaseDatasource",
+    ) -> list[SqlaQuery]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2520,7 +2693,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2564,6 +2736,70 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    @staticmethod
+    def _get_security_cache() -> "Cache":
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        return cache_manager.cache
+
+    def _get_rls_filters_cache_key(
+        self,
+        user_roles: list[int],
+        table_id: int,
+    ) -> Optional[str]:
+        if not get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]:
+            return None
+        cache = self._get_security_cache()
+        generation = cache.get(RLS_FILTERS_GENERATION_CACHE_KEY) or ""
+        roles = ",".join(sorted(str(role_id) for role_id in user_roles))
+        return f"rls_filters:{generation}:{roles}:{table_id}"
+
+    def _get_rls_filters_from_cache(
+        self,
+        user_roles: list[int],
+        table_id: int,
+    ) -> Optional[list[SqlaQuery]]:
+        if cache_key := self._get_rls_filters_cache_key(user_roles, table_id):
+            return self._get_security_cache().get(cache_key)
+        return None
+
+    def _set_rls_filters_in_cache(
+        self,
+        user_roles: list[int],
+        table_id: int,
+        filters: list[SqlaQuery],
+    ) -> None:
+        if cache_key := self._get_rls_filters_cache_key(user_roles, table_id):
+            self._get_security_cache().set(
+                cache_key,
+                filters,
+                timeout=get_conf()["RLS_FILTERS_CACHE_TIMEOUT"],
+            )
+
+    def rls_filter_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: "RowLevelSecurityFilter",
+    ) -> None:
+        """
+        Invalidates the cached RLS filters when a RLS filter is changed.
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed RLS filter
+        """
+        if has_app_context():
+            g.pop(RLS_FILTERS_REQUEST_CACHE, None)
+            if get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]:
+                self._get_security_cache().set(
+                    RLS_FILTERS_GENERATION_CACHE_KEY,
+                    uuid4().hex,
+                    timeout=0,
+                )
+
     def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
         """
         Retrieves a list RLS filters sorted by ID for
@@ -2819,3 +3055,23 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                     "User Registrations",
                 ]:
                     security_menu.childs.remove(item)
+
+
+for model in (Role, PermissionView, ViewMenu, Permission):
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(
+            model,
+            identifier,
+            SupersetSecurityManager.invalidate_permission_index,
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_permission_index_after_commit(session: Session) -> None:
+    if session.info.pop(PERMISSION_INDEX_SESSION_FLAG, False):
+        SupersetSecurityManager.invalidate_permission_index()
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_permission_index_invalidation(session: Session) -> None:
+    session.info.pop(PERMISSION_INDEX_SESSION_FLAG, None)
@@ -21,10 +21,12 @@ import copy
 import enum
 import logging
 import re
+import threading
 import urllib.parse
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, Generic, TYPE_CHECKING, TypeVar
+from typing import Any, Generic, NamedTuple, TYPE_CHECKING, TypeVar
 
 import sqlglot
 from jinja2 import nodes, Template
@@ -43,6 +45,7 @@ from sqlglot.optimizer.scope import (
     traverse_scope,
 )
 
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.exceptions import QueryClauseValidationException, SupersetParseError
 from superset.sql.dialects import Dremio, Firebolt
 
@@ -116,6 +119,80 @@ SQLGLOT_DIALECTS = {
 }
 
 
+class ParseCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    A thread-safe LRU cache of parsed SQL scripts.
+
+    The same SQL is often parsed multiple times when handling a single request (eg,
+    when checking for mutations, applying RLS and adding a limit). Since ASTs are
+    mutable and are often modified in place, the cache stores and returns copies of
+    them; copying an AST is much cheaper than parsing the SQL again.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            tuple[str, str | type[Dialect] | None],
+            list[exp.Expression],
+        ] = OrderedDict()
+
+    def get(
+        self,
+        key: tuple[str, str | type[Dialect] | None],
+    ) -> list[exp.Expression] | None:
+        with self._lock:
+            statements = self._entries.get(key)
+            if statements is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return [statement and statement.copy() for statement in statements]
+
+    def set(
+        self,
+        key: tuple[str, str | type[Dialect] | None],
+        statements: list[exp.Expression],
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+
+        copies = [statement and statement.copy() for statement in statements]
+        with self._lock:
+            self._entries[key] = copies
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> ParseCacheInfo:
+        with self._lock:
+            return ParseCacheInfo(
+                self.hits,
+                self.misses,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+parse_cache = ParseCache(maxsize=LRU_CACHE_MAX_SIZE)
+
+
 class LimitMethod(enum.Enum):
     """
     Limit methods.
@@ -545,6 +622,19 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
 
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
+        """
+        Parse a script, reusing the ASTs of previous calls with the same script.
+        """
+        key = (script, SQLGLOT_DIALECTS.get(engine))
+        statements = parse_cache.get(key)
+        if statements is None:
+            statements = cls._parse_script(script, engine)
+            parse_cache.set(key, statements)
+
+        return statements
+
+    @classmethod
+    def _parse_script(cls, script: str, engine: str) -> list[exp.Expression]:
         """
         Parse helper.
         """
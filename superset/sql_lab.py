@@ -57,7 +57,12 @@ from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import (
+    RESULTS_BATCHES_KEY,
+    split_results_batches,
+    write_ipc_buffer,
+    write_results_batches,
+)
 from superset.utils import json
 from superset.utils.core import (
     override_user,
@@ -281,7 +286,7 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                data = db_engine_spec.fetch_data_or_arrow(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -336,13 +341,17 @@ def _serialize_and_expand_data(
     db_engine_spec: BaseEngineSpec,
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
-) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
+    serialize_data: bool = True,
+) -> tuple[Union[bytes, str, None], list[Any], list[Any], list[Any]]:
     selected_columns = result_set.columns
     all_columns: list[Any]
     expanded_columns: list[Any]
 
     if use_msgpack:
-        if has_app_context():
+        if not serialize_data:
+            # the data is stored in separate batches, see `write_results_batches`
+            data = None
+        elif has_app_context():
             stats_logger = app.config["STATS_LOGGER"]
             with stats_timing(
                 "sqllab.query.results_backend_pa_serialization", stats_logger
@@ -525,8 +534,22 @@ def execute_sql_statements(  # noqa: C901
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+    batch_rows = (
+        app.config["RESULTS_BACKEND_BATCH_ROWS"]
+        if use_arrow_data and results_backend
+        else 0
+    )
+    (
+        data,
+        selected_columns,
+        all_columns,
+        expanded_columns,
+    ) = _serialize_and_expand_data(
+        result_set,
+        db_engine_spec,
+        use_arrow_data,
+        expand_data,
+        serialize_data=not batch_rows,
     )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
@@ -553,13 +576,22 @@ def execute_sql_statements(  # noqa: C901
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
+                batches = []
+                if batch_rows:
+                    tables = split_results_batches(result_set.pa_table, batch_rows)
+                    batches = [write_ipc_buffer(table).to_pybytes() for table in tables]
+                    payload[RESULTS_BATCHES_KEY] = [table.num_rows for table in tables]
                 serialized_payload = _serialize_payload(
                     payload, cast(bool, results_backend_use_msgpack)
                 )
+                # the batch sizes are only needed to read the stored results
+                payload.pop(RESULTS_BATCHES_KEY, None)
 
                 # Check the size of the serialized payload
                 if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
+                    serialized_payload_size = sys.getsizeof(serialized_payload) + sum(
+                        sys.getsizeof(batch) for batch in batches
+                    )
                     max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
 
                     if serialized_payload_size > max_bytes:
@@ -581,6 +613,8 @@ def execute_sql_statements(  # noqa: C901
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
             logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+            # the batches are written first, so they're available once the results are
+            write_results_batches(results_backend, key, batches, cache_timeout)
             results_backend.set(key, compressed, cache_timeout)
         query.results_key = key
 
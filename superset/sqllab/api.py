@@ -15,10 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, cast, Optional
 from urllib import parse
 
-from flask import current_app as app, request, Response
+from flask import current_app as app, request, Response, stream_with_context
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -269,7 +270,22 @@ class SqlLabRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        result = SqlResultExportCommand(client_id=client_id).run()
+        command = SqlResultExportCommand(client_id=client_id)
+        if chunk_size := app.config["CSV_STREAMING_CHUNK_SIZE"]:
+            stream_result = command.stream(chunk_size)
+            query = stream_result["query"]
+
+            def generate() -> Iterator[bytes]:
+                yield from stream_result["data"]
+                self._log_csv_export(client_id, query, command.count)
+
+            quoted_csv_name = parse.quote(query.name)
+            return CsvResponse(
+                stream_with_context(generate()),
+                headers=generate_download_headers("csv", quoted_csv_name),
+            )
+
+        result = command.run()
 
         query, data, row_count = result["query"], result["data"], result["count"]
 
@@ -277,6 +293,11 @@ class SqlLabRestApi(BaseSupersetApi):
         response = CsvResponse(
             data, headers=generate_download_headers("csv", quoted_csv_name)
         )
+        self._log_csv_export(client_id, query, row_count)
+        return response
+
+    @staticmethod
+    def _log_csv_export(client_id: str, query: Query, row_count: int) -> None:
         event_info = {
             "event_type": "data_export",
             "client_id": client_id,
@@ -291,7 +312,6 @@ class SqlLabRestApi(BaseSupersetApi):
         logger.debug(
             "CSV exported: %s", event_rep, extra={"superset_event": event_info}
         )
-        return response
 
     @expose("/results/")
     @protect()
@@ -336,7 +356,8 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        offset = params.get("offset", 0)
+        result = SqlExecutionResultsCommand(key=key, rows=rows, offset=offset).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
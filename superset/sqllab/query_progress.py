@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Progress tracking and cancellation of running SQL Lab queries.
+
+Engines that poll a cursor for progress (eg, Presto and Hive) used to reload the
+query row on every poll to check whether it was stopped, and committed every change
+in progress. ``QueryProgressTracker`` coalesces the progress updates into periodic
+writes, and reads the status of the query from a stop signal in the cache when
+``SQLLAB_QUERY_STOP_SIGNAL`` is enabled, falling back to the ``query`` table only
+once per interval.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from flask import current_app as app
+
+from superset import cache_manager, db
+from superset.common.db_query_status import QueryStatus
+from superset.models.sql_lab import Query
+
+logger = logging.getLogger(__name__)
+
+STOPPED_STATUSES = (QueryStatus.STOPPED, QueryStatus.TIMED_OUT)
+
+
+def get_stop_signal_key(query_id: int) -> str:
+    return f"sqllab_query_stopped_{query_id}"
+
+
+def signal_stop(query: Query) -> None:
+    """
+    Notify the worker running a query that it has been stopped.
+    """
+    if app.config["SQLLAB_QUERY_STOP_SIGNAL"]:
+        cache_manager.cache.set(
+            get_stop_signal_key(query.id),
+            True,
+            timeout=app.config["SQLLAB_ASYNC_TIME_LIMIT_SEC"],
+        )
+
+
+class QueryProgressTracker:
+    """
+    Track the progress of a running query, and whether it has been stopped.
+
+    Progress and tracking URL updates are written to the ``query`` table at most
+    once every ``SQLLAB_QUERY_PROGRESS_INTERVAL`` seconds, and on ``flush``.
+    """
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+        self.query_id = query.id
+        self.interval = app.config["SQLLAB_QUERY_PROGRESS_INTERVAL"]
+        self.use_signal = app.config["SQLLAB_QUERY_STOP_SIGNAL"]
+        self._dirty = False
+        self._last_flush = self._last_check = time.monotonic()
+
+    def set_progress(self, progress: float) -> None:
+        if progress > (self.query.progress or 0):
+            self.query.progress = progress
+            self._dirty = True
+        self._maybe_flush()
+
+    def set_tracking_url(self, tracking_url: str) -> None:
+        if tracking_url != self.query.tracking_url:
+            self.query.tracking_url = tracking_url
+            self._dirty = True
+        self._maybe_flush()
+
+    def is_stopped(self) -> bool:
+        """
+        Return whether the query has been stopped or has timed out.
+        """
+        if self.use_signal:
+            if cache_manager.cache.get(get_stop_signal_key(self.query_id)):
+                return True
+            # the signal can be lost, eg, if the cache is cleared, so the status of
+            # the query is still checked periodically
+            if time.monotonic() - self._last_check < self.interval:
+                return False
+            self._last_check = time.monotonic()
+
+        # don't flush pending progress updates, which would lock the row until the
+        # next commit
+        with db.session.no_autoflush:
+            status = db.session.query(Query.status).filter_by(id=self.query_id).scalar()
+        return status in STOPPED_STATUSES
+
+    def flush(self) -> None:
+        """
+        Write pending progress updates to the ``query`` table.
+        """
+        self._last_flush = time.monotonic()
+        if self._dirty:
+            self._dirty = False
+            db.session.commit()  # pylint: disable=consider-using-transaction
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
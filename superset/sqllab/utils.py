@@ -19,11 +19,16 @@ from __future__ import annotations
 from typing import Any
 
 import pyarrow as pa
+from flask_caching.backends.base import BaseCache
 
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
 from superset.models.sql_lab import TabState
+from superset.utils.core import zlib_compress, zlib_decompress
+
+# the number of rows in each batch, for results stored in batches
+RESULTS_BATCHES_KEY = "batches"
 
 DATABASE_KEYS = [
     "allow_file_upload",
@@ -80,6 +85,86 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def get_results_batch_key(key: str, index: int) -> str:
+    return f"{key}:batch:{index}"
+
+
+def split_results_batches(table: pa.Table, batch_rows: int) -> list[pa.Table]:
+    """
+    Split the results of a query into batches of at most `batch_rows` rows.
+
+    There's always at least one batch, so that the schema is kept for empty results.
+    """
+    return [
+        table.slice(offset, batch_rows)
+        for offset in range(0, max(table.num_rows, 1), batch_rows)
+    ]
+
+
+def write_results_batches(
+    results_backend: BaseCache,
+    key: str,
+    buffers: list[bytes],
+    timeout: int,
+) -> None:
+    """
+    Store the serialized batches of the results of a query, each under its own key.
+    """
+    for index, buffer in enumerate(buffers):
+        results_backend.set(
+            get_results_batch_key(key, index),
+            zlib_compress(buffer),
+            timeout,
+        )
+
+
+def read_results_batches(
+    results_backend: BaseCache,
+    key: str,
+    batch_rows: list[int],
+    offset: int = 0,
+    limit: int | None = None,
+) -> pa.Table | None:
+    """
+    Read a page of the results of a query stored in batches.
+
+    Only the batches that overlap with the page are read from the results backend.
+
+    :param results_backend: The results backend
+    :param key: The key of the results
+    :param batch_rows: The number of rows in each batch
+    :param offset: The index of the first row of the page
+    :param limit: The maximum number of rows in the page
+    :returns: The rows of the page, or None if a batch has expired
+    """
+
+    def read_batch(index: int) -> pa.Table | None:
+        if not (blob := results_backend.get(get_results_batch_key(key, index))):
+            return None
+        with pa.ipc.open_stream(zlib_decompress(blob, decode=False)) as reader:
+            return reader.read_all()
+
+    end = None if limit is None else offset + limit
+    tables = []
+    first_row = start = 0
+    for index, num_rows in enumerate(batch_rows):
+        stop = start + num_rows
+        if stop > offset and (end is None or start < end):
+            if (table := read_batch(index)) is None:
+                return None
+            if not tables:
+                first_row = start
+            tables.append(table)
+        start = stop
+
+    if not tables:
+        # the page is empty, but the first batch is still needed for the schema
+        table = read_batch(0)
+        return None if table is None else table.slice(0, 0)
+
+    return pa.concat_tables(tables).slice(offset - first_row, limit)
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from typing import Any, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
@@ -35,6 +37,8 @@ from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.concurrency import concurrency_limit, map_concurrently
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
@@ -278,6 +282,82 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def get_query_cache_keys(chart: Slice) -> set[str]:
+    """
+    Return the cache keys of the queries of a chart.
+
+    Legacy charts don't have a query context, so an empty set is returned for them.
+    """
+    query_context = chart.get_query_context()
+    if not query_context:
+        return set()
+
+    return {
+        cache_key
+        for query_obj in query_context.queries
+        if (cache_key := query_context.query_cache_key(query_obj))
+    }
+
+
+def warm_up_charts(tasks: list[CacheWarmupTask]) -> dict[str, list[str]]:
+    """
+    Warm up the cache of charts in the current process.
+
+    Charts are warmed up concurrently, each one as the user of its task, with at most
+    `CACHE_WARMUP_WORKERS_PER_DATABASE` of them querying the same database at once.
+    Charts with the same query cache keys as a previously warmed up chart are skipped,
+    unless the warm up of that chart failed.
+    """
+    max_workers = current_app.config["CACHE_WARMUP_WORKERS"]
+    limit = current_app.config["CACHE_WARMUP_WORKERS_PER_DATABASE"]
+    warmed_cache_keys: set[str] = set()
+    lock = threading.Lock()
+
+    def warm_up(task: CacheWarmupTask) -> tuple[str, str]:
+        # pylint: disable=import-outside-toplevel
+        from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+
+        payload = json.dumps(task["payload"])
+        try:
+            user = security_manager.get_user_by_username(task["username"])
+            with override_user(user):
+                chart = db.session.query(Slice).get(task["payload"]["chart_id"])
+                if not chart:
+                    logger.error("Chart not found for %s", payload)
+                    return "errors", payload
+
+                cache_keys = get_query_cache_keys(chart)
+                with lock:
+                    if cache_keys and cache_keys <= warmed_cache_keys:
+                        logger.info("Skipping %s, already warmed up", payload)
+                        return "skipped", payload
+
+                database_id = getattr(chart.datasource, "database_id", None)
+                with concurrency_limit(("cache_warmup", database_id), limit):
+                    logger.info("Warming up %s", payload)
+                    result = ChartWarmUpCacheCommand(
+                        chart,
+                        task["payload"].get("dashboard_id"),
+                        None,
+                    ).run()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error warming up cache for payload: %s", payload)
+            return "errors", payload
+
+        if result["viz_error"]:
+            logger.error("Error warming up %s: %s", payload, result["viz_error"])
+            return "errors", payload
+
+        with lock:
+            warmed_cache_keys.update(cache_keys)
+        return "success", payload
+
+    results: dict[str, list[str]] = {"success": [], "skipped": [], "errors": []}
+    for status, payload in map_concurrently(warm_up, tasks, max_workers):
+        results[status].append(payload)
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -307,7 +387,32 @@ def cache_warmup(
         logger.exception(message)
         return message
 
-    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
+    if current_app.config["CACHE_WARMUP_IN_PROCESS"]:
+        start = time.perf_counter()
+        tasks = []
+        for task in strategy.get_tasks():
+            if task["username"]:
+                tasks.append(task)
+            else:
+                logger.warning("Executor not found for %s", json.dumps(task["payload"]))
+        results = warm_up_charts(tasks)
+        duration_ms = (time.perf_counter() - start) * 1000
+        current_app.config["STATS_LOGGER"].timing(
+            f"cache_warmup.{strategy_name}",
+            duration_ms,
+        )
+        logger.info(
+            "Warmed up %s with %d charts in %.0f ms: %d success, %d skipped, %d errors",
+            strategy_name,
+            len(tasks),
+            duration_ms,
+            len(results["success"]),
+            len(results["skipped"]),
+            len(results["errors"]),
+        )
+        return results
+
+    results = {"scheduled": [], "errors": []}
     for task in strategy.get_tasks():
         username = task["username"]
         payload = json.dumps(task["payload"])
@@ -22,7 +22,12 @@ it needs to call create_app() in order to initialize things properly
 
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import (
+    task_postrun,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 
 # Superset framework imports
 from superset import create_app
@@ -34,6 +39,8 @@ flask_app = create_app()
 # Need to import late, as the celery_app will have been setup by "create_app()"
 # ruff: noqa: E402, F401
 # pylint: disable=wrong-import-position, unused-import
+from superset.utils.webdriver import playwright_pool, webdriver_pool
+
 from . import cache, scheduler
 
 # Export the celery app globally for Celery (as run on the cmd line) to find
@@ -47,6 +54,17 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_browsers(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    """
+    Close the pooled browsers, so that they don't outlive the worker process.
+    """
+    with flask_app.app_context():
+        webdriver_pool.clear()
+        playwright_pool.close()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
@@ -23,9 +23,11 @@ from typing import Any
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
 
 from superset import is_feature_enabled
 from superset.commands.exceptions import CommandException
+from superset.commands.key_value.prune import KeyValuePruneCommand
 from superset.commands.logs.prune import LogPruneCommand
 from superset.commands.report.exceptions import ReportScheduleUnexpectedError
 from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
@@ -129,7 +131,11 @@ def prune_log() -> None:
 
 @celery_app.task(name="prune_query", bind=True)
 def prune_query(
-    self: Task, retention_period_days: int | None = None, **kwargs: Any
+    self: Task,
+    retention_period_days: int | None = None,
+    batch_size: int | None = None,
+    time_budget: float | None = None,
+    **kwargs: Any,
 ) -> None:
     stats_logger: BaseStatsLogger = current_app.config["STATS_LOGGER"]
     stats_logger.incr("prune_query")
@@ -145,14 +151,22 @@ def prune_query(
         )
 
     try:
-        QueryPruneCommand(retention_period_days).run()
+        QueryPruneCommand(
+            retention_period_days,
+            batch_size=batch_size,
+            time_budget=time_budget,
+        ).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning queries: %s", ex)
 
 
 @celery_app.task(name="prune_logs", bind=True)
 def prune_logs(
-    self: Task, retention_period_days: int | None = None, **kwargs: Any
+    self: Task,
+    retention_period_days: int | None = None,
+    batch_size: int | None = None,
+    time_budget: float | None = None,
+    **kwargs: Any,
 ) -> None:
     stats_logger: BaseStatsLogger = current_app.config["STATS_LOGGER"]
     stats_logger.incr("prune_logs")
@@ -168,6 +182,24 @@ def prune_logs(
         )
 
     try:
-        LogPruneCommand(retention_period_days).run()
+        LogPruneCommand(
+            retention_period_days,
+            batch_size=batch_size,
+            time_budget=time_budget,
+        ).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning logs: %s", ex)
+
+
+@celery_app.task(name="prune_key_value")
+def prune_key_value(batch_size: int = 1000) -> None:
+    stats_logger: BaseStatsLogger = current_app.config["STATS_LOGGER"]
+    stats_logger.incr("prune_key_value")
+
+    try:
+        deleted = KeyValuePruneCommand(batch_size=batch_size).run()
+        stats_logger.gauge("prune_key_value.deleted", deleted)
+    except SoftTimeLimitExceeded as ex:
+        logger.warning("A timeout occurred while pruning key-value entries: %s", ex)
+    except SQLAlchemyError:
+        logger.exception("An error occurred while pruning key-value entries")
@@ -0,0 +1,171 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the DataFrames stored in the chart data cache.
+
+Cached query results are dictionaries with the DataFrame under the ``df`` key. By
+default the DataFrame is stored as is and pickled by the cache backend. A codec
+replaces it with an encoded payload and records its name and version under the
+``df_codec`` key, so that entries written by a different codec (or a different
+version of the same codec) can be safely ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_object_dtype
+
+from superset.exceptions import SupersetException
+
+logger = logging.getLogger(__name__)
+
+CODEC_KEY = "df_codec"
+
+
+class DataFrameCacheCodecError(SupersetException):
+    pass
+
+
+class DataFrameCacheCodec(ABC):
+    name: str
+    version: int
+
+    @property
+    def tag(self) -> str:
+        return f"{self.name}:{self.version}"
+
+    def can_encode(self, df: pd.DataFrame) -> bool:  # pylint: disable=unused-argument
+        return True
+
+    @abstractmethod
+    def encode(self, df: pd.DataFrame) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, value: bytes) -> pd.DataFrame: ...
+
+
+class ArrowIPCCacheCodec(DataFrameCacheCodec):
+    """
+    Store DataFrames as columnar Arrow IPC streams.
+
+    The stream is read without copying the cached bytes, but converting it to a
+    DataFrame still copies the columns; the Arrow buffers are released as they are
+    converted, so the peak memory stays close to the size of the DataFrame.
+    """
+
+    name = "arrow_ipc"
+    version = 2
+
+    # Arrow types that object columns can be converted to and back without changing
+    # their values or dtype; eg, integers with nulls would come back as floats
+    LOSSLESS_OBJECT_TYPES = (
+        pa.types.is_null,
+        pa.types.is_string,
+        pa.types.is_large_string,
+        pa.types.is_binary,
+        pa.types.is_large_binary,
+        pa.types.is_date,
+        pa.types.is_time,
+        pa.types.is_decimal,
+    )
+
+    def __init__(self, compression: Literal["lz4", "zstd"] | None = None) -> None:
+        self.compression = compression
+
+    def can_encode(self, df: pd.DataFrame) -> bool:
+        # Arrow stringifies column names and doesn't support duplicate ones, and
+        # object indexes may not come back with the same values
+        return (
+            df.columns.is_unique
+            and all(isinstance(column, str) for column in df.columns)
+            and not is_object_dtype(df.index)
+        )
+
+    def encode(self, df: pd.DataFrame) -> bytes:
+        table = pa.Table.from_pandas(df)
+        for column, dtype in df.dtypes.items():
+            if is_object_dtype(dtype) and not self._is_lossless(table.column(column)):
+                raise DataFrameCacheCodecError(
+                    f"Column {column} can't be encoded without loss"
+                )
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, value: bytes) -> pd.DataFrame:
+        with pa.ipc.open_stream(pa.py_buffer(value)) as reader:
+            table = reader.read_all()
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def _is_lossless(self, column: pa.ChunkedArray) -> bool:
+        if pa.types.is_boolean(column.type):
+            # booleans without nulls come back with a bool dtype
+            return column.null_count > 0
+        return any(check(column.type) for check in self.LOSSLESS_OBJECT_TYPES)
+
+
+def encode_cache_value(
+    value: dict[str, Any],
+    codec: DataFrameCacheCodec | None,
+) -> dict[str, Any]:
+    """
+    Encode the DataFrame in a cache value with the configured codec.
+
+    Falls back to storing the DataFrame as is when it can't be encoded.
+    """
+    df = value.get("df")
+    if codec is None or not isinstance(df, pd.DataFrame) or not codec.can_encode(df):
+        return value
+
+    try:
+        encoded = codec.encode(df)
+    except (DataFrameCacheCodecError, pa.ArrowException, TypeError, ValueError) as ex:
+        logger.warning("Unable to encode DataFrame with %s: %s", codec.tag, ex)
+        return value
+
+    return {**value, "df": encoded, CODEC_KEY: codec.tag}
+
+
+def decode_cache_value(
+    value: dict[str, Any],
+    codec: DataFrameCacheCodec | None,
+) -> pd.DataFrame:
+    """
+    Return the DataFrame in a cache value, decoding it if needed.
+
+    :raises DataFrameCacheCodecError: If the value was encoded by another codec, or
+        can't be decoded
+    """
+    tag = value.get(CODEC_KEY)
+    if tag is None:
+        return value["df"]
+
+    if codec is None or tag != codec.tag:
+        raise DataFrameCacheCodecError(f"Unsupported cache codec: {tag}")
+
+    try:
+        return codec.decode(value["df"])
+    except (pa.ArrowException, OSError) as ex:
+        raise DataFrameCacheCodecError(f"Unable to decode cache value: {ex}") from ex
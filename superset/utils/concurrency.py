@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from flask import current_app as app, g, has_request_context
+from flask.globals import request_ctx
+from sqlalchemy import inspect
+
+from superset.extensions import db
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_semaphores: dict[Any, threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+def copy_flask_context(func: Callable[..., R]) -> Callable[..., R]:
+    """
+    Wrap a function so that it runs with a copy of the current Flask contexts.
+
+    Flask contexts are local to the thread that handles the request, so a function
+    running in another thread doesn't have access to the app, the request or ``g``
+    (eg, ``g.user``). The wrapped function pushes a new app context with a copy of
+    ``g``, and a copy of the request context if there is one.
+
+    Note that the new app context has its own SQLAlchemy session, so ``g.user`` is
+    merged into it; other ORM instances should be merged with ``merge_into_session``.
+    """
+    flask_app = app._get_current_object()  # pylint: disable=protected-access
+    g_values = dict(g.__dict__)
+    request_context = (
+        request_ctx._get_current_object()  # pylint: disable=protected-access
+        if has_request_context()
+        else None
+    )
+
+    @wraps(func)
+    def wrapped(*args: Any, **kwargs: Any) -> R:
+        with flask_app.app_context():
+            for key, value in g_values.items():
+                setattr(g, key, value)
+            if "user" in g_values:
+                g.user = merge_into_session(g_values["user"])
+            with request_context.copy() if request_context else nullcontext():
+                return func(*args, **kwargs)
+
+    return wrapped
+
+
+def merge_into_session(instance: T) -> T:
+    """
+    Merge an ORM instance from another thread into the session of the current thread.
+
+    SQLAlchemy sessions can't be shared between threads, and lazy relationships of
+    an instance are loaded by the session it belongs to. The merged copy keeps the
+    state already loaded, without querying the database, and loads the rest in the
+    session of the current thread. Objects that are not persistent ORM instances
+    are returned as is.
+    """
+    state = inspect(instance, raiseerr=False)
+    if state is None or not getattr(state, "has_identity", False):
+        return instance
+    return db.session.merge(instance, load=False)
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> list[R]:
+    """
+    Apply a function to items in a thread pool, preserving the order of the items.
+
+    Each call runs with a copy of the current Flask contexts. When ``max_workers``
+    is 1 or there's a single item the calls are made serially in the current thread.
+    If a call fails the pending ones are cancelled.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix="superset-worker",
+    )
+    try:
+        results = list(executor.map(copy_flask_context(func), items))
+    except BaseException:
+        # don't wait for the running calls or start the pending ones, eg, when a
+        # time limit is exceeded
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return results
+
+
+@contextmanager
+def concurrency_limit(key: Any, limit: int) -> Iterator[None]:
+    """
+    Limit the number of threads running a block for a given key, eg, a database.
+
+    The limit is per process, and is set by the first caller for a given key.
+    """
+    if limit <= 0:
+        yield
+        return
+
+    with _semaphores_lock:
+        semaphore = _semaphores.setdefault(key, threading.BoundedSemaphore(limit))
+
+    with semaphore:
+        yield
@@ -14,9 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import codecs
 import logging
 import re
 import urllib.request
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -64,6 +66,40 @@ def escape_value(value: str) -> str:
     return value
 
 
+def escape_series(series: pd.Series) -> Optional[np.ndarray]:
+    """
+    Escape the string values of a series, like `escape_value`, with vectorized string
+    operations.
+
+    :returns: The escaped values, or None if no value needs escaping
+    """
+    if series.dtype != np.dtype(object):
+        return None
+
+    values = series.to_numpy()
+    if pd.api.types.infer_dtype(values, skipna=True) == "string":
+        positions = np.flatnonzero(pd.notna(values))
+    else:
+        # only strings are escaped in columns with mixed types
+        positions = np.flatnonzero([isinstance(value, str) for value in values])
+    if not positions.size:
+        return None
+
+    strings = pd.Series(values[positions], dtype=object).str
+    needs_escaping = strings.match(problematic_chars_re.pattern).to_numpy(bool)
+    needs_escaping &= ~strings.match(negative_number_re.pattern).to_numpy(bool)
+    if not needs_escaping.any():
+        return None
+
+    positions = positions[needs_escaping]
+    strings = pd.Series(values[positions], dtype=object).str
+    escaped = values.copy()
+    # Escape pipe to be extra safe as this can lead to remote code execution, and
+    # precede the value with a single quote, see `escape_value`
+    escaped[positions] = ("'" + strings.replace("|", "\\|", regex=False)).to_numpy()
+    return escaped
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
@@ -72,15 +108,51 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    for col_idx in range(len(df.columns)):
+        escaped = escape_series(df.iloc[:, col_idx])
+        if escaped is not None:
+            df.isetitem(col_idx, escaped)
 
     return df.to_csv(escapechar="\\", **kwargs)
 
 
+def dfs_to_escaped_csv_stream(
+    dfs: Iterable[pd.DataFrame],
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Convert dataframes with the same columns to a single escaped CSV, one at a time.
+
+    The header is only written for the first dataframe, and the chunks are encoded
+    incrementally with the `encoding` keyword argument (UTF-8 by default), so that a
+    BOM is only written once.
+    """
+    encoder = codecs.getincrementalencoder(kwargs.get("encoding") or "utf-8")()
+    header = kwargs.pop("header", True)
+    for df in dfs:
+        yield encoder.encode(df_to_escaped_csv(df, header=header, **kwargs))
+        header = False
+
+
+def df_to_escaped_csv_stream(
+    df: pd.DataFrame,
+    chunk_size: int,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Convert a dataframe to escaped CSV in chunks of at most `chunk_size` rows.
+
+    Only one chunk is escaped and converted at a time, instead of the whole dataframe.
+    """
+    return dfs_to_escaped_csv_stream(
+        (
+            df.iloc[start : start + chunk_size]
+            for start in range(0, max(len(df.index), 1), chunk_size)
+        ),
+        **kwargs,
+    )
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[bytes]:
@@ -101,16 +173,26 @@ def get_chart_csv_data(
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = json.loads(content.decode("utf-8"))
+    return chart_data_to_dataframe(result["result"][0])
+
+
+def chart_data_to_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build a DataFrame from the JSON result of a chart data query.
+
+    :param query: A query from the `post_processed` chart data results
+    :returns: The DataFrame, or None if the query returned no data
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +200,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in query["indexnames"]
     )
     return df
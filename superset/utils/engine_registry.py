@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Registry of pooled SQLAlchemy engines.
+
+By default a new engine with a ``NullPool`` is created every time a database is
+used, so every query pays for the dialect setup and for a new connection to the
+database. Databases that opt in with ``pool_connections`` in their extra reuse
+engines from this registry instead, keeping their connection pools alive between
+requests.
+
+The registry is per process. Engines are keyed by database, catalog, schema,
+effective user and a hash of the final URL and engine arguments, so that a change
+to any of them (eg, a new OAuth2 token or a different impersonated user) results in
+a new engine. Engines are disposed of when the database is updated or deleted, or
+when they haven't been used for ``ENGINE_POOL_IDLE_TIMEOUT`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy.engine import Engine
+
+from superset.extensions import stats_logger_manager
+
+logger = logging.getLogger(__name__)
+
+EngineKey = tuple[int, str | None, str | None, str | None, str]
+
+
+@dataclass
+class EngineEntry:
+    engine: Engine
+    last_used: float
+
+
+class EngineRegistry:
+    def __init__(self) -> None:
+        self._reset()
+        # pooled connections can't be shared with the parent process
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[EngineKey, EngineEntry] = {}
+
+    def get_engine(
+        self,
+        key: EngineKey,
+        create_engine: Callable[[], Engine],
+        idle_timeout: int,
+    ) -> Engine:
+        """
+        Return the engine for a key, creating it if needed.
+
+        :param key: The key of the engine
+        :param create_engine: A function that creates the engine
+        :param idle_timeout: Dispose of engines unused for this many seconds
+        :returns: The engine
+        """
+        stats_logger = stats_logger_manager.instance
+        now = time.monotonic()
+        with self._lock:
+            idle = self._pop_idle(now, idle_timeout)
+            entry = self._entries.get(key)
+            if entry:
+                entry.last_used = now
+        self._dispose(idle)
+
+        if entry:
+            stats_logger.incr("engine_registry.hit")
+        else:
+            stats_logger.incr("engine_registry.miss")
+            engine = create_engine()
+            with self._lock:
+                entry = self._entries.setdefault(key, EngineEntry(engine, now))
+            if entry.engine is not engine:
+                # another thread created the engine in the meantime
+                engine.dispose()
+
+        self._report(stats_logger)
+        return entry.engine
+
+    def evict(self, database_id: int) -> None:
+        """
+        Dispose of all the engines of a database.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == database_id]
+            evicted = [self._entries.pop(key) for key in keys]
+        self._dispose(evicted)
+
+    def clear(self) -> None:
+        """
+        Dispose of all the engines.
+        """
+        with self._lock:
+            evicted = list(self._entries.values())
+            self._entries.clear()
+        self._dispose(evicted)
+
+    def _pop_idle(self, now: float, idle_timeout: int) -> list[EngineEntry]:
+        if idle_timeout <= 0:
+            return []
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.last_used > idle_timeout
+        ]
+        return [self._entries.pop(key) for key in keys]
+
+    def _dispose(self, entries: list[EngineEntry]) -> None:
+        for entry in entries:
+            stats_logger_manager.instance.incr("engine_registry.evicted")
+            try:
+                entry.engine.dispose()
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to dispose of engine", exc_info=True)
+
+    def _report(self, stats_logger: Any) -> None:
+        with self._lock:
+            pools = [entry.engine.pool for entry in self._entries.values()]
+        stats_logger.gauge("engine_registry.engines", len(pools))
+        stats_logger.gauge(
+            "engine_registry.checked_out",
+            sum(pool.checkedout() for pool in pools if hasattr(pool, "checkedout")),
+        )
+
+
+engine_registry = EngineRegistry()
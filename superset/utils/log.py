@@ -16,17 +16,22 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -72,6 +77,22 @@ def collect_request_payload() -> dict[str, Any]:
     return payload
 
 
+def get_request_form_data() -> dict[str, Any]:
+    """
+    Get the form data of the request, parsed only once for all the events it logs.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.views.core import get_form_data
+
+    if not has_request_context():
+        form_data, _ = get_form_data()
+        return form_data
+
+    if "logged_form_data" not in g:
+        g.logged_form_data, _ = get_form_data()
+    return g.logged_form_data
+
+
 def get_logger_from_status(
     status: int,
 ) -> tuple[Callable[..., None], str]:
@@ -182,7 +203,6 @@ class AbstractEventLogger(ABC):
     ) -> None:
         # pylint: disable=import-outside-toplevel
         from superset import db
-        from superset.views.core import get_form_data
 
         referrer = request.referrer[:1000] if request and request.referrer else None
 
@@ -220,7 +240,7 @@ class AbstractEventLogger(ABC):
 
         form_data: dict[str, Any] = {}
         if "form_data" in payload:
-            form_data, _ = get_form_data()
+            form_data = get_request_form_data()
             payload["form_data"] = form_data
             slice_id = form_data.get("slice_id")
         else:
@@ -369,6 +389,37 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
+    @staticmethod
+    def get_log_values(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return the column values of the `Log` rows for a list of records"""
+        values = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            values.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return values
+
     def log(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         user_id: int | None,
@@ -384,24 +435,18 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+        logs = [
+            Log(**values)
+            for values in self.get_log_values(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
             )
-            logs.append(log)
+        ]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -410,6 +455,142 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that writes logs to Superset DB in batches, from a background thread.
+
+    Logs are queued in memory and a daemon thread inserts them every
+    `flush_interval` seconds, or as soon as `batch_size` logs are queued, using its
+    own connection to the metadata database. When the queue is full logs are
+    dropped, unless `block_timeout` is set, in which case the request waits up to
+    `block_timeout` seconds for the queue to drain before dropping them.
+
+    Logs still queued when the process is killed are lost.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_queue_size: int = 10_000,
+        block_timeout: float = 0,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+        self.block_timeout = block_timeout
+        self._reset()
+        # the flusher thread doesn't survive a fork, eg, of a preloaded Gunicorn app
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.flush)
+
+    def _reset(self) -> None:
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(self.max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._app: Flask | None = None
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._start_flusher()
+        # logs are written later, so the time of the event has to be set now
+        dttm = datetime.utcnow()
+        for values in self.get_log_values(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        ):
+            try:
+                self._queue.put(
+                    {**values, "dttm": dttm},
+                    block=self.block_timeout > 0,
+                    timeout=self.block_timeout or None,
+                )
+            except queue.Full:
+                stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _start_flusher(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._app = current_app._get_current_object()  # pylint: disable=protected-access
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="superset-event-logger",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            if batch := self._get_batch():
+                self._write(batch)
+
+    def _get_batch(self) -> list[dict[str, Any]]:
+        """Wait for a full batch of logs, or until the flush interval is over"""
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self) -> None:
+        """Write all the queued logs from the current thread"""
+        batch: list[dict[str, Any]] = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            if len(batch) == self.batch_size:
+                self._write(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        stats_logger_manager.instance.gauge(
+            "event_logger.queue_depth",
+            self._queue.qsize(),
+        )
+        if self._app is None:
+            return
+
+        try:
+            with self._app.app_context():
+                with db.engine.begin() as connection:
+                    connection.execute(Log.__table__.insert(), batch)
+        except SQLAlchemyError as ex:
+            logging.error("AsyncDBEventLogger failed to log %i event(s)", len(batch))
+            logging.exception(ex)
+            stats_logger_manager.instance.incr("event_logger.failed")
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -0,0 +1,172 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache for the partition lookups of the Presto and Hive engine specs.
+
+The ``latest_partition`` and ``latest_sub_partition`` Jinja macros read the indexes
+of the table and run a partition query on every render, so a dashboard where many
+charts use them runs the same metadata queries over and over. Lookups are cached
+per process for ``PARTITION_CACHE_TIMEOUT`` seconds, keyed by database, catalog,
+schema and table, and concurrent lookups of the same key share a single query.
+
+Entries can be invalidated through the API. Since the entries are per process, the
+invalidation bumps a generation counter stored in the cache defined in
+``CACHE_CONFIG``, which is part of the key of the entries, so that other processes
+sharing that cache stop using their stale entries too.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from concurrent.futures import Future
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+
+from flask import current_app as app
+
+from superset.extensions import cache_manager, stats_logger_manager
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+    from superset.sql.parse import Table
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TableKey = tuple[int, str | None, str | None, str]
+
+
+def _get_generation_key(database_id: int, table: TableKey | None = None) -> str:
+    if table is None:
+        return f"partition_cache_generation_{database_id}"
+    _, catalog, schema, name = table
+    return f"partition_cache_generation_{database_id}_{catalog}_{schema}_{name}"
+
+
+class PartitionCache:
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, Future[Any]] = {}
+
+    def get(
+        self,
+        database: Database,
+        table: Table,
+        variant: Hashable,
+        load: Callable[[], T],
+    ) -> T:
+        """
+        Return a cached partition lookup, or load it.
+
+        :param database: The database of the table
+        :param table: The table
+        :param variant: Identifies the lookup, eg, ``("indexes",)``
+        :param load: A function performing the lookup
+        :returns: The result of the lookup
+        """
+        timeout = app.config["PARTITION_CACHE_TIMEOUT"]
+        if timeout <= 0:
+            return load()
+
+        table_key: TableKey = (database.id, table.catalog, table.schema, table.table)
+        key = (table_key, self._get_generation(table_key), variant)
+        stats_logger = stats_logger_manager.instance
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                stats_logger.incr("partition_cache.hit")
+                return entry[1]
+
+            if future := self._inflight.get(key):
+                owner = False
+            else:
+                future = self._inflight[key] = Future()
+                owner = True
+
+        if not owner:
+            # another thread is running the same lookup
+            stats_logger.incr("partition_cache.wait")
+            return future.result()
+
+        stats_logger.incr("partition_cache.miss")
+        try:
+            value = load()
+        except Exception as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(value)
+            with self._lock:
+                self._entries[key] = (time.monotonic() + timeout, value)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self, database_id: int, table: Table | None = None) -> None:
+        """
+        Invalidate the lookups of a table, or of a whole database.
+        """
+        table_key = (
+            (database_id, table.catalog, table.schema, table.table) if table else None
+        )
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0][0] == database_id and table_key in (None, key[0])
+            ]
+            for key in stale:
+                del self._entries[key]
+
+        cache_manager.cache.set(
+            _get_generation_key(database_id, table_key),
+            uuid.uuid4().hex,
+            timeout=0,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _get_generation(table_key: TableKey) -> tuple[Any, ...]:
+        return tuple(
+            cache_manager.cache.get_many(
+                _get_generation_key(table_key[0]),
+                _get_generation_key(table_key[0], table_key),
+            )
+        )
+
+
+partition_cache = PartitionCache()
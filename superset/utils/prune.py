@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Bounded-memory deletion of old rows from large tables.
+
+Rows are deleted in batches walking the primary key: each batch looks up the upper
+bound of the next ``batch_size`` matching rows, and deletes the matching rows up to
+that bound with a range condition. Only two ids are held in memory at any time, and
+neither statement has a long ``IN`` list, which most databases (and SQLite in
+particular) handle poorly.
+
+Each batch is committed on its own, so an interrupted run keeps the rows deleted so
+far, and running it again picks up where it stopped.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import sqlalchemy as sa
+from flask import current_app
+from sqlalchemy.sql.elements import ColumnElement
+
+from superset import db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PruneResult:
+    deleted: int
+    elapsed: float
+    # ``False`` when the time budget ran out before all the rows were deleted
+    completed: bool
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed else 0
+
+
+class TablePruner:  # pylint: disable=too-few-public-methods
+    """
+    Delete the rows of a model matching a condition in committed batches.
+
+    :param name: The name used in the logs and metrics, eg, ``prune_logs``
+    :param model: The model, which must have a single-column primary key
+    :param condition: The rows to delete, eg, ``Log.dttm < cutoff``
+    :param batch_size: The maximum number of rows deleted in each statement
+    :param time_budget: Stop after this many seconds, and don't limit it if ``None``
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        model: type[Any],
+        condition: ColumnElement[bool],
+        batch_size: int | None = None,
+        time_budget: float | None = None,
+    ) -> None:
+        self.name = name
+        self.table = model.__table__
+        (self.pk,) = self.table.primary_key.columns
+        self.condition = condition
+        self.batch_size = batch_size or current_app.config["PRUNE_BATCH_SIZE"]
+        self.time_budget = (
+            time_budget
+            if time_budget is not None
+            else current_app.config["PRUNE_TIME_BUDGET"]
+        )
+
+    def _next_bound(self, cursor: Any) -> Any:
+        """
+        Return the primary key of the last row of the next batch, or ``None`` if
+        fewer than ``batch_size`` rows remain.
+        """
+        query = (
+            sa.select(self.pk)
+            .where(self._after(cursor), self.condition)
+            .order_by(self.pk)
+            .offset(self.batch_size - 1)
+            .limit(1)
+        )
+        return db.session.execute(query).scalar()
+
+    def _after(self, cursor: Any) -> ColumnElement[bool]:
+        return self.pk > cursor if cursor is not None else sa.true()
+
+    def run(self) -> PruneResult:
+        stats_logger = current_app.config["STATS_LOGGER"]
+        start = time.monotonic()
+        cursor = None
+        deleted = 0
+        completed = False
+
+        while True:
+            bound = self._next_bound(cursor)
+            where = [self._after(cursor), self.condition]
+            if bound is not None:
+                where.append(self.pk <= bound)
+
+            result = db.session.execute(sa.delete(self.table).where(*where))
+            # commit each batch, so that the rows deleted so far are kept if an
+            # error occurs, and to avoid holding locks for a long time
+            db.session.commit()  # pylint: disable=consider-using-transaction
+            deleted += result.rowcount
+            cursor = bound
+
+            elapsed = time.monotonic() - start
+            logger.debug(
+                "%s: deleted %s rows from %s (%.0f rows/s)",
+                self.name,
+                f"{deleted:,}",
+                self.table.name,
+                deleted / elapsed if elapsed else 0,
+            )
+
+            if bound is None:
+                completed = True
+                break
+            if self.time_budget is not None and elapsed >= self.time_budget:
+                logger.warning(
+                    "%s: time budget of %s seconds exhausted, the remaining rows "
+                    "will be deleted by the next run",
+                    self.name,
+                    self.time_budget,
+                )
+                break
+
+        prune_result = PruneResult(
+            deleted=deleted,
+            elapsed=time.monotonic() - start,
+            completed=completed,
+        )
+        logger.info(
+            "%s: deleted %s rows from %s in %.1f seconds (%.0f rows/s)",
+            self.name,
+            f"{prune_result.deleted:,}",
+            self.table.name,
+            prune_result.elapsed,
+            prune_result.rows_per_second,
+        )
+        stats_logger.gauge(f"{self.name}.deleted", prune_result.deleted)
+        stats_logger.gauge(f"{self.name}.rows_per_second", prune_result.rows_per_second)
+        stats_logger.timing(f"{self.name}.time", prune_result.elapsed * 1000)
+        return prune_result
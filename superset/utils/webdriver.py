@@ -18,10 +18,17 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask import current_app as app
 from packaging import version
@@ -39,7 +46,7 @@ from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import WebDriverWait
 
 from superset import feature_flag_manager
-from superset.extensions import machine_auth_provider_factory
+from superset.extensions import machine_auth_provider_factory, stats_logger_manager
 from superset.utils.retries import retry_call
 
 WindowSize = tuple[int, int]
@@ -50,10 +57,12 @@ if TYPE_CHECKING:
 
 if feature_flag_manager.is_feature_enabled("PLAYWRIGHT_REPORTS_AND_THUMBNAILS"):
     from playwright.sync_api import (
+        Browser,
         BrowserContext,
         Error as PlaywrightError,
         Locator,
         Page,
+        Playwright,
         sync_playwright,
         TimeoutError as PlaywrightTimeout,
     )
@@ -136,26 +145,43 @@ class WebDriverPlaywright(WebDriverProxy):
 
         return error_messages
 
+    def create_context(self, browser: Browser, user: User) -> BrowserContext:
+        pixel_density = app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        context = browser.new_context(
+            bypass_csp=True,
+            viewport={
+                "height": self._window[1],
+                "width": self._window[0],
+            },
+            device_scale_factor=pixel_density,
+        )
+        context.set_default_timeout(app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"])
+        self.auth(user, context)
+        return context
+
+    @contextmanager
+    def new_page(self, user: User) -> Iterator[Page]:
+        """
+        Open a page as the user, in a pooled browser when the pool is enabled.
+        """
+        if app.config["SCREENSHOT_WEBDRIVER_POOL_SIZE"] > 0:
+            with playwright_pool.new_page(
+                (user.id, self._window),
+                lambda browser: self.create_context(browser, user),
+            ) as page:
+                yield page
+            return
+
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(
+                args=app.config["WEBDRIVER_OPTION_ARGS"]
+            )
+            yield self.create_context(browser, user).new_page()
+
     def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
         self, url: str, element_name: str, user: User
     ) -> bytes | None:
-        with sync_playwright() as playwright:
-            browser_args = app.config["WEBDRIVER_OPTION_ARGS"]
-            browser = playwright.chromium.launch(args=browser_args)
-            pixel_density = app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
-            context = browser.new_context(
-                bypass_csp=True,
-                viewport={
-                    "height": self._window[1],
-                    "width": self._window[0],
-                },
-                device_scale_factor=pixel_density,
-            )
-            context.set_default_timeout(
-                app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
-            )
-            self.auth(user, context)
-            page = context.new_page()
+        with self.new_page(user) as page:
             try:
                 page.goto(
                     url,
@@ -381,16 +407,34 @@ class WebDriverSelenium(WebDriverProxy):
 
         return error_messages
 
+    def acquire(self, user: User) -> WebDriver:
+        """
+        Return an authenticated driver, from the pool when it's enabled.
+        """
+        if app.config["SCREENSHOT_WEBDRIVER_POOL_SIZE"] > 0:
+            return webdriver_pool.acquire(
+                (self._driver_type, user.id),
+                lambda: self.auth(user),
+            )
+        return self.auth(user)
+
+    def release(self, driver: WebDriver, discard: bool = False) -> None:
+        if app.config["SCREENSHOT_WEBDRIVER_POOL_SIZE"] > 0:
+            webdriver_pool.release(driver, discard)
+        else:
+            self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:  # noqa: C901
-        driver = self.auth(user)
-        driver.set_window_size(*self._window)
-        driver.get(url)
+        driver = self.acquire(user)
         img: bytes | None = None
-        selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-        logger.debug("Sleeping for %i seconds", selenium_headstart)
-        sleep(selenium_headstart)
 
         try:
+            driver.set_window_size(*self._window)
+            driver.get(url)
+            selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+            logger.debug("Sleeping for %i seconds", selenium_headstart)
+            sleep(selenium_headstart)
+
             try:
                 # page didn't load
                 logger.debug(
@@ -479,5 +523,205 @@ class WebDriverSelenium(WebDriverProxy):
             )
             raise
         finally:
-            self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+            self.release(driver, discard=img is None)
         return img
+
+
+@dataclass
+class PooledWebDriver:
+    driver: WebDriver
+    key: tuple[str, int]
+    uses: int = 0
+    last_used: float = 0
+
+
+class WebDriverPool:
+    """
+    A per-process pool of authenticated Selenium drivers.
+
+    Starting a browser and logging in often takes longer than the screenshot itself,
+    so drivers are kept after use and reused for the screenshots of the same user. A
+    driver is recycled after `SCREENSHOT_WEBDRIVER_POOL_MAX_USES` screenshots or after
+    being idle for `SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT` seconds, and is discarded
+    when a screenshot fails. Each driver is used by a single thread at a time.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+        # the drivers of the parent process can't be shared
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: list[PooledWebDriver] = []
+        self._in_use: dict[int, PooledWebDriver] = {}
+
+    def acquire(
+        self,
+        key: tuple[str, int],
+        create: Callable[[], WebDriver],
+    ) -> WebDriver:
+        """
+        Return an idle driver for the key, or create a new one.
+        """
+        deadline = (
+            time.monotonic() - app.config["SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT"]
+        )
+        with self._lock:
+            expired = [item for item in self._idle if item.last_used < deadline]
+            self._idle = [item for item in self._idle if item.last_used >= deadline]
+            pooled = next((item for item in self._idle if item.key == key), None)
+            if pooled:
+                self._idle.remove(pooled)
+        self._destroy([item.driver for item in expired])
+
+        stats_logger = stats_logger_manager.instance
+        if pooled:
+            stats_logger.incr("webdriver_pool.hit")
+        else:
+            stats_logger.incr("webdriver_pool.miss")
+            pooled = PooledWebDriver(create(), key)
+
+        pooled.uses += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver: WebDriver, discard: bool = False) -> None:
+        """
+        Return a driver to the pool, or destroy it if it failed or is worn out.
+        """
+        destroyed = []
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+            if (
+                pooled
+                and not discard
+                and pooled.uses < app.config["SCREENSHOT_WEBDRIVER_POOL_MAX_USES"]
+            ):
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+                # keep the most recently used drivers
+                while len(self._idle) > app.config["SCREENSHOT_WEBDRIVER_POOL_SIZE"]:
+                    destroyed.append(self._idle.pop(0).driver)
+            else:
+                destroyed.append(driver)
+            idle = len(self._idle)
+
+        stats_logger_manager.instance.gauge("webdriver_pool.idle", idle)
+        self._destroy(destroyed)
+
+    def clear(self) -> None:
+        """
+        Destroy all the idle drivers.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        self._destroy([item.driver for item in idle])
+
+    @staticmethod
+    def _destroy(drivers: list[WebDriver]) -> None:
+        for driver in drivers:
+            stats_logger_manager.instance.incr("webdriver_pool.recycled")
+            WebDriverSelenium.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
+
+@dataclass
+class PooledBrowser:
+    playwright: Playwright
+    browser: Browser
+    contexts: OrderedDict[Any, BrowserContext]
+    uses: int = 0
+    last_used: float = 0
+
+
+class PlaywrightBrowserPool:
+    """
+    Per-thread Playwright browsers, with their authenticated contexts.
+
+    The sync Playwright API can only be used from the thread that started it, so each
+    thread keeps its own browser, with up to `SCREENSHOT_WEBDRIVER_POOL_SIZE`
+    authenticated contexts. A new page is opened in the context for each screenshot.
+    Browsers are recycled with the same policy as the Selenium drivers, and when a
+    screenshot fails.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    @contextmanager
+    def new_page(
+        self,
+        key: Any,
+        create_context: Callable[[Browser], BrowserContext],
+    ) -> Iterator[Page]:
+        pooled = self._get_browser()
+        stats_logger = stats_logger_manager.instance
+        if context := pooled.contexts.get(key):
+            stats_logger.incr("webdriver_pool.hit")
+            pooled.contexts.move_to_end(key)
+        else:
+            stats_logger.incr("webdriver_pool.miss")
+            context = pooled.contexts[key] = create_context(pooled.browser)
+            while len(pooled.contexts) > app.config["SCREENSHOT_WEBDRIVER_POOL_SIZE"]:
+                _, oldest = pooled.contexts.popitem(last=False)
+                oldest.close()
+
+        pooled.uses += 1
+        page = context.new_page()
+        try:
+            yield page
+        except Exception:
+            # the browser might be in a bad state
+            self._close()
+            raise
+
+        pooled.last_used = time.monotonic()
+        page.close()
+
+    def close(self) -> None:
+        """
+        Close the browser of the current thread.
+        """
+        self._close()
+
+    def _get_browser(self) -> PooledBrowser:
+        pooled: PooledBrowser | None = getattr(self._local, "browser", None)
+        if pooled and (
+            pooled.uses >= app.config["SCREENSHOT_WEBDRIVER_POOL_MAX_USES"]
+            or time.monotonic() - pooled.last_used
+            > app.config["SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT"]
+            or not pooled.browser.is_connected()
+        ):
+            self._close()
+            pooled = None
+
+        if pooled is None:
+            playwright = sync_playwright().start()
+            browser = playwright.chromium.launch(
+                args=app.config["WEBDRIVER_OPTION_ARGS"]
+            )
+            pooled = self._local.browser = PooledBrowser(
+                playwright,
+                browser,
+                OrderedDict(),
+                last_used=time.monotonic(),
+            )
+        return pooled
+
+    def _close(self) -> None:
+        pooled: PooledBrowser | None = getattr(self._local, "browser", None)
+        if pooled is None:
+            return
+
+        self._local.browser = None
+        stats_logger_manager.instance.incr("webdriver_pool.recycled")
+        try:
+            pooled.browser.close()
+            pooled.playwright.stop()
+        except PlaywrightError:
+            logger.warning("Unable to close the browser", exc_info=True)
+
+
+webdriver_pool = WebDriverPool()
+playwright_pool = PlaywrightBrowserPool()
@@ -29,7 +29,7 @@ from flask_babel import _
 from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
-from superset import dataframe, db, result_set, viz
+from superset import dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -45,6 +45,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import read_results_batches, RESULTS_BATCHES_KEY
 from superset.superset_typing import FormData
 from superset.utils import json
 from superset.utils.core import DatasourceType
@@ -505,8 +506,18 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize the results of a query from the results backend.
+
+    When `offset` or `limit` are set only these rows are returned, and for results
+    stored in batches only the batches with these rows are read.
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -516,8 +527,21 @@ def _deserialize_results_payload(
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
             try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
+                if RESULTS_BATCHES_KEY in ds_payload:
+                    pa_table = read_results_batches(
+                        results_backend,
+                        query.results_key,
+                        ds_payload.pop(RESULTS_BATCHES_KEY),
+                        offset,
+                        limit,
+                    )
+                    if pa_table is None:
+                        raise SerializationError("Unable to read table batches")
+                else:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                    if offset or limit is not None:
+                        pa_table = pa_table.slice(offset, limit)
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
@@ -539,7 +563,12 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if (offset or limit is not None) and ds_payload.get("data") is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+    return ds_payload
 
 
 def get_cta_schema_name(
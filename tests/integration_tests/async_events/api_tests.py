@@ -115,6 +115,18 @@ class TestAsyncEventApi(SupersetTestCase):
         }
         assert response == expected
 
+    def _test_events_invalid_timeout_logic(self, mock_cache):
+        for timeout in ("nan", "inf", "-inf"):
+            rv = self.client.get(f"api/v1/async_event/?timeout={timeout}")
+            assert rv.status_code == 400
+        mock_cache.xread.assert_not_called()
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_invalid_timeout(self, mock_uuid4):
+        self.run_test_with_cache_backend(
+            RedisCacheBackend, self._test_events_invalid_timeout_logic
+        )
+
     @mock.patch("uuid.uuid4", return_value=UUID)
     def test_events_redis_cache_backend(self, mock_uuid4):
         self.run_test_with_cache_backend(RedisCacheBackend, self._test_events_logic)
@@ -358,6 +358,49 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.status_code == 200
         assert rv.mimetype == "text/csv"
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_config({"CSV_STREAMING_CHUNK_SIZE": 10})
+    def test_with_csv_result_format_streaming(self):
+        """
+        Chart data API: Test chart data with CSV result format streamed in chunks
+        """
+        self.query_context_payload["result_format"] = "csv"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/csv"
+        # streamed responses have no known length
+        assert "Content-Length" not in rv.headers
+        data = rv.get_data(as_text=True)
+
+        with mock.patch.dict(app.config, {"CSV_STREAMING_CHUNK_SIZE": 0}):
+            rv = self.post_assert_metric(
+                CHART_DATA_URI, self.query_context_payload, "data"
+            )
+        assert "Content-Length" in rv.headers
+
+        # the BOM and the header are only written once
+        assert data == rv.get_data(as_text=True)
+        assert data.count("\ufeff") == 1
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_config({"CSV_STREAMING_CHUNK_SIZE": 10})
+    def test_with_multi_query_csv_result_format_streaming(self):
+        """
+        Chart data API: Test chart data with multi-query CSV result format streamed
+        in chunks
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
+        assert zipfile.read("query_1.csv") == zipfile.read("query_2.csv")
+        assert zipfile.read("query_1.csv").count(b"\xef\xbb\xbf") == 1
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_excel_result_format(self):
         """
@@ -71,6 +71,29 @@ def test_caching_flow(app_context: AppContext, cache: SupersetMetastoreCache) ->
     assert cache.get(SECOND_KEY) == SECOND_VALUE
 
 
+def test_bulk_operations(
+    app_context: AppContext, cache: SupersetMetastoreCache
+) -> None:
+    assert cache.set_many({FIRST_KEY: FIRST_KEY_INITIAL_VALUE, SECOND_KEY: 0}) == [
+        FIRST_KEY,
+        SECOND_KEY,
+    ]
+    assert cache.get_many(FIRST_KEY, "missing", SECOND_KEY) == [
+        FIRST_KEY_INITIAL_VALUE,
+        None,
+        0,
+    ]
+    assert cache.has(SECOND_KEY) is True
+    cache.set_many({FIRST_KEY: FIRST_KEY_UPDATED_VALUE})
+    assert cache.get(FIRST_KEY) == FIRST_KEY_UPDATED_VALUE
+    assert set(cache.delete_many(FIRST_KEY, SECOND_KEY, "missing")) == {
+        FIRST_KEY,
+        SECOND_KEY,
+    }
+    assert cache.get_many(FIRST_KEY, SECOND_KEY) == [None, None]
+    assert cache.has(SECOND_KEY) is False
+
+
 def test_expiry(app_context: AppContext, cache: SupersetMetastoreCache) -> None:
     delta = timedelta(days=90)
     dttm = datetime(2022, 3, 18, 0, 0, 0)
@@ -482,3 +482,53 @@ class TestSqlLabApi(SupersetTestCase):
         assert data == expected_data, f"CSV data mismatch. Got: {data}"
         db.session.delete(query_obj)
         db.session.commit()
+
+    @mock.patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)  # noqa: PT008
+    @mock.patch("superset.commands.sql_lab.export.results_backend", None)
+    @mock.patch("superset.models.core.Database.iter_df")
+    def test_export_results_streaming(self, iter_df_mock: mock.Mock) -> None:
+        self.login(ADMIN_USERNAME)
+
+        database = get_example_database()
+        query_obj = Query(
+            client_id="test",
+            database=database,
+            tab_name="test_tab",
+            sql_editor_id="test_editor_id",
+            sql="select * from bar",
+            select_sql=None,
+            executed_sql="select * from bar limit 3",
+            limit=100,
+            select_as_cta=False,
+            rows=104,
+            error_message="none",
+            results_key="test_abc",
+        )
+
+        db.session.add(query_obj)
+        db.session.commit()
+
+        iter_df_mock.return_value = iter(
+            [
+                pd.DataFrame({"foo": [1, 2], "姓名": ["张", "李"]}),
+                pd.DataFrame({"foo": [3], "姓名": ["王"]}),
+            ]
+        )
+
+        with mock.patch.dict(app.config, {"CSV_STREAMING_CHUNK_SIZE": 2}):
+            with mock.patch("superset.sqllab.api.logger") as logger_mock:
+                rv = self.client.get("/api/v1/sqllab/export/test/")
+                assert rv.status_code == 200
+                assert "Content-Length" not in rv.headers
+                resp = rv.get_data(as_text=True)
+
+        # the BOM and the header are only written once
+        assert resp == "\ufefffoo,姓名\n1,张\n2,李\n3,王\n"
+        assert iter_df_mock.call_args.kwargs == {"chunk_size": 2, "limit": 3}
+
+        # the export is logged once all the rows have been sent
+        event_info = logger_mock.debug.call_args.kwargs["extra"]["superset_event"]
+        assert event_info["row_count"] == 3
+
+        db.session.delete(query_obj)
+        db.session.commit()
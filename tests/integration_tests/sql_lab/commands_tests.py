@@ -245,6 +245,61 @@ class TestSqlResultExportCommand(SupersetTestCase):
         assert result["count"] == 5
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend", None)
+    @patch("superset.models.core.Database.iter_df")
+    def test_stream_no_results_backend(self, iter_df_mock: Mock) -> None:
+        query_obj = db.session.query(Query).filter_by(client_id="test").one()
+        query_obj.executed_sql = "select * from bar limit 3"
+        query_obj.select_sql = None
+        query_obj.limiting_factor = LimitingFactor.DROPDOWN
+        db.session.commit()
+
+        command = export.SqlResultExportCommand("test")
+
+        iter_df_mock.return_value = iter(
+            [pd.DataFrame({"foo": [1, 2]}), pd.DataFrame({"foo": [3]})]
+        )
+        result = command.stream(2)
+
+        assert result["query"].client_id == "test"
+        assert command.count == 0
+        assert b"".join(result["data"]) == b"\xef\xbb\xbffoo\n1\n2\n3\n"
+        assert command.count == 3
+        iter_df_mock.assert_called_once_with(
+            "select * from bar limit 3",
+            query_obj.catalog,
+            query_obj.schema,
+            chunk_size=2,
+            limit=2,
+        )
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", False)
+    @patch("superset.models.core.Database.iter_df")
+    def test_stream_with_results_backend(self, iter_df_mock: Mock) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        data = [{"foo": i} for i in range(5)]
+        payload = {
+            "columns": [{"name": "foo"}],
+            "data": data,
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        compressed = utils.zlib_compress(serialized_payload)
+
+        with patch("superset.commands.sql_lab.export.results_backend") as backend:
+            backend.get.return_value = compressed
+            result = command.stream(2)
+            chunks = list(result["data"])
+
+        # the header and the BOM are only written once
+        assert chunks == [b"\xef\xbb\xbffoo\n0\n1\n", b"2\n3\n", b"4\n"]
+        assert command.count == 5
+        iter_df_mock.assert_not_called()
+
 
 class TestSqlExecutionResultsCommand(SupersetTestCase):
     @pytest.fixture
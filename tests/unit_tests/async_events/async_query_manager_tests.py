@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
 from unittest import mock
 from unittest.mock import ANY, Mock
 
@@ -166,3 +167,51 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_read_events_long_polling(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xrange.return_value = []
+    cache.xread.return_value = [
+        [
+            b"async-events-test_channel_id",
+            [(b"1607477697866-0", {b"data": b'{"job_id": "job"}'})],
+        ]
+    ]
+    async_query_manager._cache = cache
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._long_polling_slots = threading.BoundedSemaphore(1)
+
+    events = async_query_manager.read_events(
+        "test_channel_id", "1607477697865-0", timeout=30
+    )
+
+    assert events == [{"id": "1607477697866-0", "job_id": "job"}]
+    cache.xread.assert_called_once_with(
+        {"async-events-test_channel_id": "1607477697865-0"}, 100, 10000
+    )
+    # the slot was released
+    assert async_query_manager._long_polling_slots.acquire(blocking=False)
+
+
+def test_read_events_long_polling_skipped(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xrange.return_value = [
+        (b"1607477697866-0", {b"data": b'{"job_id": "job"}'}),
+    ]
+    async_query_manager._cache = cache
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._long_polling_slots = threading.BoundedSemaphore(1)
+
+    # there are events already
+    assert async_query_manager.read_events("test_channel_id", None, timeout=30) == [
+        {"id": "1607477697866-0", "job_id": "job"}
+    ]
+
+    # all the slots are in use
+    cache.xrange.return_value = []
+    async_query_manager._long_polling_slots.acquire()
+    assert async_query_manager.read_events("test_channel_id", None, timeout=30) == []
+
+    cache.xread.assert_not_called()
@@ -18,6 +18,7 @@ import io
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import pytest
 from werkzeug.datastructures import FileStorage
 
@@ -371,3 +372,38 @@ def test_csv_reader_file_metadata_invalid_file():
         "Parsing error: Error tokenizing data. C error:"
         " Expected 3 fields in line 3, saw 7\n"
     )
+
+
+def test_csv_reader_file_to_dataframes_type_change(mocker):
+    """
+    Test that the chunks have the types that fit the whole file, even when the
+    type of a column changes after the first chunk.
+    """
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.READ_CSV_CHUNK_SIZE", 2
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_data_types={"Score": "float64"}),
+    )
+    chunks = list(
+        csv_reader.file_to_dataframes(
+            create_csv_file(
+                [
+                    ["Name", "Age", "Nickname", "Score"],
+                    ["name1", "30", "", "1"],
+                    ["name2", "31", "", "2"],
+                    ["name3", "unknown", "nick3", "3"],
+                ]
+            )
+        )
+    )
+
+    assert len(chunks) == 2
+    for chunk in chunks:
+        assert chunk.dtypes.to_dict() == {
+            "Name": np.dtype("O"),
+            "Age": np.dtype("O"),
+            "Nickname": np.dtype("O"),
+            "Score": np.dtype("float64"),
+        }
+    assert pd.concat(chunks)["Age"].tolist() == ["30", "31", "unknown"]
@@ -36,6 +36,7 @@ from superset.reports.models import (
 )
 from superset.utils.core import HeaderDataType
 from superset.utils.screenshots import ChartScreenshot
+from tests.conftest import with_config
 from tests.integration_tests.conftest import with_feature_flags
 
 
@@ -557,3 +558,45 @@ def test_update_recipient_to_slack_v2_missing_channels(mocker: MockerFixture):
     )
     with pytest.raises(UpdateFailedError):
         mock_cmmd.update_report_schedule_slack_v2()
+
+
+@with_config({"ALERT_REPORTS_IN_PROCESS_DATA": True})
+def test_get_csv_data_in_process(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the CSV data of a report is generated in the worker.
+    """
+    mock_report_schedule: ReportSchedule = mocker.Mock(spec=ReportSchedule)
+    mock_report_schedule.chart_id = 123
+    mock_report_schedule.chart.query_context = json.dumps({"queries": [{}]})
+    mock_report_schedule.chart.params = json.dumps({"viz_type": "line"})
+    mock_report_schedule.force_screenshot = False
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("owner", "admin"),
+    )
+    mocker.patch("superset.commands.report.execute.security_manager")
+    schema = mocker.patch("superset.charts.schemas.ChartDataQueryContextSchema")
+    command = mocker.patch(
+        "superset.commands.chart.data.get_data_command.ChartDataCommand"
+    )
+    command().run.return_value = {
+        "queries": [{"result_format": "csv", "data": "a,b\n1,2\n"}],
+    }
+    get_chart_csv_data = mocker.patch(
+        "superset.commands.report.execute.get_chart_csv_data"
+    )
+
+    class_instance = BaseReportState(
+        mock_report_schedule, "January 1, 2021", "execution_id_example"
+    )
+
+    assert class_instance._get_csv_data() == b"a,b\n1,2\n"
+    schema().load.assert_called_with(
+        {
+            "queries": [{}],
+            "result_format": "csv",
+            "result_type": "post_processed",
+            "force": False,
+        }
+    )
+    get_chart_csv_data.assert_not_called()
@@ -15,15 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from flask import current_app
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.query_context_processor import QueryContextProcessor
 from superset.utils.core import GenericDataType
+from tests.conftest import with_config
 
 
 @pytest.fixture
@@ -240,3 +244,131 @@ def test_get_data_xlsx_apply_column_types_error(
     mock_query_context.result_format = ChartDataResultFormat.XLSX
     with pytest.raises(ValueError, match="Conversion error"):
         processor.get_data(df, coltypes)
+
+
+@with_config({"CHART_DATA_QUERY_WORKERS": 2, "STATS_LOGGER": MagicMock()})
+@patch(
+    "superset.common.query_context_processor.get_since_until_from_query_object",
+    return_value=(datetime(2021, 1, 1), datetime(2021, 2, 1)),
+)
+@patch("superset.common.query_context_processor.QueryCacheManager.get")
+def test_processing_time_offsets_only_queries_missing_offsets(
+    mock_cache_get, mock_get_since_until, processor, mock_query_context
+):
+    mock_query_context.force = False
+    mock_cache_get.side_effect = lambda key, region, force: MagicMock(
+        is_loaded=key == "key-1 week ago",
+        df=pd.DataFrame({"sum__num__1 week ago": [2]}),
+        query="cached sql",
+    )
+    df = pd.DataFrame({"__timestamp": pd.to_datetime(["2021-01-01"]), "sum__num": [1]})
+    query_object = SimpleNamespace(
+        datasource=None,
+        time_offsets=["1 year ago", "1 week ago", "2 years ago"],
+        metrics=["sum__num"],
+        columns=[],
+        extras={},
+        filter=[],
+        granularity="ds",
+        row_limit=None,
+        row_offset=None,
+        to_dict=lambda: {},
+    )
+
+    with (
+        patch.object(
+            processor,
+            "query_cache_key",
+            side_effect=lambda qo, time_offset, time_grain: f"key-{time_offset}",
+        ),
+        patch.object(
+            processor,
+            "query_time_offset",
+            side_effect=lambda offset_query, metric_names, join_keys: (
+                pd.DataFrame({"sum__num": [3]}),
+                f"sql {offset_query['original_offset']}",
+            ),
+        ) as mock_query_time_offset,
+        patch.object(
+            processor,
+            "join_offset_dfs",
+            side_effect=lambda df, offset_dfs, time_grain, join_keys: df,
+        ) as mock_join_offset_dfs,
+    ):
+        result = processor.processing_time_offsets(df, query_object)
+
+    assert sorted(
+        call.args[0]["cache_key"] for call in mock_query_time_offset.call_args_list
+    ) == ["key-1 year ago", "key-2 years ago"]
+    assert result["queries"] == ["sql 1 year ago", "cached sql", "sql 2 years ago"]
+    assert result["cache_keys"] == [None, "key-1 week ago", None]
+    assert list(mock_join_offset_dfs.call_args.args[1]) == [
+        "1 year ago",
+        "1 week ago",
+        "2 years ago",
+    ]
+
+    # each offset is timed separately
+    stats_logger = current_app.config["STATS_LOGGER"]
+    assert sorted(
+        call.args[0]
+        for call in stats_logger.timing.call_args_list
+        if call.args[0].startswith("chart_data.time_offset.query.")
+    ) == [
+        "chart_data.time_offset.query.1_year_ago",
+        "chart_data.time_offset.query.2_years_ago",
+    ]
+
+
+@with_config({"CHART_DATA_RAW_CACHE": True})
+@patch(
+    "superset.common.query_context_processor.security_manager.get_rls_cache_key",
+    return_value=[],
+)
+@patch("superset.common.query_context_processor.QueryCacheManager.set")
+@patch("superset.common.query_context_processor.QueryCacheManager.get")
+def test_query_datasource_raw_cache(
+    mock_cache_get,
+    mock_cache_set,
+    mock_get_rls_cache_key,
+    processor,
+    mock_query_context,
+):
+    datasource = mock_query_context.datasource
+    datasource.uid = "1__table"
+    datasource.changed_on = None
+    datasource.get_query_str.return_value = "SELECT a FROM t"
+    datasource.get_extra_cache_keys.return_value = []
+    datasource.query.return_value = MagicMock(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT a FROM t",
+        status="success",
+    )
+    mock_query_context.force = False
+
+    # miss: the query runs, and its raw results are cached
+    mock_cache_get.return_value = MagicMock(is_loaded=False)
+    processor.query_datasource({"post_processing": [{"operation": "pivot"}]})
+    datasource.query.assert_called_once()
+    raw_cache_key = mock_cache_set.call_args.kwargs["key"]
+    assert mock_cache_get.call_args.kwargs["key"] == raw_cache_key
+
+    # hit: the raw results are reused by a query with other post-processing
+    cached_df = pd.DataFrame({"a": [2]})
+    mock_cache_get.return_value = MagicMock(
+        is_loaded=True,
+        df=cached_df,
+        query="SELECT a FROM t",
+        applied_template_filters=[],
+        applied_filter_columns=[],
+        rejected_filter_columns=[],
+    )
+    result = processor.query_datasource({"post_processing": []})
+    datasource.query.assert_called_once()
+    assert mock_cache_get.call_args.kwargs["key"] == raw_cache_key
+    assert result.df is cached_df
+    assert result.query == "SELECT a FROM t"
+
+
+def test_raw_query_cache_key_disabled(processor):
+    assert processor.raw_query_cache_key({}) is None
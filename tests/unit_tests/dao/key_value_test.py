@@ -393,3 +393,70 @@ def test_delete_entry_missing(
     from superset.daos.key_value import KeyValueDAO
 
     assert KeyValueDAO.delete_entry(resource=RESOURCE, key=12345678) is False
+
+
+def test_get_values(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    missing_key = UUID("f1b9c0a7-5a3e-4cbb-9d3a-0d0b6f0b8c11")
+    assert KeyValueDAO.get_values(
+        resource=RESOURCE,
+        keys=[missing_key, UUID_KEY],
+        codec=JSON_CODEC,
+    ) == [None, JSON_VALUE]
+    assert KeyValueDAO.has_entry(resource=RESOURCE, key=UUID_KEY) is True
+    assert KeyValueDAO.has_entry(resource=RESOURCE, key=missing_key) is False
+
+
+def test_upsert_entries(
+    app_context: AppContext,
+    key_value_entry: KeyValueEntry,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    new_key = UUID("f1b9c0a7-5a3e-4cbb-9d3a-0d0b6f0b8c11")
+    KeyValueDAO.upsert_entries(
+        resource=RESOURCE,
+        values={UUID_KEY: NEW_VALUE, new_key: JSON_VALUE},
+        codec=JSON_CODEC,
+    )
+    db.session.flush()
+    assert KeyValueDAO.get_values(
+        resource=RESOURCE,
+        keys=[UUID_KEY, new_key],
+        codec=JSON_CODEC,
+    ) == [NEW_VALUE, JSON_VALUE]
+
+    missing_key = UUID("0c4fd5f6-2a9b-4d8e-9b0e-6a4f3c7d2e15")
+    assert sorted(
+        KeyValueDAO.delete_entries(
+            resource=RESOURCE,
+            keys=[UUID_KEY, new_key, missing_key],
+        )
+    ) == sorted([UUID_KEY, new_key])
+    assert KeyValueDAO.get_entry(resource=RESOURCE, key=UUID_KEY) is None
+
+
+def test_delete_expired_entries(
+    app_context: AppContext,
+    after_each: None,  # noqa: F811
+) -> None:
+    from superset.daos.key_value import KeyValueDAO
+
+    for days in (-3, -2, -1, 1):
+        KeyValueDAO.create_entry(
+            resource=RESOURCE,
+            value=JSON_VALUE,
+            codec=JSON_CODEC,
+            expires_on=datetime.now() + timedelta(days=days),
+        )
+    db.session.flush()
+
+    assert KeyValueDAO.delete_expired_entries(resource=RESOURCE, limit=2) == 2
+    assert KeyValueDAO.delete_expired_entries(resource=RESOURCE, limit=2) == 1
+    assert KeyValueDAO.delete_expired_entries(resource=RESOURCE, limit=2) == 0
@@ -2431,3 +2431,24 @@ def test_schemas_with_oauth2(
             }
         ]
     }
+
+
+def test_invalidate_partition_cache(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the `invalidate_partition_cache` endpoint.
+    """
+    database = mocker.MagicMock(id=1)
+    mocker.patch("superset.databases.api.DatabaseDAO.find_by_id", return_value=database)
+    partition_cache = mocker.patch("superset.databases.api.partition_cache")
+
+    response = client.delete("/api/v1/database/1/partition_cache/")
+    assert response.status_code == 200
+    partition_cache.invalidate.assert_called_with(1, None)
+
+    response = client.delete("/api/v1/database/1/partition_cache/?name=t&schema=s")
+    assert response.status_code == 200
+    partition_cache.invalidate.assert_called_with(1, Table("t", "s"))
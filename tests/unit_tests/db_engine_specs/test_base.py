@@ -539,3 +539,71 @@ def test_use_equality_for_boolean_filters_property() -> None:
 
     # Default should be False (use IS operators)
     assert BaseEngineSpec.use_equality_for_boolean_filters is False
+
+
+def test_fetch_data_or_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that Arrow is only used when the engine spec supports it.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        supports_arrow_fetch = True
+
+        @classmethod
+        def fetch_data_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table:
+            return cursor.fetch_arrow()
+
+    cursor = mocker.MagicMock()
+    cursor.fetchall.return_value = [(1,), (2,)]
+    cursor.description = [("a", "INTEGER")]
+    cursor.fetch_arrow.return_value = pa.table({"a": [1, 2]})
+
+    assert BaseEngineSpec.fetch_data_or_arrow(cursor) == [(1,), (2,)]
+    cursor.fetch_arrow.assert_not_called()
+
+    assert ArrowEngineSpec.fetch_data_or_arrow(cursor).to_pydict() == {"a": [1, 2]}
+    assert ArrowEngineSpec.fetch_data_or_arrow(cursor, 1).to_pydict() == {"a": [1]}
+
+    # column type mutators can only be applied to rows
+    class MutatingArrowEngineSpec(ArrowEngineSpec):
+        column_type_mutators = {types.Integer: lambda value: value * 10}
+
+    cursor.fetch_arrow.reset_mock()
+    assert MutatingArrowEngineSpec.fetch_data_or_arrow(cursor) == [(10,), (20,)]
+    cursor.fetch_arrow.assert_not_called()
+
+    class MissingArrowEngineSpec(BaseEngineSpec):
+        supports_arrow_fetch = True
+
+    with pytest.raises(
+        NotImplementedError,
+        match="MissingArrowEngineSpec sets `supports_arrow_fetch`",
+    ):
+        MissingArrowEngineSpec.fetch_data_arrow(cursor)
+
+
+def test_fetch_data_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in chunks, up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(1,), (2,), (3,), (4,), (5,)]
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER")]
+
+    def fetchmany(size: int) -> list[tuple[int]]:
+        chunk = rows[: min(size, 2)]
+        del rows[: len(chunk)]
+        return chunk
+
+    cursor.fetchmany.side_effect = fetchmany
+
+    assert list(BaseEngineSpec.fetch_data_chunks(cursor, 2, limit=3)) == [
+        [(1,), (2,)],
+        [(3,)],
+    ]
+    assert list(BaseEngineSpec.fetch_data_chunks(cursor, 2)) == [[(4,), (5,)]]
@@ -124,3 +124,27 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"  # noqa: S105
+
+
+def test_fetch_data_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow, reading only the batches needed.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    table = pa.table({"a": [1, 2, 3, 4, 5]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = table
+    cursor.fetch_record_batch.return_value = pa.RecordBatchReader.from_batches(
+        table.schema,
+        table.to_batches(max_chunksize=2),
+    )
+
+    assert DuckDBEngineSpec.fetch_data_or_arrow(cursor) == table
+    cursor.fetch_record_batch.assert_not_called()
+
+    result = DuckDBEngineSpec.fetch_data_or_arrow(cursor, 3)
+    cursor.fetch_record_batch.assert_called_with(3)
+    assert result.to_pydict() == {"a": [1, 2, 3]}
@@ -280,3 +280,32 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_copy_from_stdin(mocker: MockerFixture) -> None:
+    """
+    Test that rows are copied as CSV, keeping empty strings and ``\\N`` apart from
+    ``NULL``.
+    """
+    from sqlalchemy.dialects import postgresql
+
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    conn = mocker.MagicMock()
+    conn.dialect = postgresql.dialect()
+    cursor = conn.connection.cursor().__enter__()
+    cursor.rowcount = 3
+    pd_table = mocker.MagicMock(schema="public")
+    pd_table.name = "my table"
+
+    rowcount = copy_from_stdin(
+        pd_table,
+        conn,
+        ["a", "b"],
+        [(1, None), (2, ""), (3, 'say "\\N"')],
+    )
+
+    assert rowcount == 3
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == 'COPY public."my table" (a, b) FROM STDIN WITH (FORMAT csv)'
+    assert buffer.getvalue() == '"1",\n"2",""\n"3","say ""\\N"""\n'
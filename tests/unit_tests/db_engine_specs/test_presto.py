@@ -28,6 +28,7 @@ from sqlalchemy.engine.url import make_url
 
 from superset.sql.parse import Table
 from superset.utils.core import GenericDataType
+from tests.conftest import with_config
 from tests.unit_tests.db_engine_specs.utils import (
     assert_column_spec,
     assert_convert_dttm,
@@ -342,3 +343,37 @@ SELECT * \nFROM my_catalog.my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+@with_config(
+    {
+        "PRESTO_POLL_INTERVAL": 0,
+        "SQLLAB_QUERY_PROGRESS_INTERVAL": 60,
+        "SQLLAB_QUERY_STOP_SIGNAL": True,
+    }
+)
+def test_handle_cursor_stop_signal(mocker: MockerFixture) -> None:
+    """
+    Test that the stop signal is read from the cache, and that progress updates are
+    coalesced.
+    """
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+
+    db = mocker.patch("superset.sqllab.query_progress.db")
+    cache = mocker.patch("superset.sqllab.query_progress.cache_manager").cache
+    cache.get.side_effect = [None, None, True]
+    mocker.patch.object(PrestoEngineSpec, "get_tracking_url", return_value=None)
+    query = mocker.MagicMock(id=1, progress=0)
+    cursor = mocker.MagicMock()
+    cursor.poll.return_value = {
+        "stats": {"state": "RUNNING", "completedSplits": 1, "totalSplits": 4}
+    }
+
+    PrestoEngineSpec.handle_cursor(cursor, query)
+
+    cursor.cancel.assert_called_once()
+    cache.get.assert_called_with("sqllab_query_stopped_1")
+    assert query.progress == 25
+    # the query table isn't read, and progress is only written at the end
+    db.session.query.assert_not_called()
+    db.session.commit.assert_called_once()
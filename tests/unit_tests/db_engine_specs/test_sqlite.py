@@ -15,10 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=invalid-name, unused-argument, import-outside-toplevel, redefined-outer-name
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
+import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import inspect
 from sqlalchemy.engine import create_engine
 
 from superset.constants import TimeGrain
@@ -129,3 +133,66 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"  # noqa: S608
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_df_chunks_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that chunks are appended to the table created by the first one.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("sqlite://")
+    get_engine = mocker.patch.object(SqliteEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+
+    dfs = [
+        pd.DataFrame({"a": [1, 2], "b": ["x", ""]}),
+        pd.DataFrame({"a": [3], "b": [None]}),
+    ]
+    SqliteEngineSpec.df_chunks_to_sql(
+        mocker.MagicMock(),
+        Table("t"),
+        iter(dfs),
+        {"if_exists": "fail", "index": False},
+    )
+
+    rows = engine.execute("SELECT a, b FROM t ORDER BY a").fetchall()
+    assert [tuple(row) for row in rows] == [(1, "x"), (2, ""), (3, None)]
+
+
+def test_df_chunks_to_sql_failure(mocker: MockerFixture) -> None:
+    """
+    Test that a table created by a failed upload is dropped, and that an existing
+    table is kept.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("sqlite://")
+    get_engine = mocker.patch.object(SqliteEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        yield pd.DataFrame({"a": [1, 2]})
+        raise ValueError("Parsing error")
+
+    with pytest.raises(ValueError, match="Parsing error"):
+        SqliteEngineSpec.df_chunks_to_sql(
+            mocker.MagicMock(),
+            Table("t"),
+            chunks(),
+            {"if_exists": "fail", "index": False},
+        )
+    assert not inspect(engine).has_table("t")
+
+    engine.execute("CREATE TABLE t (a INTEGER)")
+    with pytest.raises(ValueError, match="Parsing error"):
+        SqliteEngineSpec.df_chunks_to_sql(
+            mocker.MagicMock(),
+            Table("t"),
+            chunks(),
+            {"if_exists": "append", "index": False},
+        )
+    assert inspect(engine).has_table("t")
+    assert engine.execute("SELECT COUNT(*) FROM t").scalar() == 0
@@ -24,7 +24,7 @@ import pytest
 from flask import current_app
 from flask_appbuilder.security.sqla.models import Role
 from freezegun import freeze_time
-from jinja2 import DebugUndefined
+from jinja2 import DebugUndefined, pass_context
 from jinja2.sandbox import SandboxedEnvironment
 from pytest_mock import MockerFixture
 from sqlalchemy.dialects import mysql
@@ -507,6 +507,47 @@ def test_where_in() -> None:
     assert where_in(["O'Malley's"]) == "('O''Malley''s')"
 
 
+def test_template_processor_shared_environment(mocker: MockerFixture) -> None:
+    """
+    Test that processors share the compiled templates, while rendering them with
+    their own context, filters and globals.
+    """
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+    other = Database(id=2, database_name="other", sqlalchemy_uri="mysql://")
+    get_user_id = mocker.patch("superset.jinja_context.get_user_id")
+
+    sql = "SELECT {{ current_user_id() }} WHERE a IN {{ ['x'] | where_in }}"
+    get_user_id.return_value = 1
+    processor = get_template_processor(database=database)
+    assert processor.process_template(sql) == "SELECT 1 WHERE a IN ('x')"
+    processor.env.globals["my_table"] = lambda: "t"
+    processor.env.filters["my_filter"] = lambda value: value
+
+    get_user_id.return_value = 2
+    other_processor = get_template_processor(database=database)
+    assert other_processor.env is not processor.env
+    assert other_processor.env.compiled is processor.env.compiled
+    assert (
+        sql,
+        frozenset(other_processor.env.filters.items()),
+    ) in other_processor.env.compiled
+    assert other_processor.process_template(sql) == "SELECT 2 WHERE a IN ('x')"
+    assert "my_table" not in other_processor.env.globals
+    assert "my_filter" not in other_processor.env.filters
+
+    # code compiled with other filters is not reused
+    processor.env.filters["where_in"] = pass_context(
+        lambda context, value: "(" + ", ".join(value) + ")"
+    )
+    assert processor.process_template("{{ ['x'] | where_in }}") == "(x)"
+    assert other_processor.process_template("{{ ['x'] | where_in }}") == "('x')"
+
+    assert (
+        get_template_processor(database=other).env.compiled
+        is not processor.env.compiled
+    )
+
+
 def test_where_in_empty_list() -> None:
     """
     Test the ``where_in`` Jinja2 filter when it receives an
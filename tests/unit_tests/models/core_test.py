@@ -39,6 +39,7 @@ from superset.exceptions import OAuth2Error, OAuth2RedirectError
 from superset.models.core import Database
 from superset.sql.parse import LimitMethod, Table
 from superset.utils import json
+from superset.utils.engine_registry import EngineRegistry
 from tests.unit_tests.conftest import with_feature_flags
 
 # sample config for OAuth2 tests
@@ -435,6 +436,65 @@ def test_get_sqla_engine(mocker: MockerFixture) -> None:
     )
 
 
+def test_get_sqla_engine_pooled(mocker: MockerFixture) -> None:
+    """
+    Test that pooled engines are reused by `_get_sqla_engine`.
+    """
+    from superset.models.core import Database
+
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    mocker.patch("superset.models.core.engine_registry", EngineRegistry())
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(
+        id=1,
+        database_name="my_db",
+        sqlalchemy_uri="trino://",
+        extra=json.dumps({"pool_connections": True}),
+    )
+    assert database.pool_connections
+
+    engine = database._get_sqla_engine(pooled=True)
+    assert database._get_sqla_engine(pooled=True) is engine
+    assert database._get_sqla_engine(schema="other", pooled=True) is engine
+    assert create_engine.call_count == 2
+    assert "poolclass" not in create_engine.call_args.kwargs
+
+
+def test_get_sqla_engine_pooled_not_serializable(mocker: MockerFixture) -> None:
+    """
+    Test that engines with arguments that can't be serialized are not pooled.
+    """
+    from superset.models.core import Database
+
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    registry = mocker.patch("superset.models.core.engine_registry")
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(
+        id=1,
+        database_name="my_db",
+        sqlalchemy_uri="trino://",
+        extra=json.dumps(
+            {
+                "pool_connections": True,
+                "engine_params": {"connect_args": {"ssl_context": "placeholder"}},
+            }
+        ),
+    )
+
+    def mutator(url, params, *args):  # type: ignore
+        params["connect_args"]["ssl_context"] = object()
+        return url, params
+
+    mocker.patch.dict(current_app.config, {"DB_CONNECTION_MUTATOR": mutator})
+    database._get_sqla_engine(pooled=True)
+    database._get_sqla_engine(pooled=True)
+
+    assert create_engine.call_count == 2
+    registry.get_engine.assert_not_called()
+
+
 def test_get_sqla_engine_user_impersonation(mocker: MockerFixture) -> None:
     """
     Test user impersonation in `_get_sqla_engine`.
@@ -1052,3 +1112,44 @@ def test_apply_limit_to_sql(
 
     limited = db.apply_limit_to_sql(sql, limit, force)
     assert limited == expected
+
+
+def test_iter_df(mocker: MockerFixture) -> None:
+    """
+    Test that `iter_df` yields the results in chunks.
+    """
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    get_raw_connection = mocker.patch.object(database, "get_raw_connection")
+    cursor = get_raw_connection().__enter__().cursor()
+    cursor.description = [("a", "INTEGER", None, None, None, None, True)]
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    dfs = list(database.iter_df("SELECT a FROM t", chunk_size=2))
+
+    assert [df["a"].tolist() for df in dfs] == [[1, 2], [3]]
+    cursor.fetchmany.assert_called_with(2)
+
+
+def test_iter_df_no_rows(mocker: MockerFixture) -> None:
+    """
+    Test that `iter_df` yields an empty dataframe with the columns when there are no
+    rows, and one without columns when the statement returns no result set.
+    """
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    get_raw_connection = mocker.patch.object(database, "get_raw_connection")
+    cursor = get_raw_connection().__enter__().cursor()
+    cursor.description = [("a", "INTEGER", None, None, None, None, True)]
+    cursor.fetchmany.return_value = []
+
+    dfs = list(database.iter_df("SELECT a FROM t WHERE 1 = 0"))
+    assert len(dfs) == 1
+    assert dfs[0].empty
+    assert list(dfs[0].columns) == ["a"]
+
+    cursor.description = None
+    cursor.fetchmany.side_effect = Exception("no results to fetch")
+
+    dfs = list(database.iter_df("DELETE FROM t"))
+    assert len(dfs) == 1
+    assert dfs[0].empty
+    assert list(dfs[0].columns) == []
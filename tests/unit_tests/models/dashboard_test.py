@@ -0,0 +1,176 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from datetime import datetime
+from typing import Any
+
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.utils.core import override_user
+from tests.conftest import with_config
+
+
+def add_dashboard(session: Session) -> Any:
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    engine = session.get_bind()
+    Dashboard.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    datasets = [SqlaTable(table_name=f"table_{i}", database=database) for i in range(2)]
+    session.add_all(datasets)
+    session.commit()
+
+    slices = [
+        Slice(
+            slice_name=f"chart_{i}",
+            datasource_type="table",
+            datasource_id=datasets[i % 2].id,
+        )
+        for i in range(3)
+    ]
+    dashboard = Dashboard(dashboard_title="my_dashboard", slices=slices)
+    session.add(dashboard)
+    session.commit()
+    return dashboard
+
+
+def test_datasets_trimmed_for_slices(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the datasets of a dashboard are trimmed for the charts using them.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+
+    dashboard = add_dashboard(session)
+    mocker.patch.object(
+        SqlaTable,
+        "data_for_slices",
+        autospec=True,
+        side_effect=lambda self, slices: {
+            "table_name": self.table_name,
+            "slices": sorted(slc.slice_name for slc in slices),
+        },
+    )
+
+    assert dashboard.datasets_trimmed_for_slices() == [
+        {"table_name": "table_0", "slices": ["chart_0", "chart_2"]},
+        {"table_name": "table_1", "slices": ["chart_1"]},
+    ]
+
+
+@with_config({"DASHBOARD_DATASETS_CACHE_TIMEOUT": 60})
+def test_datasets_trimmed_for_slices_cached(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that the trimmed datasets are cached until a dataset changes.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.extensions import cache_manager, security_manager
+
+    dashboard = add_dashboard(session)
+    data_for_slices = mocker.patch.object(
+        SqlaTable,
+        "data_for_slices",
+        autospec=True,
+        side_effect=lambda self, slices: {"table_name": self.table_name},
+    )
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+    mocker.patch.object(
+        security_manager,
+        "get_user_roles",
+        return_value=[mocker.MagicMock(id=1)],
+    )
+
+    with override_user(mocker.MagicMock()):
+        expected = [{"table_name": "table_0"}, {"table_name": "table_1"}]
+        assert dashboard.datasets_trimmed_for_slices() == expected
+        assert dashboard.datasets_trimmed_for_slices() == expected
+        assert data_for_slices.call_count == 2
+
+        dataset = session.query(SqlaTable).filter_by(table_name="table_1").one()
+        dataset.changed_on = datetime(2024, 1, 1)
+        session.commit()
+        assert dashboard.datasets_trimmed_for_slices() == expected
+        assert data_for_slices.call_count == 4
+
+
+@with_config({"DASHBOARD_DATASETS_CACHE_TIMEOUT": 60})
+def test_datasets_trimmed_for_slices_cached_columns(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that the trimmed datasets are not reused when columns or metrics change.
+    """
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.extensions import cache_manager, security_manager
+
+    dashboard = add_dashboard(session)
+    data_for_slices = mocker.patch.object(
+        SqlaTable,
+        "data_for_slices",
+        autospec=True,
+        side_effect=lambda self, slices: {"table_name": self.table_name},
+    )
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+    mocker.patch.object(
+        security_manager,
+        "get_user_roles",
+        return_value=[mocker.MagicMock(id=1)],
+    )
+    dataset = session.query(SqlaTable).filter_by(table_name="table_1").one()
+
+    def assert_recomputed(recomputed: bool) -> None:
+        call_count = data_for_slices.call_count
+        dashboard.datasets_trimmed_for_slices()
+        assert data_for_slices.call_count == call_count + (2 if recomputed else 0)
+
+    with override_user(mocker.MagicMock()):
+        assert_recomputed(True)
+        assert_recomputed(False)
+
+        # the columns and metrics are changed directly, without touching the dataset
+        column = TableColumn(column_name="a", table_id=dataset.id)
+        session.add_all(
+            [
+                TableColumn(column_name="b", table_id=dataset.id),
+                SqlMetric(
+                    metric_name="count", expression="COUNT(*)", table_id=dataset.id
+                ),
+                column,
+            ]
+        )
+        session.commit()
+        assert_recomputed(True)
+        assert_recomputed(False)
+
+        column.changed_on = datetime(2030, 1, 1)
+        session.commit()
+        assert_recomputed(True)
+
+        # the deleted column is not the latest modified one
+        session.query(TableColumn).filter_by(column_name="b").delete()
+        session.commit()
+        assert_recomputed(True)
+        assert_recomputed(False)
@@ -21,6 +21,8 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -164,3 +166,89 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_rows_with_mixed_types() -> None:
+    """
+    Test that columns that can't be converted to Arrow are stringified, while the
+    remaining columns keep their types.
+    """
+    data = [
+        (1, {"a": 1}, [1, 2], "foo"),
+        (2, {"b": 2}, [3, 4], 3),
+    ]
+    description = [("id",), ("map",), ("arr",), ("mixed",)]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert [col["type"] for col in result_set.columns] == [
+        "INT",
+        "STRING",
+        "STRING",
+        "STRING",
+    ]
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1, "{'a': 1}", "[1, 2]", "foo"],
+        [2, "{'b': 2}", "[3, 4]", "3"],
+    ]
+
+
+def test_rows_column_count_mismatch() -> None:
+    """
+    Test that rows not matching the cursor description are rejected.
+    """
+    with pytest.raises(ValueError, match="Expected 1 columns, got 2"):
+        SupersetResultSet(
+            [(1, 2)],
+            [("a",)],  # type: ignore
+            BaseEngineSpec,
+        )
+
+
+def test_arrow_table_data() -> None:
+    """
+    Test that Arrow data returned by the driver is used as is, except for nested
+    columns which are stringified.
+    """
+    table = pa.table(
+        {
+            "a": pa.array([1, 2], type=pa.int32()),
+            "b": ["x", "y"],
+            "c": [[1, 2], [3]],
+        }
+    )
+    description = [("a", "int"), ("b", "varchar"), ("b", "varchar")]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column_names == ["a", "b", "b__1"]
+    assert result_set.pa_table.column(0).type == pa.int32()
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1, "x", "[1, 2]"],
+        [2, "y", "[3]"],
+    ]
+    assert [col["type"] for col in result_set.columns] == [
+        "INT",
+        "VARCHAR",
+        "VARCHAR",
+    ]
+
+
+def test_arrow_table_data_without_description() -> None:
+    """
+    Test that column names are taken from the Arrow schema if the cursor has no
+    description.
+    """
+    table = pa.table({"a": [1], "b": [2.5]})
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert [col["type"] for col in result_set.columns] == ["INT", "FLOAT"]
+    assert result_set.size == 1
+
+
+def test_arrow_table_empty() -> None:
+    """
+    Test that an empty Arrow table produces an empty result set.
+    """
+    table = pa.table({"a": pa.array([], type=pa.int64())})
+    result_set = SupersetResultSet(table, [("a", "int")], BaseEngineSpec)  # type: ignore
+
+    assert result_set.columns == []
@@ -18,10 +18,12 @@
 # pylint: disable=invalid-name, unused-argument, redefined-outer-name
 
 import json  # noqa: TID251
+from collections import namedtuple
 
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
@@ -36,6 +38,8 @@ from superset.sql.parse import Table
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils.core import DatasourceName, override_user
 
+RLSFilter = namedtuple("RLSFilter", ["id", "group_key", "clause"])  # noqa: PYI024
+
 
 def test_security_manager(app_context: None) -> None:
     """
@@ -1169,3 +1173,257 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_memoized(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that RLS filters are only queried once per request, until they change.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[mocker.MagicMock(id=1)])
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[RLSFilter(2, None, "a = 1"), RLSFilter(1, None, "b = 1")],
+    )
+    table = mocker.MagicMock(id=42)
+
+    with override_user(mocker.MagicMock()):
+        assert sm.get_rls_filters(table) == [
+            RLSFilter(2, None, "a = 1"),
+            RLSFilter(1, None, "b = 1"),
+        ]
+        # the memoized list must not be sorted in place
+        assert [f.id for f in sm.get_rls_sorted(table)] == [1, 2]
+        assert sm.get_rls_filters(table) == [
+            RLSFilter(2, None, "a = 1"),
+            RLSFilter(1, None, "b = 1"),
+        ]
+        query_rls_filters.assert_called_once()
+
+        sm.rls_filter_after_change(mocker.MagicMock(), mocker.MagicMock(), table)
+        sm.get_rls_filters(table)
+        assert query_rls_filters.call_count == 2
+
+
+def test_get_rls_filters_shared_cache(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that RLS filters can be shared across requests, and are invalidated.
+    """
+    from flask import current_app, g
+    from flask_caching.backends import SimpleCache
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.dict(current_app.config, {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    mocker.patch.object(sm, "_get_security_cache", return_value=SimpleCache())
+    mocker.patch.object(sm, "get_user_roles", return_value=[mocker.MagicMock(id=1)])
+    query_rls_filters = mocker.patch.object(
+        sm,
+        "_query_rls_filters",
+        return_value=[RLSFilter(1, None, "a = 1")],
+    )
+    table = mocker.MagicMock(id=42)
+
+    with override_user(mocker.MagicMock()):
+        sm.get_rls_filters(table)
+        # simulate a new request
+        g.pop("rls_filters")
+        assert sm.get_rls_filters(table) == [RLSFilter(1, None, "a = 1")]
+        query_rls_filters.assert_called_once()
+
+        sm.rls_filter_after_change(mocker.MagicMock(), mocker.MagicMock(), table)
+        sm.get_rls_filters(table)
+        assert query_rls_filters.call_count == 2
+
+
+def test_get_permission_index_memoized(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the permission index is compiled once per request, and invalidated.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    compile_permission_index = mocker.patch.object(
+        sm,
+        "_compile_permission_index",
+        return_value={"database_access": frozenset({"[my_db].(id:1)"})},
+    )
+
+    assert sm.get_permission_index([1, 2]) == {
+        "database_access": frozenset({"[my_db].(id:1)"})
+    }
+    assert sm.get_permission_index([2, 1]) == {
+        "database_access": frozenset({"[my_db].(id:1)"})
+    }
+    compile_permission_index.assert_called_once_with(frozenset({1, 2}))
+    assert sm.get_permission_index([]) == {}
+
+    sm.invalidate_permission_index()
+    sm.get_permission_index([1, 2])
+    assert compile_permission_index.call_count == 2
+
+
+def test_get_permission_index_shared_cache(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the permission index can be shared across requests, and is invalidated.
+    """
+    from flask import current_app, g
+    from flask_caching.backends import SimpleCache
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.dict(current_app.config, {"PERMISSION_INDEX_CACHE_TIMEOUT": 60})
+    mocker.patch.object(
+        SupersetSecurityManager,
+        "_get_security_cache",
+        return_value=SimpleCache(),
+    )
+    compile_permission_index = mocker.patch.object(
+        sm,
+        "_compile_permission_index",
+        return_value={"datasource_access": frozenset({"[db].[table](id:1)"})},
+    )
+
+    sm.get_permission_index([1])
+    # simulate a new request
+    g.pop("permission_index")
+    assert sm.get_permission_index([1]) == {
+        "datasource_access": frozenset({"[db].[table](id:1)"})
+    }
+    compile_permission_index.assert_called_once()
+
+    sm.invalidate_permission_index()
+    sm.get_permission_index([1])
+    assert compile_permission_index.call_count == 2
+
+
+def test_invalidate_permission_index_once_per_commit(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that changes to roles and permissions invalidate the shared permission
+    indexes once they are committed, instead of once per changed row.
+    """
+    from flask import current_app, g
+    from flask_appbuilder.security.sqla.models import Permission
+    from flask_caching.backends import SimpleCache
+
+    Role.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    mocker.patch.dict(current_app.config, {"PERMISSION_INDEX_CACHE_TIMEOUT": 60})
+    cache = SimpleCache()
+    mocker.patch.object(
+        SupersetSecurityManager,
+        "_get_security_cache",
+        return_value=cache,
+    )
+    cache_set = mocker.spy(cache, "set")
+
+    g.permission_index = {}
+    session.add_all([Role(name=f"role_{i}") for i in range(5)])
+    session.add_all([Permission(name=f"permission_{i}") for i in range(5)])
+    session.flush()
+    # the indexes of the request are invalidated right away
+    assert "permission_index" not in g
+    cache_set.assert_not_called()
+
+    session.commit()
+    cache_set.assert_called_once()
+    assert cache_set.call_args.args[0] == "permission_index_version"
+
+    session.add(Role(name="role_rolled_back"))
+    session.flush()
+    session.rollback()
+    session.commit()
+    cache_set.assert_called_once()
+
+
+def test_defer_permission_index_invalidation(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that invalidations are deferred to the end of a block, and done once.
+    """
+    from flask import current_app
+    from flask_caching.backends import SimpleCache
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.dict(current_app.config, {"PERMISSION_INDEX_CACHE_TIMEOUT": 60})
+    cache = SimpleCache()
+    mocker.patch.object(
+        SupersetSecurityManager,
+        "_get_security_cache",
+        return_value=cache,
+    )
+    cache_set = mocker.spy(cache, "set")
+
+    with sm.defer_permission_index_invalidation():
+        with sm.defer_permission_index_invalidation():
+            sm.invalidate_permission_index()
+        sm.invalidate_permission_index()
+        cache_set.assert_not_called()
+    cache_set.assert_called_once()
+
+    with sm.defer_permission_index_invalidation():
+        pass
+    cache_set.assert_called_once()
+
+
+def test_has_view_access_uses_permission_index(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that view access and view menu names are read from the permission index.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    role = mocker.MagicMock(id=1)
+    role.name = "Custom"
+    mocker.patch.object(sm, "get_user_roles", return_value=[role])
+    mocker.patch.object(
+        sm,
+        "_compile_permission_index",
+        return_value={"database_access": frozenset({"[my_db].(id:1)"})},
+    )
+    mocker.patch(
+        "superset.security.manager.get_user_id",
+        return_value=1,
+    )
+    user = mocker.MagicMock(is_anonymous=False)
+
+    assert sm._has_view_access(user, "database_access", "[my_db].(id:1)")
+    assert not sm._has_view_access(user, "database_access", "[other].(id:2)")
+    assert not sm._has_view_access(user, "schema_access", "[my_db].[public]")
+
+    with override_user(user):
+        assert sm.user_view_menu_names("database_access") == {"[my_db].(id:1)"}
+        assert sm.user_view_menu_names("datasource_access") == set()
+
+
+def test_get_user_datasources_all_database_access(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that users with `all_database_access` get all the datasources.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch("superset.security.manager.get_dataset_access_filters")
+    mocker.patch.object(SupersetSecurityManager, "get_session")
+    mocker.patch.object(sm, "can_access_all_datasources", return_value=False)
+    mocker.patch.object(sm, "can_access_all_databases", return_value=True)
+    get_accessible_databases = mocker.patch.object(sm, "get_accessible_databases")
+    dataset = mocker.MagicMock()
+    mocker.patch.object(SqlaTable, "get_all_datasources", return_value=[dataset])
+
+    assert sm.get_user_datasources() == [dataset]
+    get_accessible_databases.assert_not_called()
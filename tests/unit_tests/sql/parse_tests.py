@@ -30,6 +30,8 @@ from superset.sql.parse import (
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    parse_cache,
+    ParseCache,
     remove_quotes,
     RLSMethod,
     sanitize_clause,
@@ -2701,6 +2703,9 @@ def test_extract_tables_from_jinja_sql_invalid_function(mocker: MockerFixture) -
         database=database,
     ) == {Table("t")}
 
+    # the function is only added to the environment of the processor
+    assert "my_table" not in JinjaTemplateProcessor(database).env.globals
+
 
 @pytest.mark.parametrize(
     "sql, engine, expected",
@@ -2825,3 +2830,38 @@ def test_has_subquery(sql: str, engine: str, expected: bool) -> None:
     Test the `has_subquery` method.
     """
     assert SQLStatement(sql, engine).has_subquery() == expected
+
+
+def test_parse_cache() -> None:
+    """
+    Test that parsed scripts are cached, and that the cached ASTs are not modified.
+    """
+    parse_cache.cache_clear()
+
+    statement = SQLScript("SELECT * FROM t", "postgresql").statements[0]
+    statement.set_limit_value(10)
+    assert parse_cache.cache_info().misses == 1
+
+    script = SQLScript("SELECT * FROM t", "postgresql")
+    assert script.format() == "SELECT\n  *\nFROM t"
+    assert parse_cache.cache_info().hits == 1
+
+    # engines are cached by dialect
+    SQLScript("SELECT * FROM t", "cockroachdb")
+    SQLScript("SELECT * FROM t", "mysql")
+    assert parse_cache.cache_info()[:2] == (2, 2)
+
+
+def test_parse_cache_lru() -> None:
+    """
+    Test that the least recently used scripts are evicted.
+    """
+    cache = ParseCache(maxsize=2)
+    cache.set(("SELECT 1", None), [parse_one("SELECT 1")])
+    cache.set(("SELECT 2", None), [parse_one("SELECT 2")])
+    assert cache.get(("SELECT 1", None)) == [parse_one("SELECT 1")]
+    cache.set(("SELECT 3", None), [parse_one("SELECT 3")])
+
+    assert cache.get(("SELECT 2", None)) is None
+    assert cache.get(("SELECT 1", None)) is not None
+    assert cache.cache_info() == (2, 1, 2, 2)
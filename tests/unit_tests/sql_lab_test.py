@@ -51,7 +51,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
-    db_engine_spec.fetch_data.return_value = [(42,)]
+    db_engine_spec.fetch_data_or_arrow.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
     SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
@@ -189,6 +189,75 @@ def test_execute_sql_statement_within_payload_limit(mocker: MockerFixture, app)
         )
 
 
+@with_config(
+    {
+        "SQLLAB_PAYLOAD_MAX_MB": None,
+        "DISALLOWED_SQL_FUNCTIONS": {},
+        "SQLLAB_CTAS_NO_LIMIT": False,
+        "SQL_MAX_ROW": 100000,
+        "QUERY_LOGGER": None,
+        "TROUBLESHOOTING_LINK": None,
+        "STATS_LOGGER": MagicMock(),
+        "RESULTS_BACKEND_BATCH_ROWS": 2,
+    }
+)
+def test_execute_sql_statements_results_batches(mocker: MockerFixture, app) -> None:
+    """
+    Test that results stored in batches keep the column metadata, and that the batch
+    sizes are not returned with the results.
+    """
+    from flask_caching.backends import SimpleCache
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    query = mocker.MagicMock()
+    query.limit = 3
+    query.database.cache_timeout = 100
+    query.select_as_cta = False
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch("superset.sql_lab.db.session.refresh", return_value=None)
+    mocker.patch("superset.sql_lab.execute_query").return_value = SupersetResultSet(
+        [(1,), (2,), (3,)],
+        [("a", "INTEGER", None, None, None, None, True)],
+        BaseEngineSpec,
+    )
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.expand_data.side_effect = lambda columns, data: (
+        columns,
+        data,
+        [],
+    )
+    mocker.patch("superset.sql_lab.results_backend", SimpleCache())
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    serialized_payloads = []
+    mocker.patch(
+        "superset.sql_lab._serialize_payload",
+        side_effect=lambda payload, use_msgpack: (
+            serialized_payloads.append(dict(payload)) or "serialized_payload"
+        ),
+    )
+
+    payload = execute_sql_statements(
+        query_id=1,
+        rendered_query="SELECT a FROM t",
+        return_results=True,
+        store_results=True,
+        start_time=None,
+        expand_data=True,
+        log_params={},
+    )
+
+    assert serialized_payloads[0]["data"] is None
+    assert serialized_payloads[0]["batches"] == [2, 1]
+    assert [
+        column["name"] for column in serialized_payloads[0]["selected_columns"]
+    ] == ["a"]
+    assert "batches" not in payload
+    assert payload["data"] == [{"a": 1}, {"a": 2}, {"a": 3}]
+    db_engine_spec.expand_data.assert_called_once()
+
+
 @freeze_time("2021-04-01T00:00:00Z")
 def test_get_sql_results_oauth2(mocker: MockerFixture, app) -> None:
     """
@@ -301,3 +370,45 @@ def test_get_predicates_for_table(mocker: MockerFixture) -> None:
 
     table = Table("t1", "public", "examples")
     assert get_predicates_for_table(table, database, "examples") == ["c1 = 1"]
+
+
+def test_results_batches(mocker: MockerFixture) -> None:
+    """
+    Test that results stored in batches are read one page at a time.
+    """
+    import pyarrow as pa
+    from flask_caching.backends import SimpleCache
+
+    from superset.sqllab.utils import (
+        read_results_batches,
+        split_results_batches,
+        write_ipc_buffer,
+        write_results_batches,
+    )
+
+    results_backend = SimpleCache()
+    table = pa.table({"a": list(range(10))})
+    tables = split_results_batches(table, 4)
+    assert [batch.num_rows for batch in tables] == [4, 4, 2]
+    write_results_batches(
+        results_backend,
+        "key",
+        [write_ipc_buffer(batch).to_pybytes() for batch in tables],
+        60,
+    )
+    get = mocker.spy(results_backend, "get")
+
+    page = read_results_batches(results_backend, "key", [4, 4, 2], offset=3, limit=2)
+    assert page.to_pydict() == {"a": [3, 4]}
+    assert [call.args[0] for call in get.call_args_list] == [
+        "key:batch:0",
+        "key:batch:1",
+    ]
+
+    assert read_results_batches(results_backend, "key", [4, 4, 2]) == table
+    page = read_results_batches(results_backend, "key", [4, 4, 2], offset=20)
+    assert page.num_rows == 0
+    assert page.schema == table.schema
+
+    results_backend.delete("key:batch:2")
+    assert read_results_batches(results_backend, "key", [4, 4, 2], offset=8) is None
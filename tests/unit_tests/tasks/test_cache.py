@@ -0,0 +1,62 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from pytest_mock import MockerFixture
+
+from superset.tasks.cache import warm_up_charts
+from tests.conftest import with_config
+
+
+@with_config({"CACHE_WARMUP_WORKERS": 1, "CACHE_WARMUP_WORKERS_PER_DATABASE": 1})
+def test_warm_up_charts(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that charts are warmed up in process, skipping queries already warmed up.
+    """
+    mocker.patch("superset.tasks.cache.security_manager")
+    db = mocker.patch("superset.tasks.cache.db")
+    db.session.query().get.side_effect = lambda chart_id: (
+        mocker.MagicMock(id=chart_id) if chart_id != 4 else None
+    )
+    mocker.patch(
+        "superset.tasks.cache.get_query_cache_keys",
+        side_effect=[{"a", "b"}, {"a"}, {"a", "c"}, {"c"}],
+    )
+    command = mocker.patch(
+        "superset.commands.chart.warm_up_cache.ChartWarmUpCacheCommand"
+    )
+    command().run.side_effect = [
+        {"viz_error": None},
+        {"viz_error": "error"},
+        {"viz_error": None},
+    ]
+
+    results = warm_up_charts(
+        [
+            {"payload": {"chart_id": 1}, "username": "admin"},
+            {"payload": {"chart_id": 2, "dashboard_id": 1}, "username": "admin"},
+            {"payload": {"chart_id": 3}, "username": "admin"},
+            {"payload": {"chart_id": 4}, "username": "admin"},
+            # the warm up of chart 3 failed, so its queries are warmed up again
+            {"payload": {"chart_id": 5}, "username": "admin"},
+        ]
+    )
+
+    assert results == {
+        "success": ['{"chart_id": 1}', '{"chart_id": 5}'],
+        "skipped": ['{"chart_id": 2, "dashboard_id": 1}'],
+        "errors": ['{"chart_id": 3}', '{"chart_id": 4}'],
+    }
@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from superset.utils.cache_codecs import (
+    ArrowIPCCacheCodec,
+    DataFrameCacheCodecError,
+    decode_cache_value,
+    encode_cache_value,
+)
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_arrow_ipc_roundtrip(compression: Optional[str]) -> None:
+    """
+    Test that DataFrames survive a roundtrip through the Arrow IPC codec.
+    """
+    codec = ArrowIPCCacheCodec(compression=compression)  # type: ignore
+    df = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "name": ["a", None, "c"],
+            "value": [1.5, 2.0, None],
+            "count": [1, 2, 3],
+        }
+    )
+
+    value = encode_cache_value({"df": df, "query": "SELECT 1"}, codec)
+    assert isinstance(value["df"], bytes)
+    assert value["df_codec"] == "arrow_ipc:2"
+    assert value["query"] == "SELECT 1"
+
+    pd.testing.assert_frame_equal(decode_cache_value(value, codec), df)
+
+
+def test_encode_cache_value_fallback() -> None:
+    """
+    Test that DataFrames the codec can't handle are stored as is.
+    """
+    codec = ArrowIPCCacheCodec()
+
+    df = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    assert encode_cache_value({"df": df}, codec)["df"] is df
+
+    df = pd.DataFrame({"a": [1, "b"]})
+    assert encode_cache_value({"df": df}, codec)["df"] is df
+
+    df = pd.DataFrame({"a": [1]})
+    assert encode_cache_value({"df": df}, None)["df"] is df
+
+
+def test_decode_cache_value_mismatch() -> None:
+    """
+    Test that entries written by other codecs are rejected, and legacy ones loaded.
+    """
+    codec = ArrowIPCCacheCodec()
+    df = pd.DataFrame({"a": [1]})
+
+    assert decode_cache_value({"df": df}, codec) is df
+
+    with pytest.raises(DataFrameCacheCodecError):
+        decode_cache_value({"df": b"", "df_codec": "arrow_ipc:1"}, codec)
+
+    with pytest.raises(DataFrameCacheCodecError):
+        decode_cache_value({"df": b"", "df_codec": "arrow_ipc:2"}, None)
+
+
+def test_arrow_ipc_roundtrip_object_columns() -> None:
+    """
+    Test that object columns with nulls survive a roundtrip with the same dtypes.
+    """
+    codec = ArrowIPCCacheCodec()
+    df = pd.DataFrame(
+        {
+            "name": pd.Series(["a", None, "c"], dtype=object),
+            "flag": pd.Series([True, None, False], dtype=object),
+            "day": pd.Series(
+                [datetime.date(2024, 1, 1), None, datetime.date(2024, 1, 3)],
+                dtype=object,
+            ),
+            "amount": pd.Series([Decimal("1.5"), None, Decimal("2.5")], dtype=object),
+            "empty": pd.Series([None, None, None], dtype=object),
+            "nullable": pd.Series([1, None, 3], dtype="Int64"),
+        }
+    )
+
+    value = encode_cache_value({"df": df}, codec)
+    assert isinstance(value["df"], bytes)
+
+    decoded = decode_cache_value(value, codec)
+    pd.testing.assert_frame_equal(decoded, df)
+    assert decoded["flag"].tolist() == [True, None, False]
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, None, 3], dtype=object),
+        pd.Series([1.5, None, "a"], dtype=object),
+        pd.Series([True, False, True], dtype=object),
+        pd.Series([datetime.datetime(2024, 1, 1), None], dtype=object),
+        pd.Series([[1, 2], None], dtype=object),
+    ],
+)
+def test_encode_cache_value_lossy_object_columns(series: pd.Series) -> None:
+    """
+    Test that object columns that wouldn't survive a roundtrip are stored as is.
+    """
+    codec = ArrowIPCCacheCodec()
+    df = pd.DataFrame({"a": series})
+
+    assert encode_cache_value({"df": df}, codec)["df"] is df
+
+
+def test_decode_cache_value_corrupt() -> None:
+    """
+    Test that corrupt entries raise a codec error.
+    """
+    codec = ArrowIPCCacheCodec()
+    value = encode_cache_value({"df": pd.DataFrame({"a": [1, 2, 3]})}, codec)
+
+    with pytest.raises(DataFrameCacheCodecError):
+        decode_cache_value({**value, "df": value["df"][:-20]}, codec)
+
+    with pytest.raises(DataFrameCacheCodecError):
+        decode_cache_value({**value, "df": b"garbage"}, codec)
@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from flask import g, request
+from flask_appbuilder.security.sqla.models import Role, User
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import object_session, scoped_session, sessionmaker
+
+from superset.app import SupersetApp
+from superset.utils.concurrency import concurrency_limit, map_concurrently
+
+
+def test_map_concurrently(app_context: None) -> None:
+    """
+    Test that results are returned in order, with the Flask context propagated.
+    """
+    g.user = "admin"
+    thread_ids = set()
+
+    def func(item: int) -> tuple[int, str]:
+        time.sleep(0.01 * (5 - item))
+        thread_ids.add(threading.get_ident())
+        return item, g.user
+
+    assert map_concurrently(func, range(5), max_workers=3) == [
+        (i, "admin") for i in range(5)
+    ]
+    assert threading.get_ident() not in thread_ids
+
+
+def test_map_concurrently_serial(app_context: None) -> None:
+    """
+    Test that a single worker runs everything in the current thread.
+    """
+    thread_ids = set()
+
+    def func(item: int) -> int:
+        thread_ids.add(threading.get_ident())
+        return item * 2
+
+    assert map_concurrently(func, [1, 2, 3], max_workers=1) == [2, 4, 6]
+    assert thread_ids == {threading.get_ident()}
+
+
+def test_map_concurrently_request_context(app: SupersetApp) -> None:
+    """
+    Test that the request context is propagated to the workers.
+    """
+    with app.test_request_context("/chart/data?foo=bar"):
+        assert map_concurrently(
+            lambda _: request.args["foo"],
+            range(2),
+            max_workers=2,
+        ) == ["bar", "bar"]
+
+
+def test_map_concurrently_lazy_relationship(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    app_context: None,
+) -> None:
+    """
+    Test that lazy relationships of the user are loaded in the session of the worker.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'superset.db'}")
+    User.metadata.create_all(engine)  # pylint: disable=no-member
+    session = scoped_session(sessionmaker(bind=engine))
+    mocker.patch("superset.db.session", session)
+
+    session.add(
+        User(
+            first_name="admin",
+            last_name="admin",
+            username="admin",
+            email="admin@example.com",
+            roles=[Role(name="Admin")],
+        )
+    )
+    session.commit()
+    g.user = session.query(User).one()
+    request_session = session()
+
+    def func(_: int) -> list[str]:
+        assert session() is not request_session
+        assert object_session(g.user) is session()
+        return [role.name for role in g.user.roles]
+
+    assert map_concurrently(func, range(2), max_workers=2) == [["Admin"], ["Admin"]]
+    # the relationship was loaded on the copies of the user
+    assert "roles" not in g.user.__dict__
+
+
+def test_map_concurrently_cancel(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that pending calls are cancelled when a call fails.
+    """
+    executor = mocker.patch(
+        "superset.utils.concurrency.ThreadPoolExecutor"
+    ).return_value
+    executor.map.side_effect = TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        map_concurrently(lambda item: item, range(5), max_workers=3)
+
+    executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+
+def test_concurrency_limit() -> None:
+    """
+    Test that the number of concurrent threads is capped per key.
+    """
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def func() -> None:
+        nonlocal running, max_running
+        with concurrency_limit(("database", "test_concurrency_limit"), 2):
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=func) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_running == 2
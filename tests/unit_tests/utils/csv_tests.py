@@ -95,3 +95,32 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_mixed_types():
+    df = pd.DataFrame(
+        data=[["=a", "=b", 1], [1, None, "-1"], [b"=c", "@d|e", 2.5]],
+        columns=["mixed", "mixed", "=other"],
+        index=[10, 5, 10],
+    )
+
+    assert csv.df_to_escaped_csv(df, index=False) == (
+        "mixed,mixed,'=other\n'=a,'=b,1\n1,,-1\nb'=c','@d\\\\|e,2.5\n"
+    )
+
+
+def test_df_to_escaped_csv_stream():
+    df = pd.DataFrame(data={"value": ["a", "=func()", "b", "-10", "=c"]})
+
+    chunks = list(
+        csv.df_to_escaped_csv_stream(df, 2, encoding="utf-8-sig", index=False)
+    )
+
+    assert len(chunks) == 3
+    assert chunks[0] == "value\na\n'=func()\n".encode("utf-8-sig")
+    assert b"".join(chunks) == csv.df_to_escaped_csv(df, index=False).encode(
+        "utf-8-sig"
+    )
+
+    empty = pd.DataFrame(columns=["value"])
+    assert list(csv.df_to_escaped_csv_stream(empty, 2, index=False)) == [b"value\n"]
@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+from pytest_mock import MockerFixture
+
+from superset.utils.engine_registry import EngineRegistry
+
+
+def test_engine_registry(mocker: MockerFixture) -> None:
+    """
+    Test that engines are reused per key, and disposed of when evicted.
+    """
+    mocker.patch("superset.utils.engine_registry.stats_logger_manager")
+    registry = EngineRegistry()
+    create_engine = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+
+    engine = registry.get_engine((1, None, None, "alice", "hash"), create_engine, 0)
+    assert (
+        registry.get_engine((1, None, None, "alice", "hash"), create_engine, 0)
+        is engine
+    )
+    other = registry.get_engine((1, None, None, "bob", "hash"), create_engine, 0)
+    assert other is not engine
+    assert create_engine.call_count == 2
+
+    registry.evict(2)
+    engine.dispose.assert_not_called()
+
+    registry.evict(1)
+    engine.dispose.assert_called_once()
+    other.dispose.assert_called_once()
+    assert registry.get_engine((1, None, None, "alice", "hash"), create_engine, 0)
+    assert create_engine.call_count == 3
+
+
+def test_engine_registry_idle_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that engines that haven't been used recently are disposed of.
+    """
+    mocker.patch("superset.utils.engine_registry.stats_logger_manager")
+    monotonic = mocker.patch("superset.utils.engine_registry.time.monotonic")
+    registry = EngineRegistry()
+    create_engine = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+
+    monotonic.return_value = 0
+    engine = registry.get_engine((1, None, None, None, "a"), create_engine, 60)
+    monotonic.return_value = 30
+    registry.get_engine((1, None, None, None, "b"), create_engine, 60)
+    engine.dispose.assert_not_called()
+
+    monotonic.return_value = 61
+    registry.get_engine((1, None, None, None, "b"), create_engine, 60)
+    engine.dispose.assert_called_once()
+    assert create_engine.call_count == 2
@@ -14,9 +14,17 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from datetime import datetime
 
+from flask import current_app
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import (
+    AsyncDBEventLogger,
+    get_logger_from_status,
+    get_request_form_data,
+)
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +43,60 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+@freeze_time("2024-01-01 12:00:00")
+def test_async_db_event_logger(mocker: MockerFixture) -> None:
+    """
+    Test that the async event logger queues the logs and writes them in batches.
+    """
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager")
+    event_logger = AsyncDBEventLogger(batch_size=2, max_queue_size=3)
+    mocker.patch.object(event_logger, "_start_flusher")
+    write = mocker.patch.object(event_logger, "_write")
+
+    event_logger.log(
+        1,
+        "test",
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=2,
+        referrer=None,
+        records=[{"a": 1}, {"b": 2}, {"dashboard_id": 3}, {"c": 4}],
+    )
+    stats_logger.instance.incr.assert_called_once_with("event_logger.dropped")
+    write.assert_not_called()
+
+    event_logger.flush()
+    assert [len(call.args[0]) for call in write.call_args_list] == [2, 1]
+    assert write.call_args_list[1].args[0] == [
+        {
+            "action": "test",
+            "json": '{"dashboard_id": 3}',
+            "dashboard_id": 3,
+            "slice_id": 2,
+            "duration_ms": 10,
+            "referrer": None,
+            "user_id": 1,
+            "dttm": datetime(2024, 1, 1, 12, 0, 0),
+        }
+    ]
+
+
+def test_get_request_form_data(mocker: MockerFixture) -> None:
+    """
+    Test that the form data is parsed only once for all the events of a request.
+    """
+    get_form_data = mocker.patch(
+        "superset.views.core.get_form_data",
+        return_value=({"slice_id": 1}, None),
+    )
+
+    with current_app.app_context(), current_app.test_request_context("/"):
+        assert get_request_form_data() == {"slice_id": 1}
+        assert get_request_form_data() == {"slice_id": 1}
+    get_form_data.assert_called_once_with()
+
+    with current_app.app_context(), current_app.test_request_context("/"):
+        assert get_request_form_data() == {"slice_id": 1}
+    assert get_form_data.call_count == 2
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_mock import MockerFixture
+
+from superset.sql.parse import Table
+from superset.utils.concurrency import copy_flask_context
+from superset.utils.partition_cache import PartitionCache
+from tests.conftest import with_config
+
+
+@with_config({"PARTITION_CACHE_TIMEOUT": 60})
+def test_partition_cache(mocker: MockerFixture) -> None:
+    """
+    Test that lookups are cached per table, and invalidated.
+    """
+    mocker.patch("superset.utils.partition_cache.stats_logger_manager")
+    mocker.patch("superset.utils.partition_cache.cache_manager")
+    cache = PartitionCache()
+    database = mocker.MagicMock(id=1)
+    load = mocker.MagicMock(side_effect=lambda: ["2024-01-01"])
+
+    table = Table("t", "s")
+    assert cache.get(database, table, ("indexes",), load) == ["2024-01-01"]
+    assert cache.get(database, table, ("indexes",), load) == ["2024-01-01"]
+    assert load.call_count == 1
+
+    cache.get(database, Table("other", "s"), ("indexes",), load)
+    cache.get(database, table, ("latest_partition", ("ds",)), load)
+    assert load.call_count == 3
+
+    cache.invalidate(1, table)
+    cache.get(database, table, ("indexes",), load)
+    cache.get(database, Table("other", "s"), ("indexes",), load)
+    assert load.call_count == 4
+
+    cache.invalidate(1)
+    cache.get(database, Table("other", "s"), ("indexes",), load)
+    assert load.call_count == 5
+
+
+@with_config({"PARTITION_CACHE_TIMEOUT": 60})
+def test_partition_cache_single_flight(mocker: MockerFixture) -> None:
+    """
+    Test that concurrent lookups of the same key run a single query.
+    """
+    mocker.patch("superset.utils.partition_cache.stats_logger_manager")
+    mocker.patch("superset.utils.partition_cache.cache_manager")
+    cache = PartitionCache()
+    database = mocker.MagicMock(id=1)
+    barrier = threading.Barrier(5, timeout=5)
+    release = threading.Event()
+    calls = []
+
+    def load() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "2024-01-01"
+
+    def lookup(_: int) -> str:
+        barrier.wait()
+        return cache.get(database, Table("t"), ("indexes",), load)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(copy_flask_context(lookup), i) for i in range(4)]
+        barrier.wait()
+        release.set()
+        assert [future.result() for future in futures] == ["2024-01-01"] * 4
+
+    assert len(calls) == 1
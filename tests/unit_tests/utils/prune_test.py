@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from datetime import datetime, timedelta
+
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+
+def test_table_pruner(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that matching rows are deleted in batches, and that the time budget is
+    respected.
+    """
+    from superset import db
+    from superset.models.core import Log
+    from superset.utils.prune import TablePruner
+
+    engine = db.session.get_bind()
+    Log.metadata.create_all(engine)  # pylint: disable=no-member
+
+    now = datetime.now()
+    db.session.add_all(
+        [Log(action="old", dttm=now - timedelta(days=10)) for _ in range(5)]
+        + [Log(action="new", dttm=now)]
+        + [Log(action="old", dttm=now - timedelta(days=10)) for _ in range(2)]
+    )
+    db.session.commit()
+    mocker.patch("superset.utils.prune.time.monotonic", side_effect=range(100))
+
+    # the first batch exhausts the time budget
+    result = TablePruner(
+        "prune_logs",
+        Log,
+        Log.dttm < now - timedelta(days=1),
+        batch_size=3,
+        time_budget=1,
+    ).run()
+    assert result.deleted == 3
+    assert result.completed is False
+
+    result = TablePruner(
+        "prune_logs",
+        Log,
+        Log.dttm < now - timedelta(days=1),
+        batch_size=3,
+    ).run()
+    assert result.deleted == 4
+    assert result.completed is True
+    assert [log.action for log in db.session.query(Log).all()] == ["new"]
@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from pytest_mock import MockerFixture
+
+from superset.utils.webdriver import WebDriverPool
+from tests.conftest import with_config
+
+
+@with_config(
+    {
+        "SCREENSHOT_WEBDRIVER_POOL_SIZE": 2,
+        "SCREENSHOT_WEBDRIVER_POOL_MAX_USES": 2,
+        "SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT": 300,
+        "SCREENSHOT_SELENIUM_RETRIES": 0,
+    }
+)
+def test_webdriver_pool(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that drivers are reused per key and recycled after too many uses.
+    """
+    mocker.patch("superset.utils.webdriver.stats_logger_manager")
+    destroy = mocker.patch("superset.utils.webdriver.WebDriverSelenium.destroy")
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+
+    driver = pool.acquire(("chrome", 1), create)
+    pool.release(driver)
+    assert pool.acquire(("chrome", 1), create) is driver
+    other = pool.acquire(("chrome", 2), create)
+    assert other is not driver
+    assert create.call_count == 2
+
+    # the driver has been used twice
+    pool.release(driver)
+    destroy.assert_called_once_with(driver, 0)
+    assert pool.acquire(("chrome", 1), create) is not driver
+    assert create.call_count == 3
+
+
+@with_config(
+    {
+        "SCREENSHOT_WEBDRIVER_POOL_SIZE": 2,
+        "SCREENSHOT_WEBDRIVER_POOL_MAX_USES": 20,
+        "SCREENSHOT_WEBDRIVER_POOL_IDLE_TIMEOUT": 300,
+        "SCREENSHOT_SELENIUM_RETRIES": 0,
+    }
+)
+def test_webdriver_pool_discard(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that drivers are destroyed after a failure or when idle for too long.
+    """
+    mocker.patch("superset.utils.webdriver.stats_logger_manager")
+    monotonic = mocker.patch("superset.utils.webdriver.time.monotonic")
+    destroy = mocker.patch("superset.utils.webdriver.WebDriverSelenium.destroy")
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+
+    monotonic.return_value = 0
+    driver = pool.acquire(("chrome", 1), create)
+    pool.release(driver, discard=True)
+    destroy.assert_called_once_with(driver, 0)
+
+    driver = pool.acquire(("chrome", 1), create)
+    pool.release(driver)
+    monotonic.return_value = 301
+    assert pool.acquire(("chrome", 1), create) is not driver
+    destroy.assert_called_with(driver, 0)
+    assert create.call_count == 3